@@ -0,0 +1,23 @@
+import importlib
+
+from core.service.translate_browser_daemon_service import TranslateBrowserDaemonService
+from core import configureLogging
+
+
+async def main(noDriverModuleObj):
+    translateBrowserDaemonObj = TranslateBrowserDaemonService(noDriverModuleObj)
+    await translateBrowserDaemonObj.serveForever()
+
+
+def runDaemon():
+    configureLogging()
+    try:
+        noDriverModuleObj = importlib.import_module("nodriver")
+    except ModuleNotFoundError:
+        print("nodriver is required. Install with: pip install nodriver")
+        return
+    noDriverModuleObj.loop().run_until_complete(main(noDriverModuleObj))
+
+
+if __name__ == "__main__":
+    runDaemon()
@@ -0,0 +1,97 @@
+from pathlib import Path
+import subprocess
+import sys
+import re
+
+from core.constant import (
+    IMPORT_TIME_REPORT_TOP_COUNT_INT,
+    IMPORT_TIME_SAMPLE_COUNT_INT,
+    IMPORT_TIME_BUDGET_MS_INT,
+    IMPORT_TIME_MODULE_LIST,
+)
+
+
+IMPORT_TIME_LINE_PATTERN_OBJ = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+
+def measureImportTimeDictList(moduleNameStr):
+    """Imports moduleNameStr in a fresh interpreter with -X importtime and returns one dict per imported module."""
+    projectRootPathStr = str(Path(__file__).resolve().parents[1])
+    completedProcessObj = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {moduleNameStr}"],
+        cwd=projectRootPathStr,
+        capture_output=True,
+        text=True,
+    )
+    if completedProcessObj.returncode != 0:
+        raise RuntimeError(f"Importing {moduleNameStr} failed:\n{completedProcessObj.stderr.strip()}")
+    importTimeDictList = []
+    for lineStr in completedProcessObj.stderr.splitlines():
+        matchObj = IMPORT_TIME_LINE_PATTERN_OBJ.match(lineStr)
+        if matchObj is None:
+            continue
+        importedModuleNameStr = matchObj.group(4)
+        depthInt = len(matchObj.group(3)) // 2
+        if depthInt == 0 and not isModuleChainBool(moduleNameStr, importedModuleNameStr):
+            importTimeDictList = []
+            continue
+        importTimeDictList.append(
+            {
+                "moduleNameStr": importedModuleNameStr,
+                "selfMsFloat": int(matchObj.group(1)) / 1000.0,
+                "cumulativeMsFloat": int(matchObj.group(2)) / 1000.0,
+                "depthInt": depthInt,
+            }
+        )
+    return importTimeDictList
+
+
+def isModuleChainBool(moduleNameStr, importedModuleNameStr):
+    return moduleNameStr == importedModuleNameStr or moduleNameStr.startswith(f"{importedModuleNameStr}.")
+
+
+def measureModuleImportMsFloat(moduleNameStr, sampleCountInt=IMPORT_TIME_SAMPLE_COUNT_INT):
+    """Returns the fastest cumulative import time over sampleCountInt runs and that run's per-module list."""
+    bestImportMsFloat = None
+    bestImportTimeDictList = []
+    for _ in range(max(1, sampleCountInt)):
+        importTimeDictList = measureImportTimeDictList(moduleNameStr)
+        moduleImportMsFloat = sum(
+            importTimeDict["cumulativeMsFloat"]
+            for importTimeDict in importTimeDictList
+            if importTimeDict["depthInt"] == 0
+        )
+        if bestImportMsFloat is None or moduleImportMsFloat < bestImportMsFloat:
+            bestImportMsFloat = moduleImportMsFloat
+            bestImportTimeDictList = importTimeDictList
+    return bestImportMsFloat, bestImportTimeDictList
+
+
+def formatImportReportStr(moduleNameStr, moduleImportMsFloat, importTimeDictList, budgetMsInt, topCountInt=IMPORT_TIME_REPORT_TOP_COUNT_INT):
+    statusStr = "ok" if moduleImportMsFloat <= budgetMsInt else "OVER BUDGET"
+    reportLineList = [f"{moduleNameStr}: {moduleImportMsFloat:.1f} ms (budget {budgetMsInt} ms) {statusStr}"]
+    heaviestDictList = sorted(
+        (importTimeDict for importTimeDict in importTimeDictList if importTimeDict["moduleNameStr"] != moduleNameStr),
+        key=lambda importTimeDict: importTimeDict["cumulativeMsFloat"],
+        reverse=True,
+    )[:topCountInt]
+    for importTimeDict in heaviestDictList:
+        reportLineList.append(
+            f"    {importTimeDict['cumulativeMsFloat']:8.1f} ms  {importTimeDict['moduleNameStr']}"
+        )
+    return "\n".join(reportLineList)
+
+
+def runImportBudget(moduleNameList=None, budgetMsInt=IMPORT_TIME_BUDGET_MS_INT):
+    """Prints an import-time report per module and returns 1 when any module exceeds the budget."""
+    exitCodeInt = 0
+    for moduleNameStr in moduleNameList or IMPORT_TIME_MODULE_LIST:
+        moduleImportMsFloat, importTimeDictList = measureModuleImportMsFloat(moduleNameStr)
+        print(formatImportReportStr(moduleNameStr, moduleImportMsFloat, importTimeDictList, budgetMsInt))
+        if moduleImportMsFloat > budgetMsInt:
+            exitCodeInt = 1
+    return exitCodeInt
+
+
+if __name__ == "__main__":
+    sys.exit(runImportBudget(sys.argv[1:]))
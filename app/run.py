@@ -1,25 +1,21 @@
 import importlib
+import itertools
 import sys
 import os
 
-from core.service.subtitle_remote_fetcher_service import SubtitleRemoteFetcherService
+from core.service.translation_job_checkpoint_service import TranslationJobCheckpointService
+from core.service.translate_browser_daemon_service import TranslateBrowserDaemonClient
 from core.service.subtitle_file_manager_service import SubtitleFileManagerService
 from core.service.subtitle_compliance_service import SubtitleComplianceService
-from core.wrapper.user_agent_wrapper import ChromeForTestingUserAgentWrapper
-from core.service.google_translate_service import GoogleTranslateService
+from core.service.adaptive_chunk_size_service import AdaptiveChunkSizeService
+from core.service.translation_memory_service import TranslationMemoryService
 from core import levelOneHelper, levelTwoHelper, sayHiHelper
-from core import CORE_LOGGER_NAME, logger
+from core import CORE_LOGGER_NAME, configureLogging, logger
 from core.constant import (
     DEFAULT_CHECK_FRAME_STR,
 )
 
 
-levelOneHelper()
-levelTwoHelper()
-sayHiHelper()
-logger.info(CORE_LOGGER_NAME)
-
-
 def formatProgressBar(processedCountInt, totalCountInt, barWidthInt=30):
     if totalCountInt <= 0:
         return "[{}] 0/0".format(" " * barWidthInt)
@@ -56,55 +52,163 @@ async def main(noDriverModuleObj):
                 )
 
     if not downloadedFilePathStr:
+        from core.service.subtitle_remote_fetcher_service import SubtitleRemoteFetcherService
+
         subtitleRemoteFetcherServiceObj = SubtitleRemoteFetcherService(
             inputFolderPathStr="subtitle",
             verboseBool=True,
         )
 
-        downloadedFilePathStr = subtitleRemoteFetcherServiceObj.downloadFirstAvailableSubtitle(
-            criteriaDict["imdbIdStr"],
-            seasonNumberInt=criteriaDict["seasonNumberInt"],
-            episodeNumberInt=criteriaDict["episodeNumberInt"],
-            indexInt=3,
-        )
+        try:
+            downloadedFilePathStr = await subtitleRemoteFetcherServiceObj.downloadBestSubtitleAsync(
+                criteriaDict["imdbIdStr"],
+                seasonNumberInt=criteriaDict["seasonNumberInt"],
+                episodeNumberInt=criteriaDict["episodeNumberInt"],
+                languageCodeStr=criteriaDict["languageCodeStr"],
+                formatTypeStr=criteriaDict["formatTypeStr"],
+            )
+        finally:
+            await subtitleRemoteFetcherServiceObj.aclose()
         print(f"Subtitle downloaded to {downloadedFilePathStr}")
 
     # ChromeForTestingUserAgentWrapper().generate()
 
     subtitleFileManagerObj = SubtitleFileManagerService(downloadedFilePathStr)
-        
-    chunkSubList = list(subtitleFileManagerObj.getChunkGenerator())
-    chunkSubStr = subtitleFileManagerObj.emptyStr.join(chunkSubList)
-    # subtitleFileManagerObj.write(chunkData)
-
-    only = None
+    subtitleFrameListObj = subtitleFileManagerObj.buildFrameList()
+
+    translateDaemonClientObj = TranslateBrowserDaemonClient()
+    if await translateDaemonClientObj.isAvailable():
+        print("Using running translate daemon")
+        translateAutomationObj = translateDaemonClientObj
+    else:
+        from core.service.google_translate_service import GoogleTranslateService
+
+        translateAutomationObj = GoogleTranslateService(noDriverModuleObj)
+    translationMemoryObj = TranslationMemoryService(*translateAutomationObj.getLanguagePairTuple())
+    cachedBodyDict = translationMemoryObj.getTranslatedTextDict(
+        subtitleFrameListObj.iterateBodyStr()
+    )
+    print(f"Translation memory hits: {len(cachedBodyDict)} distinct bodies")
+
+    translationJobCheckpointObj = TranslationJobCheckpointService(
+        downloadedFilePathStr,
+        *translateAutomationObj.getLanguagePairTuple(),
+    )
+    resumedBodyDict = translationJobCheckpointObj.load()
+    subtitleWireFormatObj = subtitleFileManagerObj.subtitleWireFormatObj
+    for bodyStr in subtitleFrameListObj.iterateBodyStr():
+        resumedBodyStr = resumedBodyDict.get(subtitleWireFormatObj.normalizeBodyStr(bodyStr))
+        if bodyStr not in cachedBodyDict and resumedBodyStr is not None:
+            cachedBodyDict[bodyStr] = resumedBodyStr
+    cachedFrameIndexSet = {
+        frameIndexInt
+        for frameIndexInt, bodyStr in enumerate(subtitleFrameListObj.iterateBodyStr())
+        if bodyStr in cachedBodyDict
+    }
+    print(f"Reused translations: {len(cachedFrameIndexSet)}/{len(subtitleFrameListObj)} frames")
 
+    subtitleFileManagerObj.buildDistinctBodyIndex(cachedFrameIndexSet, subtitleFrameListObj.iterateBodyStr())
+    print(
+        f"Deduplicated to {len(subtitleFileManagerObj.distinctBodyList)} distinct bodies, "
+        f"saved {subtitleFileManagerObj.dedupSavedCharCountInt} characters"
+    )
 
-    translateAutomationObj = GoogleTranslateService(noDriverModuleObj)
-    await translateAutomationObj.start()
-    subtitleFileManagerObj.readSrtByFilename()
-    totalChunkCountInt = len(chunkSubList[:only])
-    processedChunkList = []
+    only = None
 
-    for chunkIndexInt, chunkStr in enumerate(chunkSubList[:only]):
-        translatedChunkStr = await translateAutomationObj.translateChunk(DEFAULT_CHECK_FRAME_STR+chunkStr)
-        processedChunkList.append(translatedChunkStr)
-        progressBarStr = formatProgressBar(chunkIndexInt + 1, totalChunkCountInt)
+    adaptiveChunkSizeObj = AdaptiveChunkSizeService()
+    chunkSubIterable = itertools.islice(
+        subtitleFileManagerObj.getChunkGenerator(chunkSizeProviderObj=adaptiveChunkSizeObj.getChunkSizeInt),
+        only,
+    )
+    totalBodyCountInt = len(subtitleFileManagerObj.distinctBodyList)
+    if totalBodyCountInt:
+        await translateAutomationObj.start()
+    completedBodyCountList = [0]
+    translatedBodyByFrameKeyDict = {}
+    completedFrameKeySet = set()
+    frontierFrameIndexList = [0]
+    untranslatedFrameCountList = [0]
+    subtitleComplianceStreamObj = SubtitleComplianceService().openComplianceStream()
+    outputFileObj = subtitleFileManagerObj.openSubtitleTextStream(postFixStr="al")
+
+    def pushReadyFrames(flushAllBool=False):
+        while frontierFrameIndexList[0] < len(subtitleFrameListObj):
+            frameIndexInt = frontierFrameIndexList[0]
+            frameKeyInt = subtitleFileManagerObj.getFrameKeyInt(frameIndexInt)
+            isPendingBool = frameIndexInt not in cachedFrameIndexSet and frameKeyInt and frameKeyInt not in completedFrameKeySet
+            if isPendingBool and not flushAllBool:
+                break
+            subtitleFrameObj = subtitleFrameListObj[frameIndexInt]
+            bodyStr = subtitleFrameObj.bodyStr
+            if frameIndexInt in cachedFrameIndexSet:
+                translatedBodyStr = cachedBodyDict[bodyStr]
+            else:
+                translatedBodyStr = translatedBodyByFrameKeyDict.get(frameKeyInt)
+            if translatedBodyStr is None and bodyStr:
+                untranslatedFrameCountList[0] += 1
+                translatedBodyStr = bodyStr
+            outputFileObj.write(
+                subtitleComplianceStreamObj.pushFrame(
+                    subtitleFrameObj.indexInt,
+                    subtitleFrameObj.startMsInt,
+                    subtitleFrameObj.endMsInt,
+                    translatedBodyStr or "",
+                )
+            )
+            frontierFrameIndexList[0] += 1
+        outputFileObj.flush()
+
+    def onChunkComplete(chunkIndexInt, chunkStr, translatedFrameBodyDict, elapsedSecondFloat):
+        sourceFrameBodyDict = subtitleWireFormatObj.parseWireChunkDict(chunkStr)
+        sourceFrameBodyDict.pop(subtitleWireFormatObj.checkFrameKeyInt, None)
+        completedBodyCountList[0] += len(sourceFrameBodyDict)
+        adaptiveChunkSizeObj.recordChunkResult(
+            len(chunkStr),
+            elapsedSecondFloat,
+            translatedFrameBodyDict is not None and len(translatedFrameBodyDict) == len(sourceFrameBodyDict),
+        )
+        if translatedFrameBodyDict:
+            chunkTranslatedBodyDict = {}
+            for frameKeyInt, sourceBodyStr in sourceFrameBodyDict.items():
+                translatedBodyStr = translatedFrameBodyDict.get(frameKeyInt)
+                if translatedBodyStr is None:
+                    continue
+                translatedBodyByFrameKeyDict[frameKeyInt] = translatedBodyStr
+                chunkTranslatedBodyDict[sourceBodyStr] = translatedBodyStr
+            translationMemoryObj.putTranslatedTextDict(chunkTranslatedBodyDict)
+            translationJobCheckpointObj.recordChunk(chunkIndexInt, chunkTranslatedBodyDict)
+        else:
+            translationJobCheckpointObj.recordChunk(chunkIndexInt, None)
+        completedFrameKeySet.update(sourceFrameBodyDict)
+        pushReadyFrames()
+        progressBarStr = formatProgressBar(completedBodyCountList[0], totalBodyCountInt)
         sys.stdout.write(f"\rProcessed {progressBarStr}")
         sys.stdout.flush()
-    if totalChunkCountInt:
+
+    pushReadyFrames()
+    await translateAutomationObj.translateChunkList(
+        (DEFAULT_CHECK_FRAME_STR + chunkStr for chunkStr in chunkSubIterable),
+        onChunkCompleteObj=onChunkComplete,
+    )
+    if totalBodyCountInt:
         sys.stdout.write("\n")
         sys.stdout.flush()
-    processedChunkList = [chunkStr for chunkStr in processedChunkList if chunkStr is not None]
-    processedSubtitleTextStr = f"{subtitleFileManagerObj.newlineStr}{subtitleFileManagerObj.newlineStr}".join(processedChunkList)
-    processedSubtitleTextStr = processedSubtitleTextStr.replace(": ", ":")
-    subtitleComplianceServiceObj = SubtitleComplianceService()
-    processedSubtitleTextStr = subtitleComplianceServiceObj.applyComplianceToSrtText(processedSubtitleTextStr)
-    subtitleFileManagerObj.write(processedSubtitleTextStr, postFixStr="al")
+    translationMemoryObj.close()
+
+    pushReadyFrames(flushAllBool=True)
+    if untranslatedFrameCountList[0]:
+        print(f"Warning: {untranslatedFrameCountList[0]} frames kept their source text after failed translation")
+    subtitleFileManagerObj.closeSubtitleTextStream(outputFileObj)
+    translationJobCheckpointObj.complete()
     await translateAutomationObj.stop()
 
 
 def runMain():
+    configureLogging()
+    levelOneHelper()
+    levelTwoHelper()
+    sayHiHelper()
+    logger.info(CORE_LOGGER_NAME)
     try:
         noDriverModuleObj = importlib.import_module("nodriver")
     except ModuleNotFoundError:
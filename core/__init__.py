@@ -3,8 +3,6 @@ import logging
 from .constant import *
 from .helper import *
 
-logging.basicConfig(level=logging.INFO)
-
 # Silence noisy third-party loggers
 logging.getLogger("websockets").setLevel(logging.WARNING)
 logging.getLogger("websockets.client").setLevel(logging.WARNING)
@@ -13,5 +11,10 @@ logging.getLogger("nodriver.core.connection").setLevel(logging.WARNING)
 logging.getLogger("nodriver.core.browser").setLevel(logging.WARNING)
 
 logger = logging.getLogger(constant.CORE_LOGGER_NAME)
-logger.debug("Core module initialized.")
+
+
+def configureLogging(levelInt=logging.INFO):
+    """Installs the root log handler; called by entry points instead of at import time."""
+    logging.basicConfig(level=levelInt)
+    logger.debug("Core module initialized.")
 
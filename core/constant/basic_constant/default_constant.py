@@ -1,20 +1,78 @@
 CORE_LOGGER_NAME="StremioGoogleTranslateAddonLogger"
 
+SUBTITLE_PARSER_VALIDATION_FRAME_LIMIT_INT = 32
 DEFAULT_CHAR_LIMIT_INT = 4300
 DEFAULT_INPUT_FOLDER_PATH_STR = "input"
 DEFAULT_OUTPUT_FOLDER_PATH_STR = "output"
 DEFAULT_SAMPLE_INPUT_FILE_PATH_STR = "input/Black-Mirror-season-2/Black Mirror - 2x01 - Be Right Back.WEB-DL.FoV.en.srt"
 DEFAULT_TRANSLATE_URL_STR = "https://translate.google.com/?sl=en&tl=sq&op=translate"
-DEFAULT_CHECK_FRAME_STR = "0\n00:01:21,068 --> 00:01:23,103\n<i>If I</i>\n<i>was, you'd be naked.</i>\n\n"
+DEFAULT_CHECK_FRAME_STR = "#0\n<i>If I</i>\n<i>was, you'd be naked.</i>\n\n"
+DEFAULT_CHECK_PARITY_STR = "Nëse do të isha, do të ishe lakuriq."
+WIRE_FRAME_MARKER_TEMPLATE_STR = "#{}"
+WIRE_FRAME_MARKER_PATTERN_STR = r"(?m)^[ \t]*#[ \t]*(\d+)[ \t]*$"
+WIRE_BODY_MARKER_LINE_PATTERN_STR = r"(?m)^[ \t]*(\\*#[ \t]*\d+)[ \t]*$"
+WIRE_BODY_ESCAPED_MARKER_LINE_PATTERN_STR = r"(?m)^[ \t]*\\(\\*#[ \t]*\d+)[ \t]*$"
+WIRE_CHECK_FRAME_KEY_INT = 0
 SUBTITLE_SEARCH_ENDPOINT_STR = "https://sub.wyzie.ru/search"
 REMOTE_REQUEST_TIMEOUT_SECONDS_INT = 30
+REMOTE_SESSION_POOL_SIZE_INT = 10
+REMOTE_RETRY_LIMIT_INT = 3
+REMOTE_RETRY_BACKOFF_BASE_SECONDS_FLOAT = 0.5
+REMOTE_RETRY_BACKOFF_MAX_SECONDS_FLOAT = 8.0
+REMOTE_RETRYABLE_STATUS_CODE_LIST = [429, 500, 502, 503, 504]
+REMOTE_IDEMPOTENT_METHOD_LIST = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"]
+REMOTE_REQUEST_HISTORY_SIZE_INT = 1000
+REMOTE_FETCH_CONCURRENCY_LIMIT_INT = 16
+REMOTE_FETCH_PER_HOST_LIMIT_INT = REMOTE_SESSION_POOL_SIZE_INT
+SUBTITLE_DOWNLOAD_MAX_BYTE_COUNT_INT = 10 * 1024 * 1024
+SUBTITLE_DOWNLOAD_BLOCK_SIZE_INT = 64 * 1024
+SUBTITLE_ARCHIVE_MEMBER_SUFFIX_LIST = [".srt", ".vtt", ".ass", ".ssa", ".sub"]
+SUBTITLE_QUALITY_CANDIDATE_LIMIT_INT = 5
+SUBTITLE_QUALITY_MAX_CPS_INT = 20
+SUBTITLE_QUALITY_WEIGHT_DICT = {
+    "frameCount": 0.3,
+    "coverage": 0.3,
+    "cps": 0.25,
+    "hearingImpaired": 0.15,
+}
+SUBTITLE_SEARCH_CACHE_FOLDER_PATH_STR = "cache/subtitle-search"
+SUBTITLE_SEARCH_CACHE_TTL_SECONDS_INT = 6 * 3600
+SUBTITLE_SEARCH_CACHE_NEGATIVE_TTL_SECONDS_INT = 15 * 60
+SUBTITLE_SEARCH_CACHE_STALE_SECONDS_INT = 24 * 3600
+SUBTITLE_SEARCH_CACHE_MEMORY_ENTRY_LIMIT_INT = 1024
+SUBTITLE_SEARCH_CACHE_PRUNE_INTERVAL_SECONDS_INT = 3600
+REMOTE_REQUEST_LATENCY_BUCKET_SECONDS_LIST = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
 REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR = "en"
 REMOTE_SUBTITLE_FORMAT_DEFAULT_STR = "srt"
 SOURCE_TEXT_AREA_SELECTOR_STR = "textarea[aria-label='Source text']"
 TARGET_TEXT_CONTAINER_SELECTOR_STR = 'div[jsname="r5xl4"]'
 TARGET_TEXT_SELECTOR_STR = 'div[jsname="r5xl4"] span.ryNqvb'
 TRANSLATION_POLL_SECONDS_FLOAT = 0.2
-TRANSLATION_WAIT_TIMEOUT_SECONDS_INT = 1
+TRANSLATION_WAIT_TIMEOUT_SECONDS_INT = 5
+TRANSLATION_STABLE_POLL_COUNT_INT = 2
+TRANSLATION_INJECTION_CONFIRM_SECONDS_FLOAT = 3.0
+TRANSLATE_PAGE_POOL_SIZE_INT = 3
+TRANSLATE_PARALLEL_LIMIT_INT = 3
+TRANSLATION_RETRY_SUB_CHUNK_FRAME_COUNT_INT = 8
+TRANSLATION_RETRY_SUBMISSION_LIMIT_INT = 16
+TRANSLATION_RETRY_TIMEOUT_LIMIT_INT = 2
+TRANSLATE_DAEMON_HOST_STR = "127.0.0.1"
+TRANSLATE_DAEMON_PORT_INT = 47831
+TRANSLATE_DAEMON_STREAM_LIMIT_INT = 1 << 20
+TRANSLATE_DAEMON_CONNECT_TIMEOUT_SECONDS_FLOAT = 0.5
+TRANSLATE_DAEMON_KEEPALIVE_SECONDS_INT = 300
+ADAPTIVE_CHUNK_SIZE_STATE_PATH_STR = "cache/adaptive-chunk-size.json"
+ADAPTIVE_CHUNK_SIZE_MIN_INT = 800
+ADAPTIVE_CHUNK_SIZE_MAX_INT = 4900
+ADAPTIVE_CHUNK_SIZE_GROW_STEP_INT = 200
+ADAPTIVE_CHUNK_SIZE_SHRINK_FACTOR_FLOAT = 0.7
+ADAPTIVE_CHUNK_NEAR_FULL_RATIO_FLOAT = 0.7
+ADAPTIVE_CHUNK_LATENCY_SPIKE_FACTOR_FLOAT = 2.0
+ADAPTIVE_CHUNK_LATENCY_SMOOTHING_FLOAT = 0.3
+TRANSLATION_JOB_CHECKPOINT_FOLDER_PATH_STR = "cache/jobs"
+TRANSLATION_MEMORY_DATABASE_PATH_STR = "cache/translation-memory.sqlite3"
+TRANSLATION_MEMORY_MAX_ENTRY_COUNT_INT = 500000
+TRANSLATION_MEMORY_QUERY_BATCH_SIZE_INT = 500
 SUBTITLE_CHARACTER_PER_LINE_MIN_INT = 37
 SUBTITLE_CHARACTER_PER_LINE_MAX_INT = 42
 
@@ -27,6 +85,10 @@ CHROME_LATEST_PATCH_VERSIONS_URL_STR = (
 CHROME_BUILD_SAMPLE_COUNT_INT = 10
 CHROME_BUILD_SAMPLE_MAX_RANGE_INT = 100
 USER_AGENT_RANDOM_OUTPUT_PATH_STR = "random-user-agent-list.json"
+USER_AGENT_SCORE_PATH_STR = "cache/user-agent-score.json"
+CHROME_FOR_TESTING_HTTP_CACHE_PATH_STR = "cache/chrome-for-testing-http-cache.json"
+CHROME_USER_AGENT_GENERATE_TTL_SECONDS_INT = 24 * 3600
+USER_AGENT_SCORE_EXPIRY_SECONDS_INT = 7 * 24 * 3600
 
 
 # List of realistic user agents to rotate through
@@ -135,3 +197,12 @@ USER_AGENT_MACHINE_LIST = [
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/{} Safari/537.36"
     
 ]
+
+IMPORT_TIME_BUDGET_MS_INT = 150
+IMPORT_TIME_SAMPLE_COUNT_INT = 3
+IMPORT_TIME_REPORT_TOP_COUNT_INT = 10
+IMPORT_TIME_MODULE_LIST = [
+    "app.run",
+    "app.daemon",
+    "core.service.subtitle_compliance_service",
+]
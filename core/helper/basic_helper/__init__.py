@@ -3,7 +3,6 @@ import logging
 import core
 
 logger = logging.getLogger(core.constant.CORE_LOGGER_NAME)
-logging.basicConfig(level=logging.NOTSET)
 
 def sayHiHelper():
     logger.info("Hey From Helper")
@@ -0,0 +1,104 @@
+from typing import Iterable, Iterator, Optional, Tuple
+from array import array
+import re
+
+
+class SubtitleFrame:
+    """Lightweight view of one frame stored in a SubtitleFrameList."""
+
+    __slots__ = ("frameListObj", "positionInt")
+
+    def __init__(self, frameListObj, positionInt):
+        self.frameListObj = frameListObj
+        self.positionInt = positionInt
+
+    @property
+    def indexInt(self) -> int:
+        return self.frameListObj.indexArray[self.positionInt]
+
+    @property
+    def startMsInt(self) -> int:
+        return self.frameListObj.startMsArray[self.positionInt]
+
+    @property
+    def endMsInt(self) -> int:
+        return self.frameListObj.endMsArray[self.positionInt]
+
+    @property
+    def bodyStr(self) -> str:
+        return self.frameListObj.getBodyStr(self.positionInt)
+
+    def __repr__(self) -> str:
+        return f"SubtitleFrame({self.indexInt}, {self.startMsInt}, {self.endMsInt}, {self.bodyStr!r})"
+
+
+class SubtitleFrameList:
+    """Columnar store of parsed frames: int64 index and ms arrays plus body offsets into one text buffer."""
+
+    timecodePatternObj = re.compile(
+        r"^\s*(\d+):(\d{2}):(\d{2})[,.](\d{1,3})\s*-->\s*(\d+):(\d{2}):(\d{2})[,.](\d{1,3})"
+    )
+
+    def __init__(self):
+        self.indexArray = array("q")
+        self.startMsArray = array("q")
+        self.endMsArray = array("q")
+        self.textOffsetArray = array("q", [0])
+        self.textPartList = []
+        self.textBufferStr = ""
+
+    @classmethod
+    def fromFramePartTupleIterable(cls, framePartTupleIterable: Iterable[Tuple[str, str, str]]) -> "SubtitleFrameList":
+        """Builds a frame list from (indexStr, timecodeStr, bodyStr) tuples, skipping frames with an unreadable timecode."""
+        frameListObj = cls()
+        for indexStr, timecodeStr, bodyStr in framePartTupleIterable:
+            timecodeTuple = cls.parseTimecodeTuple(timecodeStr)
+            if timecodeTuple is None:
+                continue
+            frameListObj.append(int(indexStr) if indexStr.isdigit() else 0, *timecodeTuple, bodyStr)
+        return frameListObj
+
+    @classmethod
+    def parseTimecodeTuple(cls, timecodeStr: str) -> Optional[Tuple[int, int]]:
+        matchObj = cls.timecodePatternObj.match(timecodeStr or "")
+        if matchObj is None:
+            return None
+        valueList = [int(partStr) for partStr in matchObj.groups()]
+        startMsInt = ((valueList[0] * 60 + valueList[1]) * 60 + valueList[2]) * 1000 + valueList[3]
+        endMsInt = ((valueList[4] * 60 + valueList[5]) * 60 + valueList[6]) * 1000 + valueList[7]
+        return startMsInt, endMsInt
+
+    def append(self, indexInt: int, startMsInt: int, endMsInt: int, bodyStr: str) -> None:
+        self.indexArray.append(indexInt)
+        self.startMsArray.append(startMsInt)
+        self.endMsArray.append(endMsInt)
+        self.textPartList.append(bodyStr)
+        self.textOffsetArray.append(self.textOffsetArray[-1] + len(bodyStr))
+
+    def getTextBufferStr(self) -> str:
+        if len(self.textBufferStr) != self.textOffsetArray[-1]:
+            self.textBufferStr = "".join(self.textPartList)
+            self.textPartList = [self.textBufferStr]
+        return self.textBufferStr
+
+    def getBodyStr(self, positionInt: int) -> str:
+        return self.getTextBufferStr()[self.textOffsetArray[positionInt]:self.textOffsetArray[positionInt + 1]]
+
+    def iterateBodyStr(self) -> Iterator[str]:
+        textBufferStr = self.getTextBufferStr()
+        for positionInt in range(len(self)):
+            yield textBufferStr[self.textOffsetArray[positionInt]:self.textOffsetArray[positionInt + 1]]
+
+    def __len__(self) -> int:
+        return len(self.indexArray)
+
+    def __getitem__(self, positionInt: int) -> SubtitleFrame:
+        if positionInt < 0:
+            positionInt += len(self)
+        if not 0 <= positionInt < len(self):
+            raise IndexError("SubtitleFrameList index out of range")
+        return SubtitleFrame(self, positionInt)
+
+    def __iter__(self) -> Iterator[SubtitleFrame]:
+        for positionInt in range(len(self)):
+            yield SubtitleFrame(self, positionInt)
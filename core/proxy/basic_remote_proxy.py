@@ -1,25 +1,41 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+from urllib import parse
+import threading
 import logging
 import random
 import time
 
+from requests.adapters import HTTPAdapter
 import requests
 
+from core.service.request_metric_service import RequestMetricService
 from core.constant import (
-    REMOTE_REQUEST_TIMEOUT_SECONDS_INT,
-    REMOTE_SUBTITLE_FORMAT_DEFAULT_STR,
+    REMOTE_RETRY_BACKOFF_BASE_SECONDS_FLOAT,
+    REMOTE_RETRY_BACKOFF_MAX_SECONDS_FLOAT,
     REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR,
+    REMOTE_SUBTITLE_FORMAT_DEFAULT_STR,
+    REMOTE_REQUEST_TIMEOUT_SECONDS_INT,
+    REMOTE_RETRYABLE_STATUS_CODE_LIST,
+    REMOTE_IDEMPOTENT_METHOD_LIST,
+    REMOTE_SESSION_POOL_SIZE_INT,
+    REMOTE_RETRY_LIMIT_INT,
     USER_AGENT_LIST,
 )
 from core import logger
 
 
 class BasicRemoteProxy:
-    requestsHistoryList: List[Dict[str, Any]] = []
+    requestMetricObj = RequestMetricService()
+    sessionPoolDict: Dict[str, requests.Session] = {}
+    sessionPoolLockObj = threading.Lock()
     verboseBool: bool = False
     requestTimeoutSecondsInt: int = REMOTE_REQUEST_TIMEOUT_SECONDS_INT
     defaultSubtitleFormatStr: str = REMOTE_SUBTITLE_FORMAT_DEFAULT_STR
     defaultSubtitleLanguageStr: str = REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR
+    sessionPoolSizeInt: int = REMOTE_SESSION_POOL_SIZE_INT
+    retryLimitInt: int = REMOTE_RETRY_LIMIT_INT
+    retryBackoffBaseSecondsFloat: float = REMOTE_RETRY_BACKOFF_BASE_SECONDS_FLOAT
+    retryBackoffMaxSecondsFloat: float = REMOTE_RETRY_BACKOFF_MAX_SECONDS_FLOAT
 
     def __init__(
         self,
@@ -27,6 +43,9 @@ class BasicRemoteProxy:
         requestTimeoutSecondsInt: Optional[int] = None,
         defaultSubtitleFormatStr: Optional[str] = None,
         defaultSubtitleLanguageStr: Optional[str] = None,
+        sessionPoolSizeInt: Optional[int] = None,
+        retryLimitInt: Optional[int] = None,
+        retryBackoffBaseSecondsFloat: Optional[float] = None,
     ):
         if verboseBool is not None:
             self.verboseBool = verboseBool
@@ -36,6 +55,12 @@ class BasicRemoteProxy:
             self.defaultSubtitleFormatStr = defaultSubtitleFormatStr
         if defaultSubtitleLanguageStr is not None:
             self.defaultSubtitleLanguageStr = defaultSubtitleLanguageStr
+        if sessionPoolSizeInt is not None:
+            self.sessionPoolSizeInt = max(1, int(sessionPoolSizeInt))
+        if retryLimitInt is not None:
+            self.retryLimitInt = max(1, int(retryLimitInt))
+        if retryBackoffBaseSecondsFloat is not None:
+            self.retryBackoffBaseSecondsFloat = max(0.0, float(retryBackoffBaseSecondsFloat))
         
 
 
@@ -49,6 +74,55 @@ class BasicRemoteProxy:
             mergedHeadersDict.update(headersDict)
         return mergedHeadersDict
 
+    def getSession(self, urlStr: str) -> requests.Session:
+        """Returns the shared keep-alive session for the URL's scheme and host, creating it once."""
+        parsedUrlObj = parse.urlsplit(urlStr)
+        hostKeyStr = f"{parsedUrlObj.scheme}://{parsedUrlObj.netloc}".lower()
+        sessionObj = self.__class__.sessionPoolDict.get(hostKeyStr)
+        if sessionObj is not None:
+            return sessionObj
+        with BasicRemoteProxy.sessionPoolLockObj:
+            sessionObj = BasicRemoteProxy.sessionPoolDict.get(hostKeyStr)
+            if sessionObj is None:
+                sessionObj = requests.Session()
+                adapterObj = HTTPAdapter(
+                    pool_connections=1,
+                    pool_maxsize=self.sessionPoolSizeInt,
+                    max_retries=0,
+                )
+                sessionObj.mount("http://", adapterObj)
+                sessionObj.mount("https://", adapterObj)
+                BasicRemoteProxy.sessionPoolDict[hostKeyStr] = sessionObj
+        return sessionObj
+
+    @classmethod
+    def getRequestHistoryList(cls) -> List[Dict[str, Any]]:
+        return BasicRemoteProxy.requestMetricObj.getHistoryList()
+
+    @classmethod
+    def getRequestMetricSummaryList(cls) -> List[Dict[str, Any]]:
+        return BasicRemoteProxy.requestMetricObj.getSummaryDictList()
+
+    @classmethod
+    def dumpRequestMetricStr(cls, formatStr: str = "json") -> str:
+        if formatStr == "prometheus":
+            return BasicRemoteProxy.requestMetricObj.dumpPrometheusStr()
+        return BasicRemoteProxy.requestMetricObj.dumpJsonStr()
+
+    @classmethod
+    def closeSessionPool(cls) -> None:
+        with BasicRemoteProxy.sessionPoolLockObj:
+            for sessionObj in BasicRemoteProxy.sessionPoolDict.values():
+                sessionObj.close()
+            BasicRemoteProxy.sessionPoolDict.clear()
+
+    def getRetryDelaySecondsFloat(self, attemptInt: int, backoffBaseSecondsFloat: float) -> float:
+        cappedDelaySecondsFloat = min(
+            self.retryBackoffMaxSecondsFloat,
+            backoffBaseSecondsFloat * (2 ** attemptInt),
+        )
+        return random.uniform(0, cappedDelaySecondsFloat)
+
     def recordHistory(
         self,
         methodStr: str,
@@ -58,7 +132,7 @@ class BasicRemoteProxy:
         statusCodeInt: Optional[int] = None,
         errorStr: Optional[str] = None,
     ) -> None:
-        self.__class__.requestsHistoryList.append(
+        BasicRemoteProxy.requestMetricObj.record(
             {
                 "method": methodStr,
                 "url": urlStr,
@@ -79,8 +153,12 @@ class BasicRemoteProxy:
         jsonObj: Optional[Any] = None,
         headersDict: Optional[Dict[str, str]] = None,
         timeoutInt: Optional[int] = None,
+        retryLimitInt: Optional[int] = None,
+        retryBackoffBaseSecondsFloat: Optional[float] = None,
+        retryOnResponseObj: Optional[Callable[[requests.Response], bool]] = None,
         **kwargsDict: Any,
     ) -> Optional[requests.Response]:
+        """Sends a request over the pooled per-host session, retrying idempotent methods with jittered backoff."""
         if not urlStr or not isinstance(urlStr, str) or not urlStr.strip():
             self.log("Request failed: empty URL")
             self.recordHistory(
@@ -105,11 +183,23 @@ class BasicRemoteProxy:
             return None
 
         chosenTimeoutInt = timeoutInt if timeoutInt is not None else self.requestTimeoutSecondsInt
-        startTimeFloat = time.perf_counter()
+        chosenRetryLimitInt = retryLimitInt if retryLimitInt is not None else self.retryLimitInt
+        if methodCleanStr not in REMOTE_IDEMPOTENT_METHOD_LIST:
+            chosenRetryLimitInt = 1
+        if retryBackoffBaseSecondsFloat is None:
+            retryBackoffBaseSecondsFloat = self.retryBackoffBaseSecondsFloat
+        sessionObj = self.getSession(urlStr)
         fullUrlStr = urlStr
 
-        try:
-            with requests.Session() as sessionObj:
+        for attemptInt in range(max(1, chosenRetryLimitInt)):
+            if attemptInt:
+                delaySecondsFloat = self.getRetryDelaySecondsFloat(attemptInt - 1, retryBackoffBaseSecondsFloat)
+                self.log(f"Retrying {fullUrlStr} in {delaySecondsFloat:.2f}s ({attemptInt + 1}/{chosenRetryLimitInt})")
+                time.sleep(delaySecondsFloat)
+            lastAttemptBool = attemptInt + 1 >= chosenRetryLimitInt
+            startTimeFloat = time.perf_counter()
+
+            try:
                 preparedObj = sessionObj.prepare_request(
                     requests.Request(
                         method=methodCleanStr,
@@ -122,6 +212,20 @@ class BasicRemoteProxy:
                 )
                 fullUrlStr = preparedObj.url or urlStr
                 responseObj = sessionObj.send(preparedObj, timeout=chosenTimeoutInt, **kwargsDict)
+            except Exception as excObj:
+                elapsedSecondFloat = time.perf_counter() - startTimeFloat
+                self.recordHistory(
+                    methodStr=methodCleanStr,
+                    urlStr=fullUrlStr,
+                    successBool=False,
+                    elapsedSecondFloat=elapsedSecondFloat,
+                    errorStr=str(excObj),
+                )
+                self.log(f"Request failed: {fullUrlStr} ({elapsedSecondFloat:.3f}s) {excObj}")
+                if lastAttemptBool:
+                    return None
+                continue
+
             elapsedSecondFloat = time.perf_counter() - startTimeFloat
             self.recordHistory(
                 methodStr=methodCleanStr,
@@ -136,18 +240,14 @@ class BasicRemoteProxy:
                 self.log(
                     f"Request failed: {fullUrlStr} (status {responseObj.status_code}, {elapsedSecondFloat:.3f}s)"
                 )
-            return responseObj
-        except Exception as excObj:
-            elapsedSecondFloat = time.perf_counter() - startTimeFloat
-            self.recordHistory(
-                methodStr=methodCleanStr,
-                urlStr=fullUrlStr,
-                successBool=False,
-                elapsedSecondFloat=elapsedSecondFloat,
-                errorStr=str(excObj),
+            retryBool = responseObj.status_code in REMOTE_RETRYABLE_STATUS_CODE_LIST or bool(
+                retryOnResponseObj and retryOnResponseObj(responseObj)
             )
-            self.log(f"Request failed: {fullUrlStr} ({elapsedSecondFloat:.3f}s) {excObj}")
-            return None
+            if not retryBool or lastAttemptBool:
+                return responseObj
+            responseObj.close()
+
+        return None
 
     def get(self, urlStr: str, **kwargsDict: Any) -> Optional[requests.Response]:
         return self.request("GET", urlStr, **kwargsDict)
@@ -161,4 +261,3 @@ class BasicRemoteProxy:
     def delete(self, urlStr: str, **kwargsDict: Any) -> Optional[requests.Response]:
         return self.request("DELETE", urlStr, **kwargsDict)
 
-
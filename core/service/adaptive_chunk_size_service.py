@@ -0,0 +1,94 @@
+from typing import Optional
+from pathlib import Path
+import threading
+import json
+
+from core.constant import (
+    ADAPTIVE_CHUNK_LATENCY_SMOOTHING_FLOAT,
+    ADAPTIVE_CHUNK_LATENCY_SPIKE_FACTOR_FLOAT,
+    ADAPTIVE_CHUNK_NEAR_FULL_RATIO_FLOAT,
+    ADAPTIVE_CHUNK_SIZE_SHRINK_FACTOR_FLOAT,
+    ADAPTIVE_CHUNK_SIZE_STATE_PATH_STR,
+    ADAPTIVE_CHUNK_SIZE_GROW_STEP_INT,
+    ADAPTIVE_CHUNK_SIZE_MAX_INT,
+    ADAPTIVE_CHUNK_SIZE_MIN_INT,
+    DEFAULT_CHAR_LIMIT_INT,
+)
+from core import logger
+
+
+class AdaptiveChunkSizeService:
+    """Learns and persists the translate chunk size from near-full chunk latency and failures."""
+
+    def __init__(
+        self,
+        statePathStr: str = ADAPTIVE_CHUNK_SIZE_STATE_PATH_STR,
+        minChunkSizeInt: int = ADAPTIVE_CHUNK_SIZE_MIN_INT,
+        maxChunkSizeInt: int = ADAPTIVE_CHUNK_SIZE_MAX_INT,
+        initialChunkSizeInt: int = DEFAULT_CHAR_LIMIT_INT,
+    ):
+        self.statePathObj = Path(statePathStr)
+        self.minChunkSizeInt = max(1, int(minChunkSizeInt))
+        self.maxChunkSizeInt = max(self.minChunkSizeInt, int(maxChunkSizeInt))
+        self.chunkSizeInt = self._clampChunkSizeInt(initialChunkSizeInt)
+        self.latencyPerCharFloat: Optional[float] = None
+        self.lockObj = threading.Lock()
+        self.load()
+
+    def _clampChunkSizeInt(self, chunkSizeInt) -> int:
+        return max(self.minChunkSizeInt, min(self.maxChunkSizeInt, int(chunkSizeInt)))
+
+    def load(self) -> None:
+        if not self.statePathObj.is_file():
+            return
+        try:
+            stateDict = json.loads(self.statePathObj.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(stateDict.get("chunkSizeInt"), int):
+            self.chunkSizeInt = self._clampChunkSizeInt(stateDict["chunkSizeInt"])
+        if isinstance(stateDict.get("latencyPerCharFloat"), (int, float)):
+            self.latencyPerCharFloat = float(stateDict["latencyPerCharFloat"])
+
+    def save(self) -> None:
+        self.statePathObj.parent.mkdir(parents=True, exist_ok=True)
+        stateDict = {
+            "chunkSizeInt": self.chunkSizeInt,
+            "latencyPerCharFloat": self.latencyPerCharFloat,
+        }
+        self.statePathObj.write_text(json.dumps(stateDict, indent=2), encoding="utf-8")
+
+    def getChunkSizeInt(self) -> int:
+        return self.chunkSizeInt
+
+    def recordChunkResult(self, chunkCharCountInt: int, elapsedSecondFloat: float, successBool: bool) -> int:
+        with self.lockObj:
+            previousChunkSizeInt = self.chunkSizeInt
+            latencyPerCharFloat = elapsedSecondFloat / max(1, chunkCharCountInt)
+            nearFullBool = chunkCharCountInt >= self.chunkSizeInt * ADAPTIVE_CHUNK_NEAR_FULL_RATIO_FLOAT
+            latencySpikeBool = (
+                nearFullBool
+                and self.latencyPerCharFloat is not None
+                and latencyPerCharFloat > self.latencyPerCharFloat * ADAPTIVE_CHUNK_LATENCY_SPIKE_FACTOR_FLOAT
+            )
+
+            if not successBool or latencySpikeBool:
+                self.chunkSizeInt = self._clampChunkSizeInt(self.chunkSizeInt * ADAPTIVE_CHUNK_SIZE_SHRINK_FACTOR_FLOAT)
+            elif nearFullBool:
+                self.chunkSizeInt = self._clampChunkSizeInt(self.chunkSizeInt + ADAPTIVE_CHUNK_SIZE_GROW_STEP_INT)
+
+            if successBool and nearFullBool:
+                if self.latencyPerCharFloat is None:
+                    self.latencyPerCharFloat = latencyPerCharFloat
+                else:
+                    self.latencyPerCharFloat += ADAPTIVE_CHUNK_LATENCY_SMOOTHING_FLOAT * (
+                        latencyPerCharFloat - self.latencyPerCharFloat
+                    )
+
+            if self.chunkSizeInt != previousChunkSizeInt:
+                logger.info(
+                    f"Adaptive chunk size {previousChunkSizeInt} -> {self.chunkSizeInt} "
+                    f"(success={successBool}, {latencyPerCharFloat * 1000:.2f}ms/char)"
+                )
+            self.save()
+            return self.chunkSizeInt
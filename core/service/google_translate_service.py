@@ -1,47 +1,86 @@
 
 
+from urllib import parse
+import asyncio
 import random
+import time
 import json
 import re
 
 from core.constant import DEFAULT_TRANSLATE_URL_STR, SOURCE_TEXT_AREA_SELECTOR_STR, TARGET_TEXT_SELECTOR_STR, DEFAULT_CHECK_FRAME_STR, USER_AGENT_RANDOM_OUTPUT_PATH_STR
+from core.constant import TRANSLATE_PAGE_POOL_SIZE_INT, TRANSLATE_PARALLEL_LIMIT_INT, DEFAULT_CHECK_PARITY_STR
+from core.constant import TARGET_TEXT_CONTAINER_SELECTOR_STR, TRANSLATION_POLL_SECONDS_FLOAT, TRANSLATION_WAIT_TIMEOUT_SECONDS_INT
+from core.constant import TRANSLATION_STABLE_POLL_COUNT_INT, TRANSLATION_RETRY_SUB_CHUNK_FRAME_COUNT_INT
+from core.constant import TRANSLATION_RETRY_SUBMISSION_LIMIT_INT, TRANSLATION_RETRY_TIMEOUT_LIMIT_INT
+from core.constant import TRANSLATION_INJECTION_CONFIRM_SECONDS_FLOAT
+from core.service.subtitle_wire_format_service import SubtitleWireFormatService
 from core.wrapper.user_agent_wrapper import ChromeForTestingUserAgentWrapper
 
 class GoogleTranslateService:
-    def __init__(self, noDriverModuleObj, translateUrlStr: str = DEFAULT_TRANSLATE_URL_STR):
+    def __init__(
+        self,
+        noDriverModuleObj,
+        translateUrlStr: str = DEFAULT_TRANSLATE_URL_STR,
+        pagePoolSizeInt: int = TRANSLATE_PAGE_POOL_SIZE_INT,
+        parallelLimitInt: int = TRANSLATE_PARALLEL_LIMIT_INT,
+    ):
         self.noDriverModuleObj = noDriverModuleObj
         self.translateUrlStr = translateUrlStr
+        self.pagePoolSizeInt = max(1, int(pagePoolSizeInt))
+        self.parallelLimitInt = max(1, int(parallelLimitInt))
         self.browserObj = None
         self.pageObj = None
-        self.previousTranslatedTextStr = ""
+        self.pagePoolList = []
+        self.previousTranslatedTextDict = {}
+        self.previousSourceTextDict = {}
+        self.injectionRejectedPageKeySet = set()
         self.chromeForTestingUserAgentWrapper = ChromeForTestingUserAgentWrapper()
+        self.subtitleWireFormatObj = SubtitleWireFormatService()
 
-    def splitBySubTimeframe(self, translatedSpanStr: str):
-        timecodePattern = re.compile(
-            r"(?m)^(?:\d+\s*\n)?\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}\s*$"
-        )
-        matches = list(timecodePattern.finditer(translatedSpanStr))
-        if not matches:
-            return translatedSpanStr.split("\n\n")
-
-        blockList = []
-        for matchIndexInt, matchObj in enumerate(matches):
-            startInt = matchObj.start()
-            endInt = matches[matchIndexInt + 1].start() if matchIndexInt + 1 < len(matches) else len(translatedSpanStr)
-            blockStr = translatedSpanStr[startInt:endInt].strip()
-            if blockStr:
-                blockList.append(blockStr)
-        return blockList
+    def getLanguagePairTuple(self):
+        queryDict = parse.parse_qs(parse.urlparse(self.translateUrlStr).query)
+        sourceLanguageStr = (queryDict.get("sl") or ["auto"])[0]
+        targetLanguageStr = (queryDict.get("tl") or [""])[0]
+        return sourceLanguageStr, targetLanguageStr
 
     async def start(self):
         await self.open()
+        await self.openPagePool()
+
+    async def openPagePool(self):
+        """Open extra Google Translate tabs next to the validated main page, each validated the same way."""
+        self.pagePoolList = [self.pageObj]
+        maxTriesInt = self.pagePoolSizeInt * 2
+        attemptInt = 0
+
+        while len(self.pagePoolList) < self.pagePoolSizeInt and attemptInt < maxTriesInt:
+            attemptInt += 1
+            pageObj = await self.browserObj.get(self.translateUrlStr, new_tab=True)
+            googleTranslateFlag = await self.translateChunk(DEFAULT_CHECK_FRAME_STR, pageObj)
+            if googleTranslateFlag is not None:
+                self.pagePoolList.append(pageObj)
+                continue
+            print(f"Wrong google translate model detected on pooled tab. Attempt {attemptInt}/{maxTriesInt}.")
+            self.forgetPageState(pageObj)
+            try:
+                await pageObj.close()
+            except Exception:
+                pass
+
+        print(f"Translate page pool ready with {len(self.pagePoolList)}/{self.pagePoolSizeInt} tabs")
+        return self.pagePoolList
     
     async def open(self):
         maxTriesInt = 10
+        triedUserAgentSet = set()
 
         for attemptInt in range(maxTriesInt):
+            userAgentStr = None
             try:
                 # Ensure previous instance is fully stopped
+                self.previousTranslatedTextDict.clear()
+                self.previousSourceTextDict.clear()
+                self.injectionRejectedPageKeySet.clear()
                 if self.browserObj:
                     try:
                         await self.browserObj.stop()
@@ -52,10 +91,12 @@ class GoogleTranslateService:
                 
                 
 
+                userAgentStr = self.chromeForTestingUserAgentWrapper.getScoredUserAgent(triedUserAgentSet)
+                triedUserAgentSet.add(userAgentStr)
                 noDriverInitParamDict = {
                     'sandbox': False,
                     'user_data_dir': "./profile_cache",
-                    'browser_args': [f"--user-agent={self.chromeForTestingUserAgentWrapper.getRandomUserAgent()}"],   
+                    'browser_args': [f"--user-agent={userAgentStr}"],   
                 }
                 
                 # Create a fresh copy of init params
@@ -72,6 +113,7 @@ class GoogleTranslateService:
                 googleTranslateFlag = await self.translateChunk(DEFAULT_CHECK_FRAME_STR)
 
                 if googleTranslateFlag is not None:
+                    self.chromeForTestingUserAgentWrapper.recordUserAgentOutcome(userAgentStr, True)
                     print(
                         f"Success - Using user agent: "
                         f"{currNoDriverInitParamDict['browser_args'][0]}"
@@ -81,6 +123,8 @@ class GoogleTranslateService:
                 raise RuntimeError("Invalid Google Translate DOM detected")
 
             except Exception as errorObj:
+                if userAgentStr:
+                    self.chromeForTestingUserAgentWrapper.recordUserAgentOutcome(userAgentStr, False)
                 print(
                     f"Wrong google translate model detected. "
                     f"Attempt {attemptInt + 1}/{maxTriesInt}. Restarting..."
@@ -98,24 +142,64 @@ class GoogleTranslateService:
                 if attemptInt + 1 >= maxTriesInt:
                     raise RuntimeError("Max retries reached. Exiting...") from errorObj
 
-    async def setSourceText(self, chunkStr):
-            textAreaElement = await self.pageObj.find(SOURCE_TEXT_AREA_SELECTOR_STR, best_match=True, timeout=3)
-            await textAreaElement.clear_input()
-            chunkStr = chunkStr.replace("\n", "\r\n")
-            await textAreaElement.send_keys(
-                chunkStr,
-            )
-            
-            a = 2
-            
-    async def subIndexProcess(self, indexStr):
-        """Process the subtitle index (e.g., '8')."""
-        return indexStr.strip()
+    async def evaluateJsonObj(self, pageObj, expressionStr, defaultObj=None):
+        """Run a page expression that returns JSON.stringify(...) and decode it in one round-trip."""
+        resultObj = await pageObj.evaluate(expressionStr, return_by_value=True)
+        if not isinstance(resultObj, str):
+            return defaultObj
+        try:
+            return json.loads(resultObj)
+        except json.JSONDecodeError:
+            return defaultObj
+
+    async def injectSourceText(self, chunkStr, pageObj):
+        """Set the source textarea in one evaluation and return the previous target text, or None without a textarea."""
+        expressionStr = (
+            "(() => {"
+            f"const textAreaNode = document.querySelector({json.dumps(SOURCE_TEXT_AREA_SELECTOR_STR)});"
+            "if (!textAreaNode) { return JSON.stringify(null); }"
+            f"const containerNode = document.querySelector({json.dumps(TARGET_TEXT_CONTAINER_SELECTOR_STR)});"
+            "const previousTextStr = containerNode ? containerNode.innerText : '';"
+            "const valueSetterObj = Object.getOwnPropertyDescriptor(HTMLTextAreaElement.prototype, 'value').set;"
+            "textAreaNode.focus();"
+            f"valueSetterObj.call(textAreaNode, {json.dumps(chunkStr)});"
+            "textAreaNode.dispatchEvent(new Event('input', { bubbles: true }));"
+            "return JSON.stringify(previousTextStr);"
+            "})()"
+        )
+        return await self.evaluateJsonObj(pageObj, expressionStr, None)
+
+    async def waitForTargetChange(self, pageObj, previousTextStr):
+        deadlineFloat = time.monotonic() + TRANSLATION_INJECTION_CONFIRM_SECONDS_FLOAT
+        while time.monotonic() < deadlineFloat:
+            await asyncio.sleep(TRANSLATION_POLL_SECONDS_FLOAT)
+            if await self.readTargetContainerTextStr(pageObj) != previousTextStr:
+                return True
+        return False
+
+    async def setSourceText(self, chunkStr, pageObj=None, expectChangeBool=True):
+        """Put chunkStr into the source textarea, falling back to send_keys on tabs that ignored an injection."""
+        pageObj = pageObj or self.pageObj
+        pageKeyObj = self.getPageKeyObj(pageObj)
+        if pageKeyObj not in self.injectionRejectedPageKeySet:
+            try:
+                previousTextStr = await self.injectSourceText(chunkStr, pageObj)
+                if previousTextStr is not None and (
+                    not expectChangeBool or await self.waitForTargetChange(pageObj, previousTextStr)
+                ):
+                    return
+            except Exception as errorObj:
+                print(f"Warning: Source text injection failed: {errorObj}")
+            print("Warning: Page ignored source text injection, falling back to send_keys on this tab")
+            self.injectionRejectedPageKeySet.add(pageKeyObj)
+
+        textAreaElement = await pageObj.find(SOURCE_TEXT_AREA_SELECTOR_STR, best_match=True, timeout=3)
+        await textAreaElement.clear_input()
+        chunkStr = chunkStr.replace("\n", "\r\n")
+        await textAreaElement.send_keys(
+            chunkStr,
+        )
 
-    async def subTimeCodeProcess(self, timeCodeStr):
-        """Process the timecode line (e.g., '00:01:10,514 --> 00:01:13,290')."""
-        return timeCodeStr.strip()
-    
     async def lineConstructSentence(self, lineStr):
         # if lineStr contain ['.', '!', '?'], we assume it's the end of a sentence and add a space after it.
         # in case it's already there, we don't add another space.
@@ -182,94 +266,267 @@ class GoogleTranslateService:
         
         return '\n'.join(subFrameBodyList)
     
-    async def subFrameProcess(self, spanBlockStr):
-        """
-        Process a single subtitle frame block.
-        
-        Input example:
-            "8\n00:01:10,514 --> 00:01:13,290\n- [burrë] Hej, Lacie!\n\n- Hej!\n[qeshje]"
-        Output example:
-            "8\n00:01:10,514 --> 00:01:13,290\n- [burrë] Hej, Lacie!\n- Hej![qeshje]"
-        """
-        lineList = spanBlockStr.splitlines()
-        
-        subFrameIndexStr = None
-        subFrameTimeCodeStr = None
-        subFrameBodyLineStr = ''
-        
-        for lineStr in lineList:
-            strippedLineStr = lineStr.strip()
-            
-            # Skip empty lines
-            if not strippedLineStr:
-                continue
-            
-            # Check if it's a timecode line
-            if "-->" in strippedLineStr:
-                subFrameTimeCodeStr = await self.subTimeCodeProcess(strippedLineStr)
-            # Check if it's a numeric index (before timecode is found)
-            elif subFrameTimeCodeStr is None and strippedLineStr.isdigit():
-                subFrameIndexStr = await self.subIndexProcess(strippedLineStr)
-            # Otherwise it's part of the subtitle body
-            else:
-                subFrameBodyLineStr = f"{subFrameBodyLineStr}{strippedLineStr}\n"
-        
-        # Build the result
-        resultPartList = []
-        
-        if subFrameIndexStr:
-            resultPartList.append(subFrameIndexStr)
-        
-        if subFrameTimeCodeStr:
-            resultPartList.append(subFrameTimeCodeStr)
-        
-        if subFrameBodyLineStr:
-            processedBodyStr = await self.subFrameBodyProcess(subFrameBodyLineStr)
-            if processedBodyStr:
-                processedBodyList = processedBodyStr.splitlines()
-                resultPartList = [ *resultPartList, *processedBodyList ]
-        
-        return '\n'.join(resultPartList)
+    async def readTranslatedSpanStr(self, pageObj):
+        """Read every translated span in one page-side evaluation and return them joined by newlines."""
+        expressionStr = (
+            "(() => {"
+            f"const spanNodeList = Array.from(document.querySelectorAll({json.dumps(TARGET_TEXT_SELECTOR_STR)}));"
+            "return JSON.stringify(spanNodeList.map((spanNode) => spanNode.textContent).join('\\n'));"
+            "})()"
+        )
+        translatedSpanStr = await self.evaluateJsonObj(pageObj, expressionStr, "") or ""
+        return translatedSpanStr.strip()
 
-    async def readTranslatedText(self):
-        translatedSpanList = await self.pageObj.find_all(TARGET_TEXT_SELECTOR_STR)
-        translatedSpanStr = '\n'.join(span.text for span in translatedSpanList).strip()
+    async def readTranslatedText(self, pageObj=None):
+        pageObj = pageObj or self.pageObj
+        translatedSpanStr = await self.readTranslatedSpanStr(pageObj)
 
-        translatedBlockList = self.splitBySubTimeframe(translatedSpanStr)
-        
-        subChunkStr = ""
-        subChunkList = []
-        
-        constCheckParityStr ="Nëse do të isha, do të ishe lakuriq."
+        translatedFrameBodyDict = self.subtitleWireFormatObj.parseWireChunkDict(translatedSpanStr)
+        checkFrameKeyInt = self.subtitleWireFormatObj.checkFrameKeyInt
+        constCheckParityStr = DEFAULT_CHECK_PARITY_STR
         # <i>Nëse unë</i>\n<i>ishte, do të ishe lakuriq.</i>
         # <i>Nëse</i>\n<i>do të isha, do të ishe lakuriq.</i>
-        
-        for spanIndexInt, spanBlockStr in enumerate(translatedBlockList):
-            if spanIndexInt == 7:
-                a=2
-            subFrameStr = await self.subFrameProcess(spanBlockStr)
-            currCheckSubFrameStr = subFrameStr.replace("\n", " ").replace("<i>", "").replace("</i>", "").strip()
-            if spanIndexInt == 0:
-                if not constCheckParityStr in currCheckSubFrameStr:
-                    print(f"Warning: Parity check failed for span index {spanIndexInt}. Expected '{constCheckParityStr}', got '{currCheckSubFrameStr}'")
-                    return None
-            else:
-                subChunkList.append(subFrameStr)
-        
-        subChunkStr = f"\n\n".join(subChunkList)
-            
-        return subChunkStr
 
-    async def translateChunk(self, chunkStr):
-        if not self.pageObj:
+        currCheckSubFrameStr = await self.subFrameBodyProcess(translatedFrameBodyDict.pop(checkFrameKeyInt, ""))
+        currCheckSubFrameStr = currCheckSubFrameStr.replace("\n", " ").replace("<i>", "").replace("</i>", "").strip()
+        if not constCheckParityStr in currCheckSubFrameStr:
+            print(f"Warning: Parity check failed for check frame. Expected '{constCheckParityStr}', got '{currCheckSubFrameStr}'")
+            return None
+
+        subChunkDict = {}
+        for frameKeyInt, frameBodyStr in translatedFrameBodyDict.items():
+            subChunkDict[frameKeyInt] = await self.subFrameBodyProcess(frameBodyStr)
+
+        return subChunkDict
+
+    def getPageKeyObj(self, pageObj):
+        """Key per-page state by CDP target id, which unlike id() is never reused by a replacement tab."""
+        targetObj = getattr(pageObj, "target", None)
+        return getattr(targetObj, "target_id", None) or pageObj
+
+    def forgetPageState(self, pageObj):
+        pageKeyObj = self.getPageKeyObj(pageObj)
+        self.previousTranslatedTextDict.pop(pageKeyObj, None)
+        self.previousSourceTextDict.pop(pageKeyObj, None)
+        self.injectionRejectedPageKeySet.discard(pageKeyObj)
+
+    async def submitChunk(self, chunkStr, pageObj):
+        """Put chunkStr on the page and wait for its translation; returns False when the wait timed out."""
+        pageKeyObj = self.getPageKeyObj(pageObj)
+        sourceUnchangedBool = self.previousSourceTextDict.pop(pageKeyObj, None) == chunkStr
+        await self.setSourceText(chunkStr, pageObj, expectChangeBool=not sourceUnchangedBool)
+        expectedFrameKeySet = set(self.subtitleWireFormatObj.parseWireChunkDict(chunkStr))
+        if not await self.waitForTranslatedText(
+            pageObj,
+            requireNewTextBool=not sourceUnchangedBool,
+            expectedFrameKeySet=expectedFrameKeySet,
+        ):
+            return False
+        self.previousSourceTextDict[pageKeyObj] = chunkStr
+        return True
+
+    async def translateChunk(self, chunkStr, pageObj=None):
+        pageObj = pageObj or self.pageObj
+        if not pageObj:
             return ""
 
-        await self.setSourceText(chunkStr)
-        await self.pageObj.wait(2)
-        translatedTextStr = await self.readTranslatedText()
+        await self.submitChunk(chunkStr, pageObj)
+        translatedTextStr = await self.readTranslatedText(pageObj)
         return translatedTextStr
-    
+
+    def countDialogueLineInt(self, bodyStr):
+        return sum(1 for lineStr in bodyStr.splitlines() if lineStr.strip().startswith("-"))
+
+    def isTranslatedFrameBodyValid(self, sourceBodyStr, translatedBodyStr):
+        """Check one translated frame against its source after the same bracket clean-up."""
+        if translatedBodyStr is None:
+            return False
+        expectedBodyStr = self.removeBracketedContent(sourceBodyStr)
+        if not expectedBodyStr:
+            return True
+        if not translatedBodyStr:
+            return False
+        expectedDialogueCountInt = self.countDialogueLineInt(expectedBodyStr)
+        if expectedDialogueCountInt > 1 and self.countDialogueLineInt(translatedBodyStr) != expectedDialogueCountInt:
+            return False
+        return True
+
+    def collectValidFrameBodyDict(self, sourceFrameBodyDict, translatedFrameBodyDict):
+        translatedFrameBodyDict = translatedFrameBodyDict or {}
+        return {
+            frameKeyInt: translatedFrameBodyDict[frameKeyInt]
+            for frameKeyInt, sourceBodyStr in sourceFrameBodyDict.items()
+            if self.isTranslatedFrameBodyValid(sourceBodyStr, translatedFrameBodyDict.get(frameKeyInt))
+        }
+
+    def buildRetryBudgetDict(self):
+        return {
+            "submissionLeftInt": TRANSLATION_RETRY_SUBMISSION_LIMIT_INT,
+            "timeoutLeftInt": TRANSLATION_RETRY_TIMEOUT_LIMIT_INT,
+            "skippedFrameCountInt": 0,
+        }
+
+    async def retranslateFrameBodyDict(self, frameBodyDict, pageObj=None, retryBudgetDict=None):
+        """Re-submit failed frames in bisected sub-chunks within a shared retry budget."""
+        pageObj = pageObj or self.pageObj
+        if retryBudgetDict is None:
+            retryBudgetDict = self.buildRetryBudgetDict()
+        frameKeyList = list(frameBodyDict)
+        if len(frameKeyList) > TRANSLATION_RETRY_SUB_CHUNK_FRAME_COUNT_INT:
+            validFrameBodyDict = {}
+            for subChunkStartInt in range(0, len(frameKeyList), TRANSLATION_RETRY_SUB_CHUNK_FRAME_COUNT_INT):
+                subChunkKeyList = frameKeyList[subChunkStartInt : subChunkStartInt + TRANSLATION_RETRY_SUB_CHUNK_FRAME_COUNT_INT]
+                validFrameBodyDict.update(
+                    await self.retranslateFrameBodyDict(
+                        {frameKeyInt: frameBodyDict[frameKeyInt] for frameKeyInt in subChunkKeyList},
+                        pageObj,
+                        retryBudgetDict,
+                    )
+                )
+            return validFrameBodyDict
+
+        if retryBudgetDict["submissionLeftInt"] <= 0 or retryBudgetDict["timeoutLeftInt"] <= 0:
+            retryBudgetDict["skippedFrameCountInt"] += len(frameKeyList)
+            return {}
+        chunkStr = DEFAULT_CHECK_FRAME_STR + self.subtitleWireFormatObj.buildWireChunkStr(frameBodyDict)
+        if self.previousSourceTextDict.get(self.getPageKeyObj(pageObj)) == chunkStr:
+            translatedFrameBodyDict = None
+        else:
+            retryBudgetDict["submissionLeftInt"] -= 1
+            if not await self.submitChunk(chunkStr, pageObj):
+                retryBudgetDict["timeoutLeftInt"] -= 1
+            translatedFrameBodyDict = await self.readTranslatedText(pageObj)
+        validFrameBodyDict = self.collectValidFrameBodyDict(frameBodyDict, translatedFrameBodyDict)
+        invalidKeyList = [frameKeyInt for frameKeyInt in frameKeyList if frameKeyInt not in validFrameBodyDict]
+        if not invalidKeyList:
+            return validFrameBodyDict
+        if len(frameKeyList) == 1:
+            print(f"Warning: Frame {frameKeyList[0]} failed validation after retries")
+            return validFrameBodyDict
+
+        middleIndexInt = max(1, len(invalidKeyList) // 2)
+        for halfKeyList in (invalidKeyList[:middleIndexInt], invalidKeyList[middleIndexInt:]):
+            if halfKeyList:
+                validFrameBodyDict.update(
+                    await self.retranslateFrameBodyDict(
+                        {frameKeyInt: frameBodyDict[frameKeyInt] for frameKeyInt in halfKeyList},
+                        pageObj,
+                        retryBudgetDict,
+                    )
+                )
+        return validFrameBodyDict
+
+    async def translateWireChunk(self, chunkStr, pageObj=None):
+        """Translate a wire chunk and return {frameKeyInt: bodyStr} for the frames that pass validation, or None."""
+        sourceFrameBodyDict = self.subtitleWireFormatObj.parseWireChunkDict(chunkStr)
+        sourceFrameBodyDict.pop(self.subtitleWireFormatObj.checkFrameKeyInt, None)
+        translatedFrameBodyDict = await self.translateChunk(chunkStr, pageObj)
+        if not sourceFrameBodyDict:
+            return translatedFrameBodyDict
+
+        validFrameBodyDict = self.collectValidFrameBodyDict(sourceFrameBodyDict, translatedFrameBodyDict)
+        invalidFrameBodyDict = {
+            frameKeyInt: sourceBodyStr
+            for frameKeyInt, sourceBodyStr in sourceFrameBodyDict.items()
+            if frameKeyInt not in validFrameBodyDict
+        }
+        if invalidFrameBodyDict:
+            print(f"Warning: {len(invalidFrameBodyDict)}/{len(sourceFrameBodyDict)} frames failed validation, re-translating")
+            retryBudgetDict = self.buildRetryBudgetDict()
+            validFrameBodyDict.update(await self.retranslateFrameBodyDict(invalidFrameBodyDict, pageObj, retryBudgetDict))
+            if retryBudgetDict["skippedFrameCountInt"]:
+                print(f"Warning: Retry budget exhausted, gave up on {retryBudgetDict['skippedFrameCountInt']} frames")
+        return validFrameBodyDict or None
+
+    async def isPageReady(self, pageObj):
+        """Cheap liveness probe: the tab answers a script evaluation and still has the source textarea."""
+        expressionStr = (
+            "(() => {"
+            f"return JSON.stringify(document.querySelector({json.dumps(SOURCE_TEXT_AREA_SELECTOR_STR)}) !== null);"
+            "})()"
+        )
+        return await self.evaluateJsonObj(pageObj, expressionStr, False) is True
+
+    async def readTargetContainerTextStr(self, pageObj):
+        expressionStr = (
+            "(() => {"
+            f"const containerNode = document.querySelector({json.dumps(TARGET_TEXT_CONTAINER_SELECTOR_STR)});"
+            "return JSON.stringify(containerNode ? containerNode.innerText : '');"
+            "})()"
+        )
+        return await self.evaluateJsonObj(pageObj, expressionStr, "") or ""
+
+    def isParityFrameRendered(self, containerTextStr):
+        checkTextStr = containerTextStr.replace("<i>", "").replace("</i>", "")
+        checkTextStr = " ".join(checkTextStr.split())
+        return DEFAULT_CHECK_PARITY_STR in checkTextStr
+
+    def isExpectedFrameKeySetRendered(self, containerTextStr, expectedFrameKeySet):
+        if not expectedFrameKeySet:
+            return False
+        translatedFrameBodyDict = self.subtitleWireFormatObj.parseWireChunkDict(containerTextStr)
+        return all(translatedFrameBodyDict.get(frameKeyInt) for frameKeyInt in expectedFrameKeySet)
+
+    async def waitForTranslatedText(self, pageObj=None, requireNewTextBool=True, expectedFrameKeySet=None):
+        """Return as soon as every expected #key and the parity sentence render, else once the text stops changing."""
+        pageObj = pageObj or self.pageObj
+        pageKeyObj = self.getPageKeyObj(pageObj)
+        previousTranslatedTextStr = self.previousTranslatedTextDict.get(pageKeyObj, "") if requireNewTextBool else ""
+        deadlineFloat = time.monotonic() + TRANSLATION_WAIT_TIMEOUT_SECONDS_INT
+        lastContainerTextStr = None
+        stablePollCountInt = 0
+
+        while time.monotonic() < deadlineFloat:
+            containerTextStr = await self.readTargetContainerTextStr(pageObj)
+            if not containerTextStr or containerTextStr == previousTranslatedTextStr:
+                lastContainerTextStr = None
+                stablePollCountInt = 0
+                await asyncio.sleep(TRANSLATION_POLL_SECONDS_FLOAT)
+                continue
+            if containerTextStr == lastContainerTextStr:
+                stablePollCountInt += 1
+            else:
+                lastContainerTextStr = containerTextStr
+                stablePollCountInt = 0
+            if self.isParityFrameRendered(containerTextStr) and (
+                stablePollCountInt >= TRANSLATION_STABLE_POLL_COUNT_INT
+                or self.isExpectedFrameKeySetRendered(containerTextStr, expectedFrameKeySet)
+            ):
+                self.previousTranslatedTextDict[pageKeyObj] = containerTextStr
+                return True
+            await asyncio.sleep(TRANSLATION_POLL_SECONDS_FLOAT)
+
+        print(f"Warning: Translation did not settle within {TRANSLATION_WAIT_TIMEOUT_SECONDS_INT}s")
+        self.previousTranslatedTextDict[pageKeyObj] = lastContainerTextStr or self.previousTranslatedTextDict.get(pageKeyObj, "")
+        return False
+
+    async def translateChunkList(self, chunkIterable, onChunkCompleteObj=None):
+        """Translate chunks concurrently over the page pool and return them in source order."""
+        pagePoolList = self.pagePoolList or ([self.pageObj] if self.pageObj else [])
+        if not pagePoolList:
+            return []
+
+        chunkIteratorObj = enumerate(chunkIterable)
+        translatedChunkDict = {}
+
+        async def translateWorker(pageObj):
+            for chunkIndexInt, chunkStr in chunkIteratorObj:
+                startTimeFloat = time.perf_counter()
+                translatedChunkStr = await self.translateWireChunk(chunkStr, pageObj)
+                elapsedSecondFloat = time.perf_counter() - startTimeFloat
+                translatedChunkDict[chunkIndexInt] = translatedChunkStr
+                if onChunkCompleteObj:
+                    onChunkCompleteObj(chunkIndexInt, chunkStr, translatedChunkStr, elapsedSecondFloat)
+
+        workerPageList = pagePoolList[: self.parallelLimitInt]
+        await asyncio.gather(*(translateWorker(pageObj) for pageObj in workerPageList))
+        return [translatedChunkDict[chunkIndexInt] for chunkIndexInt in sorted(translatedChunkDict)]
+
 
     async def stop(self):
         if self.browserObj:
             await self.browserObj.stop()
+        self.pagePoolList = []
+        self.previousTranslatedTextDict.clear()
+        self.previousSourceTextDict.clear()
+        self.injectionRejectedPageKeySet.clear()
@@ -0,0 +1,170 @@
+from typing import Any, Dict, List, Optional, Tuple
+from collections import deque
+from urllib import parse
+import threading
+import bisect
+import json
+import math
+import time
+
+from core.constant import (
+    REMOTE_REQUEST_LATENCY_BUCKET_SECONDS_LIST,
+    REMOTE_REQUEST_HISTORY_SIZE_INT,
+)
+
+
+class RequestMetricService:
+    """Bounded request history with per-host and per-status latency buckets."""
+
+    errorStatusStr = "error"
+    allStatusStr = "all"
+
+    def __init__(
+        self,
+        historySizeInt: int = REMOTE_REQUEST_HISTORY_SIZE_INT,
+        latencyBucketSecondsList: Optional[List[float]] = None,
+    ):
+        self.historyDeque = deque(maxlen=max(1, int(historySizeInt)))
+        self.latencyBucketSecondsList = sorted(latencyBucketSecondsList or REMOTE_REQUEST_LATENCY_BUCKET_SECONDS_LIST)
+        self.aggregateDict: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.lockObj = threading.Lock()
+
+    def getHostStr(self, urlStr: str) -> str:
+        return parse.urlsplit(urlStr).netloc.lower() or "unknown"
+
+    def buildAggregateDict(self) -> Dict[str, Any]:
+        return {
+            "countInt": 0,
+            "errorCountInt": 0,
+            "elapsedSumFloat": 0.0,
+            "bucketCountList": [0] * (len(self.latencyBucketSecondsList) + 1),
+        }
+
+    def record(self, historyDict: Dict[str, Any]) -> None:
+        hostStr = self.getHostStr(str(historyDict.get("url") or ""))
+        statusCodeInt = historyDict.get("statusCodeInt")
+        statusStr = str(statusCodeInt) if statusCodeInt is not None else self.errorStatusStr
+        elapsedSecondFloat = max(0.0, float(historyDict.get("elapsedSecondFloat") or 0.0))
+        bucketIndexInt = bisect.bisect_left(self.latencyBucketSecondsList, elapsedSecondFloat)
+        historyDict = dict(historyDict, host=hostStr, recordedFloat=time.time())
+
+        with self.lockObj:
+            self.historyDeque.append(historyDict)
+            aggregateDict = self.aggregateDict.get((hostStr, statusStr))
+            if aggregateDict is None:
+                aggregateDict = self.buildAggregateDict()
+                self.aggregateDict[(hostStr, statusStr)] = aggregateDict
+            aggregateDict["countInt"] += 1
+            aggregateDict["errorCountInt"] += 0 if historyDict.get("success") else 1
+            aggregateDict["elapsedSumFloat"] += elapsedSecondFloat
+            aggregateDict["bucketCountList"][bucketIndexInt] += 1
+
+    def getHistoryList(self) -> List[Dict[str, Any]]:
+        with self.lockObj:
+            return list(self.historyDeque)
+
+    def reset(self) -> None:
+        with self.lockObj:
+            self.historyDeque.clear()
+            self.aggregateDict.clear()
+
+    def snapshotAggregateItemList(self) -> List[Tuple[Tuple[str, str], Dict[str, Any]]]:
+        with self.lockObj:
+            return [
+                (keyTuple, dict(aggregateDict, bucketCountList=list(aggregateDict["bucketCountList"])))
+                for keyTuple, aggregateDict in sorted(self.aggregateDict.items())
+            ]
+
+    def estimateQuantileFloat(self, bucketCountList: List[int], quantileFloat: float) -> Optional[float]:
+        """Interpolates a latency quantile linearly inside the bucket that holds the target rank."""
+        totalCountInt = sum(bucketCountList)
+        if not totalCountInt:
+            return None
+        targetRankFloat = quantileFloat * totalCountInt
+        cumulativeCountInt = 0
+        for bucketIndexInt, bucketCountInt in enumerate(bucketCountList):
+            if not bucketCountInt or cumulativeCountInt + bucketCountInt < targetRankFloat:
+                cumulativeCountInt += bucketCountInt
+                continue
+            lowerBoundFloat = self.latencyBucketSecondsList[bucketIndexInt - 1] if bucketIndexInt else 0.0
+            if bucketIndexInt >= len(self.latencyBucketSecondsList):
+                return lowerBoundFloat
+            upperBoundFloat = self.latencyBucketSecondsList[bucketIndexInt]
+            bucketFractionFloat = (targetRankFloat - cumulativeCountInt) / bucketCountInt
+            return lowerBoundFloat + (upperBoundFloat - lowerBoundFloat) * bucketFractionFloat
+        return self.latencyBucketSecondsList[-1]
+
+    def buildSummaryDict(self, hostStr: str, statusStr: str, aggregateDict: Dict[str, Any]) -> Dict[str, Any]:
+        countInt = aggregateDict["countInt"]
+        bucketCountList = aggregateDict["bucketCountList"]
+        return {
+            "host": hostStr,
+            "status": statusStr,
+            "countInt": countInt,
+            "errorCountInt": aggregateDict["errorCountInt"],
+            "errorRateFloat": aggregateDict["errorCountInt"] / countInt if countInt else 0.0,
+            "elapsedMeanSecondFloat": aggregateDict["elapsedSumFloat"] / countInt if countInt else 0.0,
+            "elapsedP50SecondFloat": self.estimateQuantileFloat(bucketCountList, 0.50),
+            "elapsedP95SecondFloat": self.estimateQuantileFloat(bucketCountList, 0.95),
+            "elapsedP99SecondFloat": self.estimateQuantileFloat(bucketCountList, 0.99),
+        }
+
+    def getSummaryDictList(self, includeHostTotalBool: bool = True) -> List[Dict[str, Any]]:
+        """Returns one summary per host and status, plus a status "all" roll-up per host."""
+        aggregateItemList = self.snapshotAggregateItemList()
+
+        summaryDictList = []
+        hostTotalDict: Dict[str, Dict[str, Any]] = {}
+        for (hostStr, statusStr), aggregateDict in aggregateItemList:
+            summaryDictList.append(self.buildSummaryDict(hostStr, statusStr, aggregateDict))
+            totalDict = hostTotalDict.setdefault(hostStr, self.buildAggregateDict())
+            totalDict["countInt"] += aggregateDict["countInt"]
+            totalDict["errorCountInt"] += aggregateDict["errorCountInt"]
+            totalDict["elapsedSumFloat"] += aggregateDict["elapsedSumFloat"]
+            totalDict["bucketCountList"] = [
+                leftCountInt + rightCountInt
+                for leftCountInt, rightCountInt in zip(totalDict["bucketCountList"], aggregateDict["bucketCountList"])
+            ]
+        if includeHostTotalBool:
+            for hostStr, totalDict in hostTotalDict.items():
+                summaryDictList.append(self.buildSummaryDict(hostStr, self.allStatusStr, totalDict))
+        return summaryDictList
+
+    def dumpJsonStr(self, indentInt: Optional[int] = 2) -> str:
+        return json.dumps({"summaryList": self.getSummaryDictList()}, indent=indentInt)
+
+    def escapeLabelStr(self, labelStr: str) -> str:
+        return labelStr.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+    def formatPrometheusFloatStr(self, valueFloat: float) -> str:
+        if math.isinf(valueFloat):
+            return "+Inf"
+        return repr(float(valueFloat))
+
+    def dumpPrometheusStr(self, metricPrefixStr: str = "remote_request") -> str:
+        """Renders the aggregates in the Prometheus text exposition format."""
+        aggregateItemList = self.snapshotAggregateItemList()
+
+        durationNameStr = f"{metricPrefixStr}_duration_seconds"
+        errorNameStr = f"{metricPrefixStr}_errors_total"
+        durationLineList = [
+            f"# HELP {durationNameStr} Remote request latency by host and status.",
+            f"# TYPE {durationNameStr} histogram",
+        ]
+        errorLineList = [
+            f"# HELP {errorNameStr} Failed remote requests by host and status.",
+            f"# TYPE {errorNameStr} counter",
+        ]
+        boundList = self.latencyBucketSecondsList + [math.inf]
+        for (hostStr, statusStr), aggregateDict in aggregateItemList:
+            labelStr = f"host=\"{self.escapeLabelStr(hostStr)}\",status=\"{self.escapeLabelStr(statusStr)}\""
+            cumulativeCountInt = 0
+            for boundFloat, bucketCountInt in zip(boundList, aggregateDict["bucketCountList"]):
+                cumulativeCountInt += bucketCountInt
+                durationLineList.append(
+                    f"{durationNameStr}_bucket{{{labelStr},le=\"{self.formatPrometheusFloatStr(boundFloat)}\"}} {cumulativeCountInt}"
+                )
+            durationLineList.append(f"{durationNameStr}_sum{{{labelStr}}} {self.formatPrometheusFloatStr(aggregateDict['elapsedSumFloat'])}")
+            durationLineList.append(f"{durationNameStr}_count{{{labelStr}}} {aggregateDict['countInt']}")
+            errorLineList.append(f"{errorNameStr}{{{labelStr}}} {aggregateDict['errorCountInt']}")
+        return "\n".join(durationLineList + errorLineList) + "\n"
@@ -1,7 +1,6 @@
+import importlib
 import re
 
-import pandas as pd
-
 
 NETFLIX_MIN_DURATION_SECONDS = 5.0 / 6.0
 NETFLIX_MAX_DURATION_SECONDS = 7.0
@@ -13,6 +12,10 @@ NETFLIX_READING_SPEED_CHILD_CPS_INT = 17
 NETFLIX_MAX_LINE_COUNT_INT = 2
 NETFLIX_MAX_CHAR_PER_LINE_INT = 42
 NETFLIX_KOREAN_MAX_CHAR_PER_LINE_INT = 23
+NETFLIX_TOP_HEAVY_PENALTY_FLOAT = 1.0
+NETFLIX_BOTTOM_HEAVY_PENALTY_FLOAT = 0.25
+NETFLIX_NON_PUNCTUATION_BREAK_PENALTY_FLOAT = 8.0
+NETFLIX_LINE_BREAK_PUNCTUATION_TUPLE = (",", ".", ";", ":", "!", "?")
 NETFLIX_NUMBER_WORD_MAP_DICT = {
     "1": "one",
     "2": "two",
@@ -27,38 +30,177 @@ NETFLIX_NUMBER_WORD_MAP_DICT = {
 }
 
 
+NETFLIX_NUMBER_WORD_PATTERN_OBJ = re.compile(r"\b(10|[1-9])\b")
+NETFLIX_KOREAN_CHARACTER_PATTERN_OBJ = re.compile("[\uac00-\ud7af]")
+SUBTITLE_TIMING_LINE_REGEX = (
+    r"^(\d+):(\d+):(\d+),(\d+)\s*-->\s*(\d+):(\d+):(\d+),(\d+)$"
+)
+COLUMNAR_ENGINE_MIN_FRAME_COUNT_INT = 2000
+
+pd = None
+np = None
+
+
+def importColumnarModuleBool():
+    """Imports pandas and numpy on first use; returns False when they are not installed."""
+    global pd, np
+    if pd is None:
+        try:
+            pd = importlib.import_module("pandas")
+            np = importlib.import_module("numpy")
+        except ImportError:
+            pd = False
+    return bool(pd)
+
+
 class SubtitleComplianceService:
     """Enforces Netflix subtitle timing and formatting standards."""
 
-    def __init__(self, isChildProgramObj=False, framesPerSecondInt=NETFLIX_FRAMES_PER_SECOND_INT):
+    def __init__(self, isChildProgramObj=False, framesPerSecondInt=NETFLIX_FRAMES_PER_SECOND_INT, useColumnarEngineObj=None):
         self.isChildProgramObj = isChildProgramObj
+        self.useColumnarEngineObj = useColumnarEngineObj
         self.framesPerSecondInt = framesPerSecondInt
         self.minimumGapSecondsObj = NETFLIX_MIN_GAP_FRAMES_INT / max(1, framesPerSecondInt)
         self.readingSpeedCpsInt = NETFLIX_READING_SPEED_CHILD_CPS_INT if isChildProgramObj else NETFLIX_READING_SPEED_ADULT_CPS_INT
         self.syncToleranceSecondsObj = NETFLIX_SYNC_TOLERANCE_FRAMES_INT / max(1, framesPerSecondInt)
 
+    def shouldUseColumnarEngineBool(self, frameCountInt):
+        """Picks the pandas engine for large inputs unless useColumnarEngineObj forces an engine."""
+        if self.useColumnarEngineObj is False:
+            return False
+        if self.useColumnarEngineObj is None and frameCountInt < COLUMNAR_ENGINE_MIN_FRAME_COUNT_INT:
+            return False
+        return importColumnarModuleBool()
+
     def applyComplianceToSrtText(self, subtitleContentStr):
         subtitleBlockList = self.splitSubtitleBlockList(subtitleContentStr)
-        subtitleDataFrameObj = self.buildSubtitleDataFrameObj(subtitleBlockList)
-        if subtitleDataFrameObj.empty:
-            return ""
-        compliantBlockDictList = []
-        previousEndSecondsObj = 0.0
-        for subtitleBlockDict in subtitleDataFrameObj["subtitleBlockDict"]:
-            compliantSegmentDictList = self.transformBlockIntoCompliantBlockList(
-                subtitleBlockDict,
-                previousEndSecondsObj,
+        if not self.shouldUseColumnarEngineBool(len(subtitleBlockList)):
+            return self.applyComplianceSequentially(
+                subtitleBlockDict
+                for subtitleBlockDict in map(self.parseSubtitleBlockDict, subtitleBlockList)
+                if subtitleBlockDict is not None
             )
-            for compliantBlockDict in compliantSegmentDictList:
-                compliantBlockDictList.append(compliantBlockDict)
-                previousEndSecondsObj = compliantBlockDict["endSecondsObj"]
-        if not compliantBlockDictList:
+        subtitleFrameObj = self.buildSubtitleFrameObj(subtitleBlockList)
+        return self.applyComplianceToFrameObj(subtitleFrameObj)
+
+    def buildFrameBlockDict(self, indexInt, startMsInt, endMsInt, bodyStr):
+        startSecondsObj = startMsInt / 1000.0
+        endSecondsObj = endMsInt / 1000.0
+        if endSecondsObj <= startSecondsObj:
+            endSecondsObj = startSecondsObj + NETFLIX_MIN_DURATION_SECONDS
+        return {
+            "indexInt": indexInt,
+            "startSecondsObj": startSecondsObj,
+            "endSecondsObj": endSecondsObj,
+            "textLineList": [lineStr.strip() for lineStr in bodyStr.split("\n") if lineStr.strip()],
+        }
+
+    def openComplianceStream(self):
+        return SubtitleComplianceStream(self)
+
+    def applyComplianceSequentially(self, subtitleBlockDictIterable):
+        """Pure-Python engine: carries previousEndSecondsObj block by block."""
+        return self.openComplianceStream().pushBlockDictIterable(subtitleBlockDictIterable)
+
+    def buildSubtitleFrameObj(self, subtitleBlockList):
+        """Parses SRT blocks into indexInt / startMsObj / endMsObj / textLineList columns with bulk timestamp parsing."""
+        columnNameList = ["indexInt", "startMsObj", "endMsObj", "textLineList"]
+        blockSeriesObj = pd.Series(subtitleBlockList, dtype=object)
+        if blockSeriesObj.empty:
+            return pd.DataFrame(columns=columnNameList)
+        blockPartObj = blockSeriesObj.str.split("\n", n=2, expand=True).reindex(columns=[0, 1, 2])
+        timingPartObj = blockPartObj[1].fillna("").str.strip().str.extract(SUBTITLE_TIMING_LINE_REGEX).astype(float)
+        validMaskObj = blockPartObj[2].notna() & timingPartObj.notna().all(axis=1)
+        blockPartObj = blockPartObj[validMaskObj]
+        timingPartObj = timingPartObj[validMaskObj].to_numpy(dtype=np.int64)
+        if not len(blockPartObj):
+            return pd.DataFrame(columns=columnNameList)
+
+        millisecondWeightArray = np.array([3600000, 60000, 1000, 1], dtype=np.int64)
+        startMsArray = (timingPartObj[:, :4] * millisecondWeightArray).sum(axis=1).astype(np.float64)
+        endMsArray = (timingPartObj[:, 4:] * millisecondWeightArray).sum(axis=1).astype(np.float64)
+        endMsArray = np.where(endMsArray <= startMsArray, startMsArray + NETFLIX_MIN_DURATION_SECONDS * 1000.0, endMsArray)
+        indexSeriesObj = pd.to_numeric(blockPartObj[0].str.strip(), errors="coerce")
+        indexSeriesObj = indexSeriesObj.where(indexSeriesObj % 1 == 0, 0).fillna(0).astype(np.int64)
+        return pd.DataFrame(
+            {
+                "indexInt": indexSeriesObj.to_numpy(),
+                "startMsObj": startMsArray,
+                "endMsObj": endMsArray,
+                "textLineList": [
+                    [lineStr.strip() for lineStr in textStr.split("\n") if lineStr.strip()]
+                    for textStr in blockPartObj[2]
+                ],
+            }
+        )
+
+    def applyComplianceToFrameObj(self, subtitleFrameObj):
+        """Columnar compliance pass; segment starts are C + max(gap, cummax(anchor - C)) with C the prefix sum of duration + gap."""
+        if subtitleFrameObj.empty:
+            return ""
+        bodySeriesObj = pd.Series(
+            [self.normalizeSubtitleBodyStr(textLineList) for textLineList in subtitleFrameObj["textLineList"]],
+            dtype=object,
+        )
+        bodySeriesObj = bodySeriesObj.str.replace(NETFLIX_NUMBER_WORD_PATTERN_OBJ, self.replaceNumberWordStr, regex=True)
+        segmentFrameObj = pd.DataFrame(
+            {
+                "framePositionInt": np.arange(len(subtitleFrameObj)),
+                "textLineList": [
+                    self.groupLinesIntoSegmentLineListList(self.wrapTextIntoCompliantLineList(bodyStr))
+                    for bodyStr in bodySeriesObj
+                ],
+            }
+        ).explode("textLineList", ignore_index=True)
+        segmentFrameObj = segmentFrameObj[segmentFrameObj["textLineList"].notna()].reset_index(drop=True)
+        if segmentFrameObj.empty:
             return ""
-        compliantDataFrameObj = pd.DataFrame(compliantBlockDictList)
-        compliantDataFrameObj["indexInt"] = range(1, len(compliantDataFrameObj) + 1)
-        compliantDataFrameObj["subtitleBlockStr"] = compliantDataFrameObj.apply(self.renderSubtitleBlockStr, axis=1)
-        compliantSubtitleList = compliantDataFrameObj["subtitleBlockStr"].tolist()
-        return "\n\n".join(compliantSubtitleList)
+
+        framePositionArray = segmentFrameObj["framePositionInt"].to_numpy(dtype=np.int64)
+        segmentCharCountArray = np.fromiter(
+            (len(" ".join(segmentLineList)) for segmentLineList in segmentFrameObj["textLineList"]),
+            dtype=np.int64,
+            count=len(segmentFrameObj),
+        )
+        segmentCharCountArray[segmentCharCountArray <= 0] = NETFLIX_MAX_LINE_COUNT_INT
+        durationMsArray = np.maximum(
+            NETFLIX_MIN_DURATION_SECONDS * 1000.0,
+            segmentCharCountArray * 1000.0 / max(1, self.readingSpeedCpsInt),
+        )
+        durationMsArray = np.minimum(durationMsArray + self.syncToleranceSecondsObj * 1000.0, NETFLIX_MAX_DURATION_SECONDS * 1000.0)
+
+        gapMsFloat = self.minimumGapSecondsObj * 1000.0
+        isFirstSegmentArray = np.r_[True, framePositionArray[1:] != framePositionArray[:-1]]
+        anchorMsArray = np.where(
+            isFirstSegmentArray,
+            subtitleFrameObj["startMsObj"].to_numpy(dtype=np.float64)[framePositionArray],
+            -np.inf,
+        )
+        offsetMsArray = np.concatenate(([0.0], np.cumsum(durationMsArray + gapMsFloat)[:-1]))
+        startMsArray = offsetMsArray + np.maximum(gapMsFloat, np.maximum.accumulate(anchorMsArray - offsetMsArray))
+        endMsArray = startMsArray + durationMsArray
+
+        startTimestampList = self.convertMsArrayToTimestampList(startMsArray)
+        endTimestampList = self.convertMsArrayToTimestampList(endMsArray)
+        return "\n\n".join(
+            f"{indexInt}\n{startTimestampStr} --> {endTimestampStr}\n" + "\n".join(segmentLineList)
+            for indexInt, startTimestampStr, endTimestampStr, segmentLineList in zip(
+                range(1, len(segmentFrameObj) + 1),
+                startTimestampList,
+                endTimestampList,
+                segmentFrameObj["textLineList"],
+            )
+        )
+
+    def convertMsArrayToTimestampList(self, millisecondArray):
+        totalMillisecondArray = np.maximum(0, np.rint(millisecondArray)).astype(np.int64)
+        hourArray, remainingArray = np.divmod(totalMillisecondArray, 3600000)
+        minuteArray, remainingArray = np.divmod(remainingArray, 60000)
+        secondArray, millisecondPartArray = np.divmod(remainingArray, 1000)
+        return [
+            "%02d:%02d:%02d,%03d" % timestampPartTuple
+            for timestampPartTuple in zip(hourArray.tolist(), minuteArray.tolist(), secondArray.tolist(), millisecondPartArray.tolist())
+        ]
 
     def splitSubtitleBlockList(self, subtitleContentStr):
         normalizedSubtitleStr = subtitleContentStr.replace("\r\n", "\n").strip()
@@ -68,6 +210,8 @@ class SubtitleComplianceService:
         return subtitleBlockList
 
     def buildSubtitleDataFrameObj(self, subtitleBlockList):
+        if not importColumnarModuleBool():
+            raise ModuleNotFoundError("pandas is required for buildSubtitleDataFrameObj. Install with: pip install pandas")
         subtitleDataFrameObj = pd.DataFrame({"subtitleBlockStr": subtitleBlockList})
         if subtitleDataFrameObj.empty:
             return subtitleDataFrameObj
@@ -132,13 +276,13 @@ class SubtitleComplianceService:
         return normalizedBodyStr.strip()
 
     def applyNumberWritingRule(self, subtitleBodyStr):
-        def replaceNumber(matchObj):
-            matchedNumberStr = matchObj.group(0)
-            return NETFLIX_NUMBER_WORD_MAP_DICT.get(matchedNumberStr, matchedNumberStr)
-
-        rewrittenSubtitleBodyStr = re.sub(r"\b(10|[1-9])\b", replaceNumber, subtitleBodyStr)
+        rewrittenSubtitleBodyStr = NETFLIX_NUMBER_WORD_PATTERN_OBJ.sub(self.replaceNumberWordStr, subtitleBodyStr)
         return rewrittenSubtitleBodyStr
 
+    def replaceNumberWordStr(self, matchObj):
+        matchedNumberStr = matchObj.group(0)
+        return NETFLIX_NUMBER_WORD_MAP_DICT.get(matchedNumberStr, matchedNumberStr)
+
     def wrapTextIntoCompliantLineList(self, subtitleBodyStr):
         if not subtitleBodyStr:
             return []
@@ -149,26 +293,122 @@ class SubtitleComplianceService:
                 # Keep dual speaker lines as-is, just trim each line
                 return [lineStr.strip() for lineStr in lineList if lineStr.strip()]
         activeLineLimitInt = self.determineLineCharacterLimitInt(subtitleBodyStr)
-        wrappedLineList = []
-        activeLineWordList = []
+        if len(subtitleBodyStr) <= activeLineLimitInt:
+            return [subtitleBodyStr]
+        wordStrList = []
         for wordStr in subtitleBodyStr.split(" "):
             if len(wordStr) > activeLineLimitInt:
-                overlongWordSegmentList = self.splitOverlongWordSegmentList(wordStr, activeLineLimitInt)
+                wordStrList.extend(self.splitOverlongWordSegmentList(wordStr, activeLineLimitInt))
             else:
-                overlongWordSegmentList = [wordStr]
-            for segmentStr in overlongWordSegmentList:
-                candidateLineStr = " ".join(activeLineWordList + [segmentStr]) if activeLineWordList else segmentStr
-                if activeLineWordList and len(candidateLineStr) > activeLineLimitInt:
-                    wrappedLineList.append(" ".join(activeLineWordList))
-                    activeLineWordList = [segmentStr]
-                else:
-                    if activeLineWordList:
-                        activeLineWordList.append(segmentStr)
-                    else:
-                        activeLineWordList = [segmentStr]
-        if activeLineWordList:
-            wrappedLineList.append(" ".join(activeLineWordList))
-        return wrappedLineList
+                wordStrList.append(wordStr)
+        lineEndIndexList = self.chooseLineEndIndexList(wordStrList, activeLineLimitInt)
+        return [
+            " ".join(wordStrList[lineStartIndexInt:lineEndIndexInt])
+            for lineStartIndexInt, lineEndIndexInt in zip([0] + lineEndIndexList, lineEndIndexList)
+        ]
+
+    def chooseLineEndIndexList(self, wordStrList, lineLimitInt):
+        """Returns the exclusive end word index of every line, running the balancing DP only when greedy wrapping overflows."""
+        wordCountInt = len(wordStrList)
+        offsetList = [0]
+        for wordStr in wordStrList:
+            offsetList.append(offsetList[-1] + len(wordStr) + 1)
+        greedyLineEndIndexList = []
+        startIndexInt = 0
+        while startIndexInt < wordCountInt and len(greedyLineEndIndexList) <= NETFLIX_MAX_LINE_COUNT_INT:
+            endIndexInt = startIndexInt + 1
+            while endIndexInt < wordCountInt and offsetList[endIndexInt + 1] - offsetList[startIndexInt] - 1 <= lineLimitInt:
+                endIndexInt += 1
+            greedyLineEndIndexList.append(endIndexInt)
+            startIndexInt = endIndexInt
+        if greedyLineEndIndexList[-1] == wordCountInt and len(greedyLineEndIndexList) <= NETFLIX_MAX_LINE_COUNT_INT:
+            if len(greedyLineEndIndexList) == 1:
+                return greedyLineEndIndexList
+            bestPairTuple = None
+            for topEndIndexInt in range(greedyLineEndIndexList[0], 0, -1):
+                topLengthInt = offsetList[topEndIndexInt] - 1
+                bottomLengthInt = offsetList[-1] - offsetList[topEndIndexInt] - 1
+                if bottomLengthInt > lineLimitInt:
+                    break
+                pairPenaltyFloat = self.getImbalancePenaltyFloat(topLengthInt, bottomLengthInt)
+                if not wordStrList[topEndIndexInt - 1].endswith(NETFLIX_LINE_BREAK_PUNCTUATION_TUPLE):
+                    pairPenaltyFloat += NETFLIX_NON_PUNCTUATION_BREAK_PENALTY_FLOAT
+                if bestPairTuple is None or pairPenaltyFloat <= bestPairTuple[0]:
+                    bestPairTuple = (pairPenaltyFloat, topEndIndexInt)
+            return [bestPairTuple[1], wordCountInt]
+
+        breakPenaltyList = [
+            0.0 if wordStr.endswith(NETFLIX_LINE_BREAK_PUNCTUATION_TUPLE) else NETFLIX_NON_PUNCTUATION_BREAK_PENALTY_FLOAT
+            for wordStr in wordStrList
+        ]
+        farthestEndIndexList = []
+        endIndexInt = 1
+        for startIndexInt in range(wordCountInt):
+            endIndexInt = max(endIndexInt, startIndexInt + 1)
+            while endIndexInt < wordCountInt and offsetList[endIndexInt + 1] - offsetList[startIndexInt] - 1 <= lineLimitInt:
+                endIndexInt += 1
+            farthestEndIndexList.append(endIndexInt)
+
+        minimumLineCountList = [0] * (wordCountInt + 1)
+        for startIndexInt in range(wordCountInt - 1, -1, -1):
+            minimumLineCountList[startIndexInt] = 1 + minimumLineCountList[farthestEndIndexList[startIndexInt]]
+        lineLimitCountInt = minimumLineCountList[0]
+
+        bestStateDictList = [None] * (wordCountInt + 1)
+        bestStateDictList[0] = {0: (0.0, 0, 0, ())}
+        for startIndexInt in range(wordCountInt):
+            if bestStateDictList[startIndexInt] is None:
+                continue
+            for lineCountInt, (penaltyFloat, _, _, _) in bestStateDictList[startIndexInt].items():
+                if startIndexInt:
+                    penaltyFloat += breakPenaltyList[startIndexInt - 1]
+                for topEndIndexInt in range(farthestEndIndexList[startIndexInt], startIndexInt, -1):
+                    if lineCountInt + 1 + minimumLineCountList[topEndIndexInt] > lineLimitCountInt:
+                        break
+                    if topEndIndexInt == wordCountInt:
+                        self.relaxLineEndState(
+                            bestStateDictList,
+                            wordCountInt,
+                            lineCountInt + 1,
+                            (penaltyFloat, startIndexInt, lineCountInt, (topEndIndexInt,)),
+                        )
+                        continue
+                    topLengthInt = offsetList[topEndIndexInt] - offsetList[startIndexInt] - 1
+                    topPenaltyFloat = penaltyFloat + breakPenaltyList[topEndIndexInt - 1]
+                    for bottomEndIndexInt in range(farthestEndIndexList[topEndIndexInt], topEndIndexInt, -1):
+                        if lineCountInt + 2 + minimumLineCountList[bottomEndIndexInt] > lineLimitCountInt:
+                            break
+                        bottomLengthInt = offsetList[bottomEndIndexInt] - offsetList[topEndIndexInt] - 1
+                        self.relaxLineEndState(
+                            bestStateDictList,
+                            bottomEndIndexInt,
+                            lineCountInt + 2,
+                            (
+                                topPenaltyFloat + self.getImbalancePenaltyFloat(topLengthInt, bottomLengthInt),
+                                startIndexInt,
+                                lineCountInt,
+                                (topEndIndexInt, bottomEndIndexInt),
+                            ),
+                        )
+        lineEndIndexList = []
+        endIndexInt = wordCountInt
+        lineCountInt = lineLimitCountInt
+        while endIndexInt:
+            _, endIndexInt, lineCountInt, segmentLineEndTuple = bestStateDictList[endIndexInt][lineCountInt]
+            lineEndIndexList[:0] = segmentLineEndTuple
+        return lineEndIndexList
+
+    def getImbalancePenaltyFloat(self, topLengthInt, bottomLengthInt):
+        if topLengthInt > bottomLengthInt:
+            return (topLengthInt - bottomLengthInt) * NETFLIX_TOP_HEAVY_PENALTY_FLOAT
+        return (bottomLengthInt - topLengthInt) * NETFLIX_BOTTOM_HEAVY_PENALTY_FLOAT
+
+    def relaxLineEndState(self, bestStateDictList, endIndexInt, lineCountInt, stateTuple):
+        bestStateDict = bestStateDictList[endIndexInt]
+        if bestStateDict is None:
+            bestStateDictList[endIndexInt] = {lineCountInt: stateTuple}
+        elif lineCountInt not in bestStateDict or stateTuple[0] < bestStateDict[lineCountInt][0]:
+            bestStateDict[lineCountInt] = stateTuple
 
     def splitOverlongWordSegmentList(self, wordStr, lineLimitInt):
         segmentList = []
@@ -182,10 +422,8 @@ class SubtitleComplianceService:
         return segmentList
 
     def determineLineCharacterLimitInt(self, subtitleBodyStr):
-        for characterStr in subtitleBodyStr:
-            characterCodeInt = ord(characterStr)
-            if 0xAC00 <= characterCodeInt <= 0xD7AF:
-                return NETFLIX_KOREAN_MAX_CHAR_PER_LINE_INT
+        if NETFLIX_KOREAN_CHARACTER_PATTERN_OBJ.search(subtitleBodyStr):
+            return NETFLIX_KOREAN_MAX_CHAR_PER_LINE_INT
         return NETFLIX_MAX_CHAR_PER_LINE_INT
 
     def groupLinesIntoSegmentLineListList(self, wrappedLineList):
@@ -269,3 +507,32 @@ class SubtitleComplianceService:
         secondsInt, millisecondsInt = divmod(remainingMillisecondsInt, 1000)
         return f"{hoursInt:02d}:{minutesInt:02d}:{secondsInt:02d},{millisecondsInt:03d}"
 
+
+
+class SubtitleComplianceStream:
+    """Incremental applyComplianceSequentially that renders compliant blocks as frames are pushed."""
+
+    def __init__(self, complianceServiceObj):
+        self.complianceServiceObj = complianceServiceObj
+        self.previousEndSecondsObj = 0.0
+        self.renderedBlockCountInt = 0
+
+    def pushBlockDict(self, subtitleBlockDict):
+        compliantSubtitleList = []
+        compliantSegmentDictList = self.complianceServiceObj.transformBlockIntoCompliantBlockList(
+            subtitleBlockDict,
+            self.previousEndSecondsObj,
+        )
+        for compliantBlockDict in compliantSegmentDictList:
+            self.renderedBlockCountInt += 1
+            compliantBlockDict["indexInt"] = self.renderedBlockCountInt
+            renderedBlockStr = self.complianceServiceObj.renderSubtitleBlockStr(compliantBlockDict)
+            compliantSubtitleList.append(renderedBlockStr if self.renderedBlockCountInt == 1 else f"\n\n{renderedBlockStr}")
+            self.previousEndSecondsObj = compliantBlockDict["endSecondsObj"]
+        return "".join(compliantSubtitleList)
+
+    def pushBlockDictIterable(self, subtitleBlockDictIterable):
+        return "".join(map(self.pushBlockDict, subtitleBlockDictIterable))
+
+    def pushFrame(self, indexInt, startMsInt, endMsInt, bodyStr):
+        return self.pushBlockDict(self.complianceServiceObj.buildFrameBlockDict(indexInt, startMsInt, endMsInt, bodyStr))
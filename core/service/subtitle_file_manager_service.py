@@ -1,20 +1,37 @@
 from datetime import datetime
 from pathlib import Path
+import itertools
 import re
 
-from core.constant import DEFAULT_CHAR_LIMIT_INT, DEFAULT_OUTPUT_FOLDER_PATH_STR
+from core.service.subtitle_wire_format_service import SubtitleWireFormatService
+from core.model.subtitle_frame_model import SubtitleFrameList
+from core.constant import (
+    SUBTITLE_PARSER_VALIDATION_FRAME_LIMIT_INT,
+    DEFAULT_OUTPUT_FOLDER_PATH_STR,
+    DEFAULT_CHAR_LIMIT_INT,
+)
 
 
 class SubtitleFileManagerService:
     emptyStr = ""
     newlineStr = "\n"
     newlineDosStr = "\r\n"
+    timecodeRegex = r"\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}"
+    srtContentPatternObj = re.compile(rf"(?m)^\s*\d+\s*\n{timecodeRegex}\s*\n.+?")
+    srtFramePatternObj = re.compile(rf"\s*\d+\s*\n{timecodeRegex}\s*\n.+?")
+    framePatternObj = re.compile(r".*?(?:\r?\n\r?\n+|$)", re.DOTALL)
     
     def __init__(self, inputFilePathStr):
         self.inputFilePathStr = inputFilePathStr
         self.subtitleTextStr = ""
         self.subtitleFrameList = []
+        self.distinctBodyList = []
+        self.frameKeyList = []
+        self.dedupSavedCharCountInt = 0
         self.currentFrameIndexInt = 0
+        self.outputFilePathObj = None
+        self.outputPartFilePathObj = None
+        self.subtitleWireFormatObj = SubtitleWireFormatService()
         
         self.emptyStr = SubtitleFileManagerService.emptyStr
         self.newlineStr = SubtitleFileManagerService.newlineStr
@@ -44,24 +61,100 @@ class SubtitleFileManagerService:
     def isSrtContent(self, subtitleTextStr):
         if not subtitleTextStr or not subtitleTextStr.strip():
             return False
-        timecodeRegex = r"\d{2}:\d{2}:\d{2},\d{3} --> \d{2}:\d{2}:\d{2},\d{3}"
-        pattern = re.compile(
-            rf"(?m)^\s*\d+\s*\n{timecodeRegex}\s*\n.+?"
-        )
-        return pattern.search(subtitleTextStr) is not None
+        return self.srtContentPatternObj.search(subtitleTextStr) is not None
 
-    def getChunkGenerator(self, charLimitInt=DEFAULT_CHAR_LIMIT_INT):
-        if not self.subtitleFrameList:
-            self.readSrtByFilename()
+    def iterateFrameStr(self):
+        """Yield frames lazily from the input file, raising ValueError when no early frame looks like SRT."""
+        if not self.inputFilePathObj.is_file():
+            raise FileNotFoundError(f"Subtitle file not found: {self.inputFilePathObj}")
+
+        pendingFrameList = []
+        validFrameSeenBool = False
+        frameLineList = []
+        with self.inputFilePathObj.open("r", encoding="utf-8-sig", newline="") as subtitleFileObj:
+            for lineStr in itertools.chain(subtitleFileObj, [self.emptyStr]):
+                if lineStr.endswith(self.newlineDosStr):
+                    self.newlineStr = self.newlineDosStr
+                if lineStr.strip():
+                    frameLineList.append(lineStr.rstrip("\r\n"))
+                    continue
+                if not frameLineList:
+                    continue
+                frameStr = "\n".join(frameLineList)
+                frameLineList = []
+                if validFrameSeenBool:
+                    yield frameStr
+                    continue
+                pendingFrameList.append(frameStr)
+                if self.srtFramePatternObj.match(frameStr):
+                    validFrameSeenBool = True
+                    yield from pendingFrameList
+                    pendingFrameList = []
+                elif len(pendingFrameList) >= SUBTITLE_PARSER_VALIDATION_FRAME_LIMIT_INT:
+                    break
+
+        if not validFrameSeenBool:
+            raise ValueError(f"File content is not valid SRT format: {self.inputFilePathObj}")
 
+    def iterateFramePartTuple(self):
+        for subtitleFrameStr in self.iterateFrameStr():
+            yield self.splitFramePartTuple(subtitleFrameStr)
+
+    def buildFrameList(self):
+        return SubtitleFrameList.fromFramePartTupleIterable(self.iterateFramePartTuple())
+
+    def buildDistinctBodyIndex(self, excludedFrameIndexSet=None, frameBodyIterable=None):
+        """Map every frame onto a distinct normalized body and return the wire characters saved."""
+        if frameBodyIterable is None:
+            if self.subtitleFrameList:
+                framePartTupleIterable = map(self.splitFramePartTuple, self.subtitleFrameList)
+            else:
+                framePartTupleIterable = self.iterateFramePartTuple()
+            frameBodyIterable = (frameBodyStr for _, _, frameBodyStr in framePartTupleIterable)
+
+        excludedFrameIndexSet = excludedFrameIndexSet or set()
+        distinctKeyDict = {}
+        self.distinctBodyList = []
+        self.frameKeyList = []
+        self.dedupSavedCharCountInt = 0
+
+        for frameIndexInt, frameBodyStr in enumerate(frameBodyIterable):
+            normalizedBodyStr = self.subtitleWireFormatObj.normalizeBodyStr(frameBodyStr)
+            if frameIndexInt in excludedFrameIndexSet or not normalizedBodyStr:
+                self.frameKeyList.append(0)
+                continue
+            frameKeyInt = distinctKeyDict.get(normalizedBodyStr)
+            if frameKeyInt is None:
+                self.distinctBodyList.append(normalizedBodyStr)
+                frameKeyInt = len(self.distinctBodyList)
+                distinctKeyDict[normalizedBodyStr] = frameKeyInt
+            else:
+                self.dedupSavedCharCountInt += len(
+                    self.subtitleWireFormatObj.buildWireFrameStr(frameKeyInt, normalizedBodyStr)
+                )
+            self.frameKeyList.append(frameKeyInt)
+
+        return self.dedupSavedCharCountInt
+
+    def getFrameKeyInt(self, frameIndexInt):
+        return self.frameKeyList[frameIndexInt]
+
+    def getChunkGenerator(self, charLimitInt=DEFAULT_CHAR_LIMIT_INT, excludedFrameIndexSet=None, chunkSizeProviderObj=None):
+        if excludedFrameIndexSet is not None or not self.frameKeyList:
+            self.buildDistinctBodyIndex(excludedFrameIndexSet)
         self.currentFrameIndexInt = 0
 
-        while self.currentFrameIndexInt < len(self.subtitleFrameList):
+        while self.currentFrameIndexInt < len(self.distinctBodyList):
             chunkFrameList = []
             currentCharCountInt = 0
-
-            while self.currentFrameIndexInt < len(self.subtitleFrameList):
-                subtitleFrameStr = self.subtitleFrameList[self.currentFrameIndexInt]
+            if chunkSizeProviderObj:
+                charLimitInt = chunkSizeProviderObj()
+
+            while self.currentFrameIndexInt < len(self.distinctBodyList):
+                subtitleFrameStr = self.subtitleWireFormatObj.buildWireFrameStr(
+                    self.currentFrameIndexInt + 1,
+                    self.distinctBodyList[self.currentFrameIndexInt],
+                )
                 projectedLengthInt = currentCharCountInt + len(subtitleFrameStr)
 
                 if projectedLengthInt > charLimitInt and chunkFrameList:
@@ -79,11 +172,25 @@ class SubtitleFileManagerService:
     def splitIntoFrame(self, subtitleTextStr):
         if not subtitleTextStr.strip():
             return []
-        subtitleFrameList = re.findall(r".*?(?:\r?\n\r?\n+|$)", subtitleTextStr, flags=re.DOTALL)
+        subtitleFrameList = self.framePatternObj.findall(subtitleTextStr)
         subtitleFrameList = [frameStr for frameStr in subtitleFrameList if frameStr.strip()]
         return subtitleFrameList
 
-    def writeSubtitleTextToFile(self, subtitleTextStr, outputFolderPathStr=DEFAULT_OUTPUT_FOLDER_PATH_STR, preFixStr="", postFixStr=""):
+    def splitFramePartTuple(self, subtitleFrameStr):
+        indexStr = ""
+        timecodeStr = ""
+        bodyLineList = []
+        for lineStr in subtitleFrameStr.strip().splitlines():
+            strippedLineStr = lineStr.strip()
+            if not timecodeStr and "-->" in strippedLineStr:
+                timecodeStr = strippedLineStr
+            elif not timecodeStr and strippedLineStr.isdigit():
+                indexStr = strippedLineStr
+            elif strippedLineStr:
+                bodyLineList.append(strippedLineStr)
+        return indexStr, timecodeStr, "\n".join(bodyLineList)
+
+    def buildOutputFilePathObj(self, outputFolderPathStr=DEFAULT_OUTPUT_FOLDER_PATH_STR, preFixStr="", postFixStr=""):
         outputFolderPathObj = Path(outputFolderPathStr)
         outputFolderPathObj.mkdir(parents=True, exist_ok=True)
         timestampStr = datetime.now().strftime("%Y-%m-%d--%H-%M")
@@ -92,12 +199,15 @@ class SubtitleFileManagerService:
         if preFixStr:
             preFixStr = f"{preFixStr}-"
         outputFileNameStr = f"{preFixStr}{self.inputBaseNameStr}{postFixStr}-{timestampStr}.srt"
-        outputFilePathObj = outputFolderPathObj / outputFileNameStr
-        outputFilePathObj.write_text(f"{subtitleTextStr}", encoding="utf-8")
-        return str(outputFilePathObj)
-    
-    def write(self, *args, **kwargs):
-        return self.writeSubtitleTextToFile(*args, **kwargs)
-
-
-
+        return outputFolderPathObj / outputFileNameStr
+
+    def openSubtitleTextStream(self, outputFolderPathStr=DEFAULT_OUTPUT_FOLDER_PATH_STR, preFixStr="", postFixStr=""):
+        """Opens a .part file next to the output path for incremental writes."""
+        self.outputFilePathObj = self.buildOutputFilePathObj(outputFolderPathStr, preFixStr, postFixStr)
+        self.outputPartFilePathObj = self.outputFilePathObj.with_name(f"{self.outputFilePathObj.name}.part")
+        return self.outputPartFilePathObj.open("w", encoding="utf-8")
+
+    def closeSubtitleTextStream(self, outputFileObj):
+        outputFileObj.close()
+        self.outputPartFilePathObj.replace(self.outputFilePathObj)
+        return str(self.outputFilePathObj)
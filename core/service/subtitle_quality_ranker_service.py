@@ -0,0 +1,83 @@
+from typing import Dict, List
+from statistics import median
+from pathlib import Path
+import re
+
+from core.constant import (
+    SUBTITLE_QUALITY_WEIGHT_DICT,
+    SUBTITLE_QUALITY_MAX_CPS_INT,
+)
+
+
+class SubtitleQualityRankerService:
+    """Scores downloaded subtitle candidates against each other."""
+
+    timecodePatternObj = re.compile(
+        r"(\d{1,2}):(\d{2}):(\d{2})[,.](\d{3})[ \t]*-->[ \t]*(\d{1,2}):(\d{2}):(\d{2})[,.](\d{3})[^\n]*\n"
+    )
+    frameSeparatorPatternObj = re.compile(r"\n[ \t]*\n")
+    hearingImpairedPatternObj = re.compile(r"\[[^\]]*\]|\([^)]*\)|♪|^[A-Z][A-Z .'-]{1,30}:", re.MULTILINE)
+    markupPatternObj = re.compile(r"<[^>]+>|\{[^}]*\}")
+
+    def __init__(self, maxCharacterPerSecondInt=SUBTITLE_QUALITY_MAX_CPS_INT, weightDict=None):
+        self.maxCharacterPerSecondInt = maxCharacterPerSecondInt
+        self.weightDict = dict(SUBTITLE_QUALITY_WEIGHT_DICT, **(weightDict or {}))
+
+    def convertTimecodeGroupToMsInt(self, groupTuple):
+        hourStr, minuteStr, secondStr, millisecondStr = groupTuple
+        return ((int(hourStr) * 60 + int(minuteStr)) * 60 + int(secondStr)) * 1000 + int(millisecondStr)
+
+    def measureSubtitleFileDict(self, filePathStr):
+        subtitleTextStr = Path(filePathStr).read_text(encoding="utf-8", errors="replace").replace("\r\n", "\n")
+        frameCountInt = 0
+        lastEndMsInt = 0
+        cpsViolationCountInt = 0
+        hearingImpairedCountInt = 0
+        for matchObj in self.timecodePatternObj.finditer(subtitleTextStr):
+            startMsInt = self.convertTimecodeGroupToMsInt(matchObj.group(1, 2, 3, 4))
+            endMsInt = self.convertTimecodeGroupToMsInt(matchObj.group(5, 6, 7, 8))
+            separatorMatchObj = self.frameSeparatorPatternObj.search(subtitleTextStr, matchObj.end())
+            bodyStr = subtitleTextStr[matchObj.end():separatorMatchObj.start() if separatorMatchObj else len(subtitleTextStr)]
+            frameCountInt += 1
+            lastEndMsInt = max(lastEndMsInt, endMsInt)
+            if self.hearingImpairedPatternObj.search(bodyStr):
+                hearingImpairedCountInt += 1
+            characterCountInt = len(self.markupPatternObj.sub("", bodyStr).replace("\n", ""))
+            durationMsInt = endMsInt - startMsInt
+            if durationMsInt <= 0 or characterCountInt * 1000 > self.maxCharacterPerSecondInt * durationMsInt:
+                cpsViolationCountInt += 1
+        return {
+            "filePathStr": str(filePathStr),
+            "frameCountInt": frameCountInt,
+            "lastEndMsInt": lastEndMsInt,
+            "cpsViolationRatioFloat": cpsViolationCountInt / frameCountInt if frameCountInt else 1.0,
+            "hearingImpairedRatioFloat": hearingImpairedCountInt / frameCountInt if frameCountInt else 1.0,
+        }
+
+    def scoreAgainstReferenceFloat(self, valueInt, referenceFloat):
+        if valueInt <= 0 or referenceFloat <= 0:
+            return 0.0
+        return min(valueInt, referenceFloat) / max(valueInt, referenceFloat)
+
+    def rankSubtitleFileList(self, filePathList) -> List[Dict]:
+        """Returns one metric dict per readable file, best scoreFloat first."""
+        measuredDictList = []
+        for filePathStr in filePathList:
+            try:
+                measuredDictList.append(self.measureSubtitleFileDict(filePathStr))
+            except OSError as errorObj:
+                print(f"Skipping unreadable subtitle candidate {filePathStr}: {errorObj}")
+        if not measuredDictList:
+            return []
+
+        referenceFrameCountFloat = median(measuredDict["frameCountInt"] for measuredDict in measuredDictList)
+        referenceEndMsFloat = median(measuredDict["lastEndMsInt"] for measuredDict in measuredDictList)
+        for measuredDict in measuredDictList:
+            measuredDict["coverageFloat"] = self.scoreAgainstReferenceFloat(measuredDict["lastEndMsInt"], referenceEndMsFloat)
+            measuredDict["scoreFloat"] = (
+                self.weightDict["frameCount"] * self.scoreAgainstReferenceFloat(measuredDict["frameCountInt"], referenceFrameCountFloat)
+                + self.weightDict["coverage"] * measuredDict["coverageFloat"]
+                + self.weightDict["cps"] * (1.0 - measuredDict["cpsViolationRatioFloat"])
+                + self.weightDict["hearingImpaired"] * (1.0 - measuredDict["hearingImpairedRatioFloat"])
+            )
+        return sorted(measuredDictList, key=lambda measuredDict: measuredDict["scoreFloat"], reverse=True)
@@ -1,17 +1,34 @@
-import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from urllib import parse
+import itertools
+import threading
+import weakref
+import tempfile
+import zipfile
+import asyncio
+import json
+import zlib
+import os
 
 from core.constant import (
+    SUBTITLE_QUALITY_CANDIDATE_LIMIT_INT,
+    SUBTITLE_ARCHIVE_MEMBER_SUFFIX_LIST,
+    SUBTITLE_DOWNLOAD_MAX_BYTE_COUNT_INT,
+    SUBTITLE_DOWNLOAD_BLOCK_SIZE_INT,
+    REMOTE_FETCH_CONCURRENCY_LIMIT_INT,
+    REMOTE_FETCH_PER_HOST_LIMIT_INT,
     DEFAULT_INPUT_FOLDER_PATH_STR,
     REMOTE_SUBTITLE_FORMAT_DEFAULT_STR,
     REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR,
     SUBTITLE_SEARCH_ENDPOINT_STR,
 )
 
+from core.service.subtitle_quality_ranker_service import SubtitleQualityRankerService
+from core.service.subtitle_search_cache_service import SubtitleSearchCacheService
 from core.service.subtitle_file_manager_service import SubtitleFileManagerService
 from core.wrapper.user_agent_wrapper import ChromeForTestingUserAgentWrapper
+from core import logger
 
 class SubtitleRemoteFetcherService:
     def __init__(
@@ -19,12 +36,22 @@ class SubtitleRemoteFetcherService:
         inputFolderPathStr=DEFAULT_INPUT_FOLDER_PATH_STR,
         verboseBool=False,
         requestTimeoutSecondsInt=None,
+        concurrencyLimitInt=REMOTE_FETCH_CONCURRENCY_LIMIT_INT,
+        perHostLimitInt=REMOTE_FETCH_PER_HOST_LIMIT_INT,
     ):
         self.subtitleFileManager = SubtitleFileManagerService(inputFolderPathStr)
         self.remoteProxyObj = ChromeForTestingUserAgentWrapper(
             verboseBool=verboseBool,
             requestTimeoutSecondsInt=requestTimeoutSecondsInt,
         )
+        self.concurrencyLimitInt = max(1, int(concurrencyLimitInt))
+        self.perHostLimitInt = max(1, int(perHostLimitInt))
+        self.loopSemaphoreDict = weakref.WeakKeyDictionary()
+        self.fetchExecutorObj = ThreadPoolExecutor(max_workers=self.concurrencyLimitInt, thread_name_prefix="subtitle-fetch")
+        self.subtitleSearchCacheObj = SubtitleSearchCacheService()
+        self.subtitleQualityRankerObj = SubtitleQualityRankerService()
+        self.revalidatingUrlSet = set()
+        self.revalidatingLockObj = threading.Lock()
 
     def downloadFirstAvailableSubtitle(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, indexInt=0):
         subtitleDictList = self.fetchSubtitleDictList(imdbIdStr, seasonNumberInt, episodeNumberInt, languageCodeStr, formatTypeStr)
@@ -36,23 +63,201 @@ class SubtitleRemoteFetcherService:
         return self.downloadSubtitleAsset(fileUrlStr, fileNameStr)
 
     def downloadTopThreeSubtitle(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR):
+        """Blocking variant that downloads the picks on the fetch thread pool without starting an event loop."""
         subtitleDictList = self.fetchSubtitleDictList(imdbIdStr, seasonNumberInt, episodeNumberInt, languageCodeStr, formatTypeStr)
         topThreeSubtitleDictList = self.getThreeMostDifferentSubs(subtitleDictList)
-        
-        downloadedFilePathList = []
-        for subtitleIndexInt, subtitleDict in enumerate(topThreeSubtitleDictList):
-            fileUrlStr = subtitleDict.get("url") or ""
-            fileNameStr = subtitleDict.get("fileName") or self.buildDefaultFileNameStr(f"{imdbIdStr}_{subtitleIndexInt}", formatTypeStr)
+        episodeIdentifierStr = self.buildEpisodeIdentifierStr(imdbIdStr, seasonNumberInt, episodeNumberInt)
+
+        downloadFutureList = [
+            self.fetchExecutorObj.submit(
+                self.downloadSubtitleAsset,
+                subtitleDict.get("url") or "",
+                subtitleDict.get("fileName") or self.buildDefaultFileNameStr(f"{episodeIdentifierStr}_{subtitleIndexInt}", formatTypeStr),
+            )
+            for subtitleIndexInt, subtitleDict in enumerate(topThreeSubtitleDictList)
+        ]
+        downloadResultList = []
+        for downloadFutureObj in downloadFutureList:
             try:
-                downloadedFilePathStr = self.downloadSubtitleAsset(fileUrlStr, fileNameStr)
-                downloadedFilePathList.append(downloadedFilePathStr)
-                print(f"Downloaded ({subtitleIndexInt + 1}/3): {downloadedFilePathStr}")
+                downloadResultList.append(downloadFutureObj.result())
             except Exception as errorObj:
-                print(f"Failed to download subtitle {subtitleIndexInt + 1}: {errorObj}")
-        
+                downloadResultList.append(errorObj)
+        return self.collectDownloadedFilePathList(downloadResultList)
+
+    def collectDownloadedFilePathList(self, downloadResultList):
+        downloadedFilePathList = []
+        for subtitleIndexInt, downloadResultObj in enumerate(downloadResultList):
+            if isinstance(downloadResultObj, Exception):
+                print(f"Failed to download subtitle {subtitleIndexInt + 1}: {downloadResultObj}")
+                continue
+            downloadedFilePathList.append(downloadResultObj)
+            print(f"Downloaded ({subtitleIndexInt + 1}/{len(downloadResultList)}): {downloadResultObj}")
         return downloadedFilePathList
-    
+
+    def getSemaphoreTuple(self, urlStr):
+        """Returns the (per-host, global) semaphores of the running event loop."""
+        loopObj = asyncio.get_running_loop()
+        loopSemaphoreDict = self.loopSemaphoreDict.get(loopObj)
+        if loopSemaphoreDict is None:
+            loopSemaphoreDict = {"fetchSemaphoreObj": asyncio.Semaphore(self.concurrencyLimitInt), "hostSemaphoreDict": {}}
+            self.loopSemaphoreDict[loopObj] = loopSemaphoreDict
+        hostStr = parse.urlsplit(urlStr).netloc.lower()
+        hostSemaphoreObj = loopSemaphoreDict["hostSemaphoreDict"].get(hostStr)
+        if hostSemaphoreObj is None:
+            hostSemaphoreObj = asyncio.Semaphore(self.perHostLimitInt)
+            loopSemaphoreDict["hostSemaphoreDict"][hostStr] = hostSemaphoreObj
+        return hostSemaphoreObj, loopSemaphoreDict["fetchSemaphoreObj"]
+
+    async def runLimited(self, urlStr, functionObj, *args):
+        """Runs a blocking remote call in a worker thread under the per-host, then the global cap."""
+        hostSemaphoreObj, fetchSemaphoreObj = self.getSemaphoreTuple(urlStr)
+        async with hostSemaphoreObj:
+            async with fetchSemaphoreObj:
+                return await asyncio.get_running_loop().run_in_executor(self.fetchExecutorObj, functionObj, *args)
+
+    def close(self):
+        """Shuts down the fetch thread pool, waiting for running downloads and dropping queued ones."""
+        self.fetchExecutorObj.shutdown(wait=True, cancel_futures=True)
+
+    async def aclose(self):
+        """Awaitable close() that waits for the fetch threads off the event loop."""
+        await asyncio.to_thread(self.close)
+
+    async def fetchSubtitleDictListAsync(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR):
+        return await self.runLimited(
+            self.buildSearchUrlStr(imdbIdStr, seasonNumberInt, episodeNumberInt),
+            self.fetchSubtitleDictList,
+            imdbIdStr,
+            seasonNumberInt,
+            episodeNumberInt,
+            languageCodeStr,
+            formatTypeStr,
+        )
+
+    async def downloadSubtitleAssetAsync(self, fileUrlStr, destinationFileNameStr):
+        return await self.runLimited(fileUrlStr or "", self.downloadSubtitleAsset, fileUrlStr, destinationFileNameStr)
+
+    async def downloadFirstAvailableSubtitleAsync(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, indexInt=0):
+        subtitleDictList = await self.fetchSubtitleDictListAsync(imdbIdStr, seasonNumberInt, episodeNumberInt, languageCodeStr, formatTypeStr)
+        if not subtitleDictList:
+            raise FileNotFoundError("No subtitles available for the provided criteria.")
+        firstSubtitleDict = subtitleDictList[indexInt]
+        fileUrlStr = firstSubtitleDict.get("url") or ""
+        fileNameStr = firstSubtitleDict.get("fileName") or self.buildDefaultFileNameStr(
+            self.buildEpisodeIdentifierStr(imdbIdStr, seasonNumberInt, episodeNumberInt),
+            formatTypeStr,
+        )
+        return await self.downloadSubtitleAssetAsync(fileUrlStr, fileNameStr)
+
+    async def downloadTopThreeSubtitleAsync(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR):
+        subtitleDictList = await self.fetchSubtitleDictListAsync(imdbIdStr, seasonNumberInt, episodeNumberInt, languageCodeStr, formatTypeStr)
+        topThreeSubtitleDictList = self.getThreeMostDifferentSubs(subtitleDictList)
+        episodeIdentifierStr = self.buildEpisodeIdentifierStr(imdbIdStr, seasonNumberInt, episodeNumberInt)
+
+        downloadResultList = await asyncio.gather(
+            *(
+                self.downloadSubtitleAssetAsync(
+                    subtitleDict.get("url") or "",
+                    subtitleDict.get("fileName") or self.buildDefaultFileNameStr(f"{episodeIdentifierStr}_{subtitleIndexInt}", formatTypeStr),
+                )
+                for subtitleIndexInt, subtitleDict in enumerate(topThreeSubtitleDictList)
+            ),
+            return_exceptions=True,
+        )
+        return self.collectDownloadedFilePathList(downloadResultList)
+
+    async def downloadBestSubtitleAsync(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, candidateLimitInt=SUBTITLE_QUALITY_CANDIDATE_LIMIT_INT):
+        """Downloads diverse candidates under unique names and keeps only the best-ranked one."""
+        subtitleDictList = await self.fetchSubtitleDictListAsync(imdbIdStr, seasonNumberInt, episodeNumberInt, languageCodeStr, formatTypeStr)
+        candidateSubtitleDictList = self.getMostDifferentSubs(subtitleDictList, candidateLimitInt)
+        episodeIdentifierStr = self.buildEpisodeIdentifierStr(imdbIdStr, seasonNumberInt, episodeNumberInt)
+
+        downloadResultList = await asyncio.gather(
+            *(
+                self.downloadSubtitleAssetAsync(
+                    subtitleDict.get("url") or "",
+                    self.buildDefaultFileNameStr(f"{episodeIdentifierStr}_candidate{subtitleIndexInt}", formatTypeStr),
+                )
+                for subtitleIndexInt, subtitleDict in enumerate(candidateSubtitleDictList)
+            ),
+            return_exceptions=True,
+        )
+        candidateSubtitleDict = {}
+        for subtitleIndexInt, downloadResultObj in enumerate(downloadResultList):
+            if isinstance(downloadResultObj, Exception):
+                print(f"Failed to download candidate {subtitleIndexInt + 1}: {downloadResultObj}")
+            else:
+                candidateSubtitleDict[downloadResultObj] = candidateSubtitleDictList[subtitleIndexInt]
+
+        try:
+            rankedDictList = await asyncio.get_running_loop().run_in_executor(
+                self.fetchExecutorObj,
+                self.subtitleQualityRankerObj.rankSubtitleFileList,
+                list(candidateSubtitleDict),
+            )
+            if not rankedDictList or not rankedDictList[0]["frameCountInt"]:
+                raise FileNotFoundError("No usable subtitle candidate could be downloaded.")
+            for rankedDict in rankedDictList:
+                print(
+                    f"Candidate {rankedDict['scoreFloat']:.3f}: {rankedDict['filePathStr']} "
+                    f"({rankedDict['frameCountInt']} frames, coverage {rankedDict['coverageFloat']:.2f}, "
+                    f"cps {rankedDict['cpsViolationRatioFloat']:.2f}, hi {rankedDict['hearingImpairedRatioFloat']:.2f})"
+                )
+            winnerPathStr = rankedDictList[0]["filePathStr"]
+            winnerFileNameStr = Path(
+                candidateSubtitleDict[winnerPathStr].get("fileName") or self.buildDefaultFileNameStr(episodeIdentifierStr, formatTypeStr)
+            ).name or self.buildDefaultFileNameStr(episodeIdentifierStr, formatTypeStr)
+            destinationPathObj = self.subtitleFileManager.inputFolderPathObj / self.stripArchiveSuffixStr(winnerFileNameStr)
+            os.replace(winnerPathStr, destinationPathObj)
+            del candidateSubtitleDict[winnerPathStr]
+            return str(destinationPathObj)
+        finally:
+            for candidatePathStr in candidateSubtitleDict:
+                Path(candidatePathStr).unlink(missing_ok=True)
+
+    async def downloadSubtitleRangeDictAsync(self, imdbIdStr, seasonNumberIterable, episodeNumberIterable=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, indexInt=0):
+        """Downloads one subtitle per (season, episode) pair concurrently and returns {pair: path}."""
+        if seasonNumberIterable is None or isinstance(seasonNumberIterable, int):
+            seasonNumberIterable = [seasonNumberIterable]
+        if episodeNumberIterable is None or isinstance(episodeNumberIterable, int):
+            episodeNumberIterable = [episodeNumberIterable]
+        seasonEpisodeTupleList = list(itertools.product(seasonNumberIterable, episodeNumberIterable))
+
+        downloadResultList = await asyncio.gather(
+            *(
+                self.downloadFirstAvailableSubtitleAsync(
+                    imdbIdStr,
+                    seasonNumberInt=seasonNumberInt,
+                    episodeNumberInt=episodeNumberInt,
+                    languageCodeStr=languageCodeStr,
+                    formatTypeStr=formatTypeStr,
+                    indexInt=indexInt,
+                )
+                for seasonNumberInt, episodeNumberInt in seasonEpisodeTupleList
+            ),
+            return_exceptions=True,
+        )
+
+        downloadedFilePathDict = {}
+        for seasonEpisodeTuple, downloadResultObj in zip(seasonEpisodeTupleList, downloadResultList):
+            if isinstance(downloadResultObj, Exception):
+                print(f"Failed to download subtitle for {self.buildEpisodeIdentifierStr(imdbIdStr, *seasonEpisodeTuple)}: {downloadResultObj}")
+                continue
+            downloadedFilePathDict[seasonEpisodeTuple] = downloadResultObj
+        return downloadedFilePathDict
+
+    def buildEpisodeIdentifierStr(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None):
+        identifierStr = imdbIdStr.strip()
+        if seasonNumberInt is not None:
+            identifierStr += f"_s{int(seasonNumberInt):02d}"
+        if episodeNumberInt is not None:
+            identifierStr += f"_e{int(episodeNumberInt):02d}"
+        return identifierStr
+
     def getThreeMostDifferentSubs(self, subtitleList):
+        return self.getMostDifferentSubs(subtitleList, 3)
+
+    def getMostDifferentSubs(self, subtitleList, countInt):
         def extractSignature(sub):
             releaseStr = (sub.get("release") or "").lower()
             return {
@@ -71,13 +276,6 @@ class SubtitleRemoteFetcherService:
                 "group": releaseStr.split("-")[-1] if "-" in releaseStr else releaseStr
             }
 
-        signatures = []
-        for sub in subtitleList:
-            signatures.append({
-                "sub": sub,
-                "sig": extractSignature(sub)
-            })
-
         def differenceScore(a, b):
             score = 0
             for key in a:
@@ -85,92 +283,105 @@ class SubtitleRemoteFetcherService:
                     score += 1
             return score
 
-        selected = [signatures[0]]
+        if not subtitleList:
+            return []
 
-        while len(selected) < 3 and len(selected) < len(signatures):
-            bestCandidate = None
+        signatures = [extractSignature(sub) for sub in subtitleList]
+        cumulativeScores = [0] * len(signatures)
+        remainingIndexes = set(range(1, len(signatures)))
+        selectedIndexes = [0]
+
+        while len(selectedIndexes) < countInt and remainingIndexes:
+            lastSignature = signatures[selectedIndexes[-1]]
+            bestIndex = None
             bestScore = -1
 
-            for candidate in signatures:
-                if candidate in selected:
-                    continue
+            for candidateIndex in sorted(remainingIndexes):
+                cumulativeScores[candidateIndex] += differenceScore(signatures[candidateIndex], lastSignature)
+                if cumulativeScores[candidateIndex] > bestScore:
+                    bestScore = cumulativeScores[candidateIndex]
+                    bestIndex = candidateIndex
 
-                score = sum(
-                    differenceScore(candidate["sig"], sel["sig"])
-                    for sel in selected
-                )
+            remainingIndexes.discard(bestIndex)
+            selectedIndexes.append(bestIndex)
 
-                if score > bestScore:
-                    bestScore = score
-                    bestCandidate = candidate
+        return [subtitleList[index] for index in selectedIndexes]
 
-            if bestCandidate:
-                selected.append(bestCandidate)
+    def fetchSubtitleDictList(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, retryLimitInt=3, intervalSecFloat=1.0):
+        requestUrlStr = self.buildSearchUrlStr(imdbIdStr, seasonNumberInt, episodeNumberInt)
 
-        return [item["sub"] for item in selected]
+        subtitleDictList, cacheStateStr = self.subtitleSearchCacheObj.get(requestUrlStr)
+        if cacheStateStr == SubtitleSearchCacheService.staleStateStr:
+            self.revalidateSearchInBackground(requestUrlStr, retryLimitInt, intervalSecFloat)
+        elif cacheStateStr == SubtitleSearchCacheService.missStateStr:
+            subtitleDictList = self.requestSubtitleDictList(requestUrlStr, retryLimitInt, intervalSecFloat)
 
-    def fetchSubtitleDictList(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None, languageCodeStr=REMOTE_SUBTITLE_LANGUAGE_DEFAULT_STR, formatTypeStr=REMOTE_SUBTITLE_FORMAT_DEFAULT_STR, retryLimitInt=3, intervalSecFloat=2.0):
-        requestUrlStr = self.buildSearchUrlStr(imdbIdStr, seasonNumberInt, episodeNumberInt)
-        
-        intervalSecFloat = 1
-        retryLimitInt = 3
-        attemptInt = 0
-        while attemptInt < retryLimitInt:
-            attemptInt += 1
-            responseObj = self.remoteProxyObj.get(requestUrlStr)
-            if responseObj is None:
-                raise ConnectionError("Unable to complete subtitle search request.")
-            if not responseObj.ok:
-                raise ConnectionError("Subtitle search request failed.")
-            
-            responseTextStr = responseObj.text.strip()
-            
-            # Retry if response is empty or just "{}"
-            if not responseTextStr or responseTextStr == "{}":
-                if attemptInt < retryLimitInt:
-                    print(f"Empty response, retrying ({attemptInt}/{retryLimitInt})...")
-                    time.sleep(intervalSecFloat)
-                    continue
-                else:
-                    raise ValueError("Subtitle search response was empty after all retries.")
-            
+        if not subtitleDictList:
+            raise ValueError("Subtitle search returned no subtitles.")
+
+        normalizedLanguageCodeStr = self.normalizeLanguageCodeStr(languageCodeStr)
+        normalizedFormatTypeStr = self.normalizeFormatTypeStr(formatTypeStr)
+
+        filteredSubtitleDictList = [
+            subtitleDict for subtitleDict in subtitleDictList
+            if subtitleDict.get("language", "").lower() == normalizedLanguageCodeStr.lower()
+            and subtitleDict.get("format", "").lower() == normalizedFormatTypeStr.lower()
+        ]
+        if not filteredSubtitleDictList:
+            raise ValueError(f"No subtitles found for language='{normalizedLanguageCodeStr}' and format='{normalizedFormatTypeStr}'.")
+
+        return filteredSubtitleDictList
+
+    def requestSubtitleDictList(self, requestUrlStr, retryLimitInt=3, intervalSecFloat=1.0):
+        """Fetches the unfiltered search result list and stores it, including empty lists, in the search cache."""
+        responseObj = self.remoteProxyObj.get(
+            requestUrlStr,
+            retryLimitInt=retryLimitInt,
+            retryBackoffBaseSecondsFloat=intervalSecFloat,
+            retryOnResponseObj=self.isEmptySearchResponse,
+        )
+        if responseObj is None:
+            raise ConnectionError("Unable to complete subtitle search request.")
+        if not responseObj.ok:
+            raise ConnectionError("Subtitle search request failed.")
+
+        responseTextStr = responseObj.text.strip()
+        if not responseTextStr or responseTextStr == "{}":
+            responseTextStr = "[]"
+
+        try:
+            subtitleDictList = json.loads(responseTextStr)
+        except json.JSONDecodeError as jsonErrorObj:
+            raise ValueError("Subtitle search response could not be parsed.") from jsonErrorObj
+
+        if not isinstance(subtitleDictList, list):
+            raise ValueError("Subtitle search response was not a list.")
+
+        self.subtitleSearchCacheObj.put(requestUrlStr, subtitleDictList)
+        return subtitleDictList
+
+    def revalidateSearchInBackground(self, requestUrlStr, retryLimitInt=3, intervalSecFloat=1.0):
+        with self.revalidatingLockObj:
+            if requestUrlStr in self.revalidatingUrlSet:
+                return
+            self.revalidatingUrlSet.add(requestUrlStr)
+
+        def revalidate():
             try:
-                subtitleDictList = json.loads(responseTextStr)
-            except json.JSONDecodeError as jsonErrorObj:
-                raise ValueError("Subtitle search response could not be parsed.") from jsonErrorObj
-            
-            if not isinstance(subtitleDictList, list):
-                raise ValueError("Subtitle search response was not a list.")
-            
-            if not subtitleDictList:
-                if attemptInt < retryLimitInt:
-                    print(f"Empty list response, retrying ({attemptInt}/{retryLimitInt})...")
-                    time.sleep(intervalSecFloat)
-                    continue
-                else:
-                    raise ValueError("Subtitle search returned empty list after all retries.")
-            
-            # Filter by language and format
-            normalizedLanguageCodeStr = self.normalizeLanguageCodeStr(languageCodeStr)
-            normalizedFormatTypeStr = self.normalizeFormatTypeStr(formatTypeStr)
-            
-            filteredSubtitleDictList = [
-                subtitleDict for subtitleDict in subtitleDictList
-                if subtitleDict.get("language", "").lower() == normalizedLanguageCodeStr.lower()
-                and subtitleDict.get("format", "").lower() == normalizedFormatTypeStr.lower()
-            ]
-            
-            if not filteredSubtitleDictList:
-                if attemptInt < retryLimitInt:
-                    print(f"No subtitles matching language='{normalizedLanguageCodeStr}' and format='{normalizedFormatTypeStr}', retrying ({attemptInt}/{retryLimitInt})...")
-                    time.sleep(intervalSecFloat)
-                    continue
-                else:
-                    raise ValueError(f"No subtitles found for language='{normalizedLanguageCodeStr}' and format='{normalizedFormatTypeStr}' after all retries.")
-            
-            return filteredSubtitleDictList
-        
-        raise ValueError("Subtitle search failed after all retries.")
+                self.requestSubtitleDictList(requestUrlStr, retryLimitInt, intervalSecFloat)
+            except Exception as errorObj:
+                logger.info(f"Keeping stale subtitle search result for {requestUrlStr}: {errorObj}")
+            finally:
+                with self.revalidatingLockObj:
+                    self.revalidatingUrlSet.discard(requestUrlStr)
+
+        self.fetchExecutorObj.submit(revalidate)
+
+    def isEmptySearchResponse(self, responseObj):
+        if not responseObj.ok:
+            return False
+        responseTextStr = responseObj.text.strip()
+        return not responseTextStr or responseTextStr in ("{}", "[]")
 
     def buildSearchUrlStr(self, imdbIdStr, seasonNumberInt=None, episodeNumberInt=None):
         imdbIdentifierStr = imdbIdStr.strip()
@@ -186,19 +397,118 @@ class SubtitleRemoteFetcherService:
         encodedQueryStr = parse.urlencode(searchQueryDict)
         return f"{SUBTITLE_SEARCH_ENDPOINT_STR}?{encodedQueryStr}"
 
-    def downloadSubtitleAsset(self, fileUrlStr, destinationFileNameStr):
+    def downloadSubtitleAsset(self, fileUrlStr, destinationFileNameStr, maxByteCountInt=SUBTITLE_DOWNLOAD_MAX_BYTE_COUNT_INT):
+        """Streams a subtitle asset to disk, unpacking gzip or zip, with every size capped at maxByteCountInt."""
         if not fileUrlStr:
             raise ValueError("Subtitle entry does not include a download url.")
         sanitizedFileNameStr = Path(destinationFileNameStr).name or self.buildDefaultFileNameStr("subtitle", REMOTE_SUBTITLE_FORMAT_DEFAULT_STR)
-        destinationPathObj = self.subtitleFileManager.inputFolderPathObj / sanitizedFileNameStr
-        responseObj = self.remoteProxyObj.get(fileUrlStr)
+        destinationPathObj = self.subtitleFileManager.inputFolderPathObj / self.stripArchiveSuffixStr(sanitizedFileNameStr)
+        responseObj = self.remoteProxyObj.get(fileUrlStr, stream=True)
         if responseObj is None:
             raise ConnectionError("Unable to download subtitle asset.")
         if not responseObj.ok:
+            responseObj.close()
             raise ConnectionError("Subtitle asset download failed.")
-        destinationPathObj.write_bytes(responseObj.content)
+        contentLengthStr = responseObj.headers.get("Content-Length") or ""
+        if contentLengthStr.isdigit() and int(contentLengthStr) > maxByteCountInt:
+            responseObj.close()
+            raise ValueError(f"Subtitle asset exceeds {maxByteCountInt} bytes.")
+
+        temporaryPathList = []
+        try:
+            with responseObj, self.createTemporaryFileObj(destinationPathObj, temporaryPathList) as temporaryFileObj:
+                archiveTypeStr = self.writeResponseStream(responseObj, temporaryFileObj, maxByteCountInt)
+            if archiveTypeStr == "zip":
+                with self.createTemporaryFileObj(destinationPathObj, temporaryPathList) as temporaryFileObj:
+                    self.extractZipSubtitle(temporaryPathList[0], temporaryFileObj, maxByteCountInt)
+            os.replace(temporaryPathList[-1], destinationPathObj)
+        finally:
+            for temporaryPathObj in temporaryPathList:
+                temporaryPathObj.unlink(missing_ok=True)
         return str(destinationPathObj)
 
+    def createTemporaryFileObj(self, destinationPathObj, temporaryPathList):
+        temporaryFileObj = tempfile.NamedTemporaryFile(
+            dir=destinationPathObj.parent,
+            prefix=f".{destinationPathObj.name}.",
+            suffix=".part",
+            delete=False,
+        )
+        temporaryPathList.append(Path(temporaryFileObj.name))
+        return temporaryFileObj
+
+    def stripArchiveSuffixStr(self, fileNameStr):
+        for archiveSuffixStr in (".gz", ".zip"):
+            if fileNameStr.lower().endswith(archiveSuffixStr) and len(fileNameStr) > len(archiveSuffixStr):
+                fileNameStr = fileNameStr[: -len(archiveSuffixStr)]
+                if not Path(fileNameStr).suffix:
+                    fileNameStr += f".{REMOTE_SUBTITLE_FORMAT_DEFAULT_STR}"
+                break
+        return fileNameStr
+
+    def writeResponseStream(self, responseObj, destinationFileObj, maxByteCountInt):
+        """Writes the body block by block, gunzipping on the fly; returns "gzip", "zip" or "raw"."""
+        archiveTypeStr = None
+        decompressorObj = None
+        rawByteCountInt = 0
+        writtenByteCountInt = 0
+        for blockBytes in responseObj.iter_content(chunk_size=SUBTITLE_DOWNLOAD_BLOCK_SIZE_INT):
+            if not blockBytes:
+                continue
+            rawByteCountInt += len(blockBytes)
+            if rawByteCountInt > maxByteCountInt:
+                raise ValueError(f"Subtitle asset exceeds {maxByteCountInt} bytes.")
+            if archiveTypeStr is None:
+                if blockBytes.startswith(b"\x1f\x8b"):
+                    archiveTypeStr = "gzip"
+                    decompressorObj = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                elif blockBytes.startswith(b"PK\x03\x04"):
+                    archiveTypeStr = "zip"
+                else:
+                    archiveTypeStr = "raw"
+            if decompressorObj is None:
+                destinationFileObj.write(blockBytes)
+                continue
+            while blockBytes and not decompressorObj.eof:
+                outputBytes = decompressorObj.decompress(blockBytes, SUBTITLE_DOWNLOAD_BLOCK_SIZE_INT)
+                writtenByteCountInt += len(outputBytes)
+                if writtenByteCountInt > maxByteCountInt:
+                    raise ValueError(f"Decompressed subtitle asset exceeds {maxByteCountInt} bytes.")
+                destinationFileObj.write(outputBytes)
+                blockBytes = decompressorObj.unconsumed_tail
+        if decompressorObj is not None:
+            outputBytes = decompressorObj.flush()
+            if writtenByteCountInt + len(outputBytes) > maxByteCountInt:
+                raise ValueError(f"Decompressed subtitle asset exceeds {maxByteCountInt} bytes.")
+            destinationFileObj.write(outputBytes)
+            if not decompressorObj.eof:
+                raise ValueError("Subtitle gzip stream was truncated.")
+        return archiveTypeStr or "raw"
+
+    def extractZipSubtitle(self, archivePathObj, destinationFileObj, maxByteCountInt):
+        try:
+            archiveObj = zipfile.ZipFile(archivePathObj)
+        except zipfile.BadZipFile as zipErrorObj:
+            raise ValueError("Subtitle archive could not be opened.") from zipErrorObj
+        with archiveObj:
+            memberInfoList = [
+                memberInfoObj for memberInfoObj in archiveObj.infolist()
+                if not memberInfoObj.is_dir()
+                and Path(memberInfoObj.filename).suffix.lower() in SUBTITLE_ARCHIVE_MEMBER_SUFFIX_LIST
+            ]
+            if not memberInfoList:
+                raise ValueError("Subtitle archive does not contain a subtitle file.")
+            memberInfoObj = max(memberInfoList, key=lambda infoObj: infoObj.file_size)
+            if memberInfoObj.file_size > maxByteCountInt:
+                raise ValueError(f"Unpacked subtitle asset exceeds {maxByteCountInt} bytes.")
+            writtenByteCountInt = 0
+            with archiveObj.open(memberInfoObj) as memberFileObj:
+                for blockBytes in iter(lambda: memberFileObj.read(SUBTITLE_DOWNLOAD_BLOCK_SIZE_INT), b""):
+                    writtenByteCountInt += len(blockBytes)
+                    if writtenByteCountInt > maxByteCountInt:
+                        raise ValueError(f"Unpacked subtitle asset exceeds {maxByteCountInt} bytes.")
+                    destinationFileObj.write(blockBytes)
+
     def buildDefaultFileNameStr(self, imdbIdStr, formatTypeStr):
         normalizedFormatTypeStr = self.normalizeFormatTypeStr(formatTypeStr)
         sanitizedIdentifierStr = imdbIdStr.replace(" ", "_") or "subtitle"
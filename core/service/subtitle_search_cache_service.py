@@ -0,0 +1,132 @@
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+from pathlib import Path
+import threading
+import hashlib
+import json
+import time
+import os
+
+from core.constant import (
+    SUBTITLE_SEARCH_CACHE_PRUNE_INTERVAL_SECONDS_INT,
+    SUBTITLE_SEARCH_CACHE_MEMORY_ENTRY_LIMIT_INT,
+    SUBTITLE_SEARCH_CACHE_NEGATIVE_TTL_SECONDS_INT,
+    SUBTITLE_SEARCH_CACHE_STALE_SECONDS_INT,
+    SUBTITLE_SEARCH_CACHE_FOLDER_PATH_STR,
+    SUBTITLE_SEARCH_CACHE_TTL_SECONDS_INT,
+)
+from core import logger
+
+
+class SubtitleSearchCacheService:
+    """In-memory and on-disk cache of subtitle search results with fresh, stale and negative TTLs."""
+
+    freshStateStr = "fresh"
+    staleStateStr = "stale"
+    missStateStr = "miss"
+
+    def __init__(
+        self,
+        cacheFolderPathStr: str = SUBTITLE_SEARCH_CACHE_FOLDER_PATH_STR,
+        ttlSecondsInt: int = SUBTITLE_SEARCH_CACHE_TTL_SECONDS_INT,
+        negativeTtlSecondsInt: int = SUBTITLE_SEARCH_CACHE_NEGATIVE_TTL_SECONDS_INT,
+        staleSecondsInt: int = SUBTITLE_SEARCH_CACHE_STALE_SECONDS_INT,
+        memoryEntryLimitInt: int = SUBTITLE_SEARCH_CACHE_MEMORY_ENTRY_LIMIT_INT,
+        pruneIntervalSecondsInt: int = SUBTITLE_SEARCH_CACHE_PRUNE_INTERVAL_SECONDS_INT,
+    ):
+        self.cacheFolderPathObj = Path(cacheFolderPathStr)
+        self.ttlSecondsInt = max(0, int(ttlSecondsInt))
+        self.negativeTtlSecondsInt = max(0, int(negativeTtlSecondsInt))
+        self.staleSecondsInt = max(0, int(staleSecondsInt))
+        self.memoryEntryLimitInt = max(1, int(memoryEntryLimitInt))
+        self.pruneIntervalSecondsInt = max(0, int(pruneIntervalSecondsInt))
+        self.memoryEntryDict: "OrderedDict[str, Dict]" = OrderedDict()
+        self.lockObj = threading.Lock()
+        self.lastPrunedFloat = 0.0
+
+    def buildEntryPathObj(self, keyStr: str) -> Path:
+        return self.cacheFolderPathObj / f"{hashlib.sha256(keyStr.encode('utf-8')).hexdigest()[:32]}.json"
+
+    def rememberEntry(self, keyStr: str, entryDict: Dict) -> None:
+        with self.lockObj:
+            self.memoryEntryDict[keyStr] = entryDict
+            self.memoryEntryDict.move_to_end(keyStr)
+            while len(self.memoryEntryDict) > self.memoryEntryLimitInt:
+                self.memoryEntryDict.popitem(last=False)
+
+    def loadEntryDict(self, keyStr: str) -> Optional[Dict]:
+        with self.lockObj:
+            entryDict = self.memoryEntryDict.get(keyStr)
+            if entryDict is not None:
+                self.memoryEntryDict.move_to_end(keyStr)
+                return entryDict
+        try:
+            entryDict = json.loads(self.buildEntryPathObj(keyStr).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entryDict, dict) or entryDict.get("keyStr") != keyStr:
+            return None
+        self.rememberEntry(keyStr, entryDict)
+        return entryDict
+
+    def get(self, keyStr: str) -> Tuple[Optional[List[Dict]], str]:
+        """Returns (subtitleDictList, stateStr) where stateStr is fresh, stale or miss."""
+        entryDict = self.loadEntryDict(keyStr)
+        if entryDict is None:
+            return None, self.missStateStr
+        nowFloat = time.time()
+        if nowFloat < entryDict.get("expiresFloat", 0):
+            return entryDict.get("subtitleDictList", []), self.freshStateStr
+        if nowFloat < entryDict.get("expiresFloat", 0) + self.staleSecondsInt:
+            return entryDict.get("subtitleDictList", []), self.staleStateStr
+        return None, self.missStateStr
+
+    def put(self, keyStr: str, subtitleDictList: List[Dict]) -> None:
+        fetchedFloat = time.time()
+        ttlSecondsInt = self.ttlSecondsInt if subtitleDictList else self.negativeTtlSecondsInt
+        entryDict = {
+            "keyStr": keyStr,
+            "subtitleDictList": subtitleDictList,
+            "fetchedFloat": fetchedFloat,
+            "expiresFloat": fetchedFloat + ttlSecondsInt,
+        }
+        self.rememberEntry(keyStr, entryDict)
+        entryPathObj = self.buildEntryPathObj(keyStr)
+        temporaryPathObj = entryPathObj.with_name(f"{entryPathObj.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.cacheFolderPathObj.mkdir(parents=True, exist_ok=True)
+            temporaryPathObj.write_text(json.dumps(entryDict, ensure_ascii=False), encoding="utf-8")
+            os.replace(temporaryPathObj, entryPathObj)
+        except OSError as errorObj:
+            logger.info(f"Subtitle search cache write failed: {errorObj}")
+        if fetchedFloat - self.lastPrunedFloat >= self.pruneIntervalSecondsInt:
+            self.lastPrunedFloat = fetchedFloat
+            self.pruneExpiredEntries(fetchedFloat)
+
+    def pruneExpiredEntries(self, nowFloat: Optional[float] = None) -> int:
+        """Deletes entry files past their stale window and returns how many were removed."""
+        nowFloat = time.time() if nowFloat is None else nowFloat
+        removedCountInt = 0
+        try:
+            entryPathObjList = list(self.cacheFolderPathObj.iterdir())
+        except OSError:
+            return 0
+        for entryPathObj in entryPathObjList:
+            if entryPathObj.suffix not in (".json", ".tmp"):
+                continue
+            try:
+                deadlineFloat = entryPathObj.stat().st_mtime + self.pruneIntervalSecondsInt
+                if entryPathObj.suffix == ".json":
+                    try:
+                        entryDict = json.loads(entryPathObj.read_text(encoding="utf-8"))
+                        deadlineFloat = float(entryDict["expiresFloat"]) + self.staleSecondsInt
+                    except (ValueError, TypeError, KeyError):
+                        pass
+                if nowFloat >= deadlineFloat:
+                    entryPathObj.unlink(missing_ok=True)
+                    removedCountInt += 1
+            except OSError:
+                continue
+        if removedCountInt:
+            logger.info(f"Subtitle search cache pruned {removedCountInt} expired entries")
+        return removedCountInt
@@ -0,0 +1,51 @@
+import re
+
+from core.constant import (
+    WIRE_BODY_ESCAPED_MARKER_LINE_PATTERN_STR,
+    WIRE_BODY_MARKER_LINE_PATTERN_STR,
+    WIRE_FRAME_MARKER_TEMPLATE_STR,
+    WIRE_FRAME_MARKER_PATTERN_STR,
+    WIRE_CHECK_FRAME_KEY_INT,
+)
+
+
+class SubtitleWireFormatService:
+    """Body-only "#key" wire format sent to the translator; marker-shaped body lines are backslash-escaped."""
+
+    framePatternObj = re.compile(WIRE_FRAME_MARKER_PATTERN_STR)
+    bodyMarkerLinePatternObj = re.compile(WIRE_BODY_MARKER_LINE_PATTERN_STR)
+    bodyEscapedMarkerLinePatternObj = re.compile(WIRE_BODY_ESCAPED_MARKER_LINE_PATTERN_STR)
+    checkFrameKeyInt = WIRE_CHECK_FRAME_KEY_INT
+
+    def normalizeBodyStr(self, bodyStr):
+        lineList = [" ".join(lineStr.split()) for lineStr in (bodyStr or "").splitlines()]
+        return "\n".join(lineStr for lineStr in lineList if lineStr)
+
+    def escapeBodyStr(self, bodyStr):
+        return self.bodyMarkerLinePatternObj.sub(r"\\\1", bodyStr)
+
+    def unescapeBodyStr(self, bodyStr):
+        return self.bodyEscapedMarkerLinePatternObj.sub(r"\1", bodyStr)
+
+    def buildWireFrameStr(self, frameKeyInt, bodyStr):
+        markerStr = WIRE_FRAME_MARKER_TEMPLATE_STR.format(frameKeyInt)
+        return f"{markerStr}\n{self.escapeBodyStr(bodyStr.strip())}\n\n"
+
+    def buildWireChunkStr(self, frameBodyDict):
+        return "".join(
+            self.buildWireFrameStr(frameKeyInt, bodyStr)
+            for frameKeyInt, bodyStr in frameBodyDict.items()
+        )
+
+    def parseWireChunkDict(self, wireChunkStr):
+        """Return {frameKeyInt: bodyStr} for every marker found, keeping the first body for duplicate keys."""
+        matchList = list(self.framePatternObj.finditer(wireChunkStr or ""))
+        frameBodyDict = {}
+        for matchIndexInt, matchObj in enumerate(matchList):
+            bodyStartInt = matchObj.end()
+            bodyEndInt = matchList[matchIndexInt + 1].start() if matchIndexInt + 1 < len(matchList) else len(wireChunkStr)
+            frameKeyInt = int(matchObj.group(1))
+            if frameKeyInt in frameBodyDict:
+                continue
+            frameBodyDict[frameKeyInt] = self.normalizeBodyStr(self.unescapeBodyStr(wireChunkStr[bodyStartInt:bodyEndInt]))
+        return frameBodyDict
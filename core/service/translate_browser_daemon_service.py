@@ -0,0 +1,229 @@
+from typing import Any, Dict, Optional
+from urllib import parse
+import asyncio
+import time
+import json
+
+from core.constant import (
+    TRANSLATE_DAEMON_CONNECT_TIMEOUT_SECONDS_FLOAT,
+    TRANSLATE_DAEMON_KEEPALIVE_SECONDS_INT,
+    TRANSLATE_DAEMON_STREAM_LIMIT_INT,
+    TRANSLATE_PARALLEL_LIMIT_INT,
+    TRANSLATE_DAEMON_HOST_STR,
+    TRANSLATE_DAEMON_PORT_INT,
+    DEFAULT_TRANSLATE_URL_STR,
+    DEFAULT_CHECK_FRAME_STR,
+)
+from core import logger
+
+
+class TranslateBrowserDaemonService:
+    """Resident browser that serves pooled Google Translate tabs over a local JSON-lines socket."""
+
+    def __init__(
+        self,
+        noDriverModuleObj,
+        translateUrlStr: str = DEFAULT_TRANSLATE_URL_STR,
+        hostStr: str = TRANSLATE_DAEMON_HOST_STR,
+        portInt: int = TRANSLATE_DAEMON_PORT_INT,
+        **translateServiceKwargsDict: Any,
+    ):
+        from core.service.google_translate_service import GoogleTranslateService
+
+        self.hostStr = hostStr
+        self.portInt = portInt
+        self.translateServiceObj = GoogleTranslateService(
+            noDriverModuleObj,
+            translateUrlStr=translateUrlStr,
+            **translateServiceKwargsDict,
+        )
+        self.pageQueueObj: Optional[asyncio.Queue] = None
+        self.serverObj = None
+        self.keepAliveTaskObj = None
+        self.pageLastUsedDict = {}
+
+    async def start(self) -> None:
+        await self.translateServiceObj.start()
+        self.pageQueueObj = asyncio.Queue()
+        for pageObj in self.translateServiceObj.pagePoolList:
+            self.pageQueueObj.put_nowait(pageObj)
+        self.serverObj = await asyncio.start_server(
+            self.handleClient,
+            self.hostStr,
+            self.portInt,
+            limit=TRANSLATE_DAEMON_STREAM_LIMIT_INT,
+        )
+        self.keepAliveTaskObj = asyncio.ensure_future(self.keepPagesWarm())
+        print(
+            f"Translate daemon listening on {self.hostStr}:{self.portInt} "
+            f"with {self.pageQueueObj.qsize()} warm tabs"
+        )
+
+    async def serveForever(self) -> None:
+        await self.start()
+        try:
+            async with self.serverObj:
+                await self.serverObj.serve_forever()
+        finally:
+            await self.stop()
+
+    async def keepPagesWarm(self) -> None:
+        """Probes idle tabs one at a time and reloads the ones that stop responding."""
+        while True:
+            await asyncio.sleep(TRANSLATE_DAEMON_KEEPALIVE_SECONDS_INT)
+            for _ in range(self.pageQueueObj.qsize()):
+                try:
+                    pageObj = self.pageQueueObj.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                try:
+                    lastUsedFloat = self.pageLastUsedDict.get(self.translateServiceObj.getPageKeyObj(pageObj), 0.0)
+                    if time.monotonic() - lastUsedFloat < TRANSLATE_DAEMON_KEEPALIVE_SECONDS_INT:
+                        continue
+                    if await self.translateServiceObj.isPageReady(pageObj):
+                        continue
+                    logger.info("Translate daemon reloading a tab that failed the liveness probe")
+                    self.translateServiceObj.forgetPageState(pageObj)
+                    await pageObj.get(self.translateServiceObj.translateUrlStr)
+                    if await self.translateServiceObj.translateChunk(DEFAULT_CHECK_FRAME_STR, pageObj) is None:
+                        logger.info("Translate daemon tab still fails validation after reload")
+                except Exception as errorObj:
+                    logger.info(f"Translate daemon keep-alive failed: {errorObj}")
+                finally:
+                    self.pageQueueObj.put_nowait(pageObj)
+
+    async def handleRequest(self, requestDict: Dict) -> Dict:
+        actionStr = requestDict.get("actionStr")
+        if actionStr == "ping":
+            return {
+                "okBool": True,
+                "translateUrlStr": self.translateServiceObj.translateUrlStr,
+                "pageCountInt": len(self.translateServiceObj.pagePoolList),
+            }
+        if actionStr == "translateChunk":
+            pageObj = await self.pageQueueObj.get()
+            try:
+                translatedFrameBodyDict = await self.translateServiceObj.translateWireChunk(
+                    requestDict.get("chunkStr") or "",
+                    pageObj,
+                )
+            finally:
+                self.pageLastUsedDict[self.translateServiceObj.getPageKeyObj(pageObj)] = time.monotonic()
+                self.pageQueueObj.put_nowait(pageObj)
+            return {"okBool": True, "translatedFrameBodyDict": translatedFrameBodyDict}
+        return {"okBool": False, "errorStr": f"Unknown action: {actionStr}"}
+
+    async def handleClient(self, readerObj: asyncio.StreamReader, writerObj: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                requestLineBytes = await readerObj.readline()
+                if not requestLineBytes:
+                    break
+                try:
+                    responseDict = await self.handleRequest(json.loads(requestLineBytes))
+                except Exception as errorObj:
+                    responseDict = {"okBool": False, "errorStr": str(errorObj)}
+                writerObj.write(json.dumps(responseDict, ensure_ascii=False).encode("utf-8") + b"\n")
+                await writerObj.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writerObj.close()
+
+    async def stop(self) -> None:
+        if self.keepAliveTaskObj:
+            self.keepAliveTaskObj.cancel()
+            self.keepAliveTaskObj = None
+        if self.serverObj:
+            self.serverObj.close()
+            self.serverObj = None
+        await self.translateServiceObj.stop()
+
+
+class TranslateBrowserDaemonClient:
+    """Drop-in replacement for GoogleTranslateService that forwards chunks to a running daemon."""
+
+    def __init__(
+        self,
+        translateUrlStr: str = DEFAULT_TRANSLATE_URL_STR,
+        hostStr: str = TRANSLATE_DAEMON_HOST_STR,
+        portInt: int = TRANSLATE_DAEMON_PORT_INT,
+        parallelLimitInt: int = TRANSLATE_PARALLEL_LIMIT_INT,
+    ):
+        self.translateUrlStr = translateUrlStr
+        self.hostStr = hostStr
+        self.portInt = portInt
+        self.parallelLimitInt = max(1, int(parallelLimitInt))
+
+    def getLanguagePairTuple(self):
+        queryDict = parse.parse_qs(parse.urlparse(self.translateUrlStr).query)
+        sourceLanguageStr = (queryDict.get("sl") or ["auto"])[0]
+        targetLanguageStr = (queryDict.get("tl") or [""])[0]
+        return sourceLanguageStr, targetLanguageStr
+
+    async def openConnection(self):
+        return await asyncio.wait_for(
+            asyncio.open_connection(self.hostStr, self.portInt, limit=TRANSLATE_DAEMON_STREAM_LIMIT_INT),
+            timeout=TRANSLATE_DAEMON_CONNECT_TIMEOUT_SECONDS_FLOAT,
+        )
+
+    async def sendRequest(self, readerObj, writerObj, requestDict: Dict) -> Dict:
+        writerObj.write(json.dumps(requestDict, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writerObj.drain()
+        responseLineBytes = await readerObj.readline()
+        if not responseLineBytes:
+            raise ConnectionError("Translate daemon closed the connection")
+        responseDict = json.loads(responseLineBytes)
+        if not responseDict.get("okBool"):
+            raise RuntimeError(responseDict.get("errorStr") or "Translate daemon request failed")
+        return responseDict
+
+    async def isAvailable(self) -> bool:
+        """Return True when a daemon is listening and serves the same translate URL."""
+        try:
+            readerObj, writerObj = await self.openConnection()
+        except (OSError, asyncio.TimeoutError):
+            return False
+        try:
+            responseDict = await self.sendRequest(readerObj, writerObj, {"actionStr": "ping"})
+            return responseDict.get("translateUrlStr") == self.translateUrlStr
+        except Exception:
+            return False
+        finally:
+            writerObj.close()
+
+    async def start(self):
+        if not await self.isAvailable():
+            raise ConnectionError(f"Translate daemon is not available on {self.hostStr}:{self.portInt}")
+
+    async def translateChunkList(self, chunkIterable, onChunkCompleteObj=None):
+        chunkIteratorObj = enumerate(chunkIterable)
+        translatedChunkDict = {}
+
+        async def translateWorker():
+            readerObj, writerObj = await self.openConnection()
+            try:
+                for chunkIndexInt, chunkStr in chunkIteratorObj:
+                    startTimeFloat = time.perf_counter()
+                    responseDict = await self.sendRequest(
+                        readerObj,
+                        writerObj,
+                        {"actionStr": "translateChunk", "chunkStr": chunkStr},
+                    )
+                    elapsedSecondFloat = time.perf_counter() - startTimeFloat
+                    translatedFrameBodyDict = responseDict.get("translatedFrameBodyDict")
+                    if translatedFrameBodyDict is not None:
+                        translatedFrameBodyDict = {
+                            int(frameKeyStr): bodyStr for frameKeyStr, bodyStr in translatedFrameBodyDict.items()
+                        }
+                    translatedChunkDict[chunkIndexInt] = translatedFrameBodyDict
+                    if onChunkCompleteObj:
+                        onChunkCompleteObj(chunkIndexInt, chunkStr, translatedFrameBodyDict, elapsedSecondFloat)
+            finally:
+                writerObj.close()
+
+        await asyncio.gather(*(translateWorker() for _ in range(self.parallelLimitInt)))
+        return [translatedChunkDict[chunkIndexInt] for chunkIndexInt in sorted(translatedChunkDict)]
+
+    async def stop(self):
+        return None
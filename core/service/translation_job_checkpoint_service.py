@@ -0,0 +1,121 @@
+from typing import Dict, Optional
+from pathlib import Path
+import hashlib
+import json
+import time
+import os
+
+from core.constant import TRANSLATION_JOB_CHECKPOINT_FOLDER_PATH_STR
+from core import logger
+
+
+class TranslationJobCheckpointService:
+    """Append-only, fsynced JSONL journal of translated chunks so an interrupted job can resume."""
+
+    def __init__(
+        self,
+        sourceFilePathStr: str,
+        sourceLanguageStr: str,
+        targetLanguageStr: str,
+        checkpointFolderPathStr: str = TRANSLATION_JOB_CHECKPOINT_FOLDER_PATH_STR,
+    ):
+        self.sourceFilePathObj = Path(sourceFilePathStr)
+        self.sourceLanguageStr = sourceLanguageStr
+        self.targetLanguageStr = targetLanguageStr
+        self.sourceFileHashStr = self.buildSourceFileHashStr()
+        self.jobIdStr = hashlib.sha256(
+            f"{self.sourceFileHashStr}:{sourceLanguageStr}:{targetLanguageStr}".encode("utf-8")
+        ).hexdigest()[:16]
+        self.checkpointFolderPathObj = Path(checkpointFolderPathStr)
+        self.journalPathObj = self.checkpointFolderPathObj / f"{self.jobIdStr}.jsonl"
+        self.journalFileObj = None
+
+    def buildSourceFileHashStr(self) -> str:
+        hashObj = hashlib.sha256()
+        with self.sourceFilePathObj.open("rb") as sourceFileObj:
+            for blockBytes in iter(lambda: sourceFileObj.read(65536), b""):
+                hashObj.update(blockBytes)
+        return hashObj.hexdigest()
+
+    def buildJobHeaderDict(self) -> Dict:
+        return {
+            "type": "job",
+            "jobIdStr": self.jobIdStr,
+            "sourceFileHashStr": self.sourceFileHashStr,
+            "sourceFilePathStr": str(self.sourceFilePathObj),
+            "sourceLanguageStr": self.sourceLanguageStr,
+            "targetLanguageStr": self.targetLanguageStr,
+            "createdFloat": time.time(),
+        }
+
+    def isJournalCurrent(self) -> bool:
+        try:
+            with self.journalPathObj.open("r", encoding="utf-8") as journalFileObj:
+                headerDict = json.loads(journalFileObj.readline())
+        except (OSError, json.JSONDecodeError):
+            return False
+        return headerDict.get("sourceFileHashStr") == self.sourceFileHashStr
+
+    def load(self) -> Dict[str, str]:
+        """Return {sourceBodyStr: translatedBodyStr} from every completed chunk of a previous run."""
+        if not self.journalPathObj.is_file():
+            return {}
+        if not self.isJournalCurrent():
+            logger.info(f"Discarding stale checkpoint for job {self.jobIdStr}")
+            return {}
+        translatedBodyDict: Dict[str, str] = {}
+        completedChunkCountInt = 0
+        with self.journalPathObj.open("r", encoding="utf-8") as journalFileObj:
+            for lineStr in journalFileObj:
+                try:
+                    entryDict = json.loads(lineStr)
+                except json.JSONDecodeError:
+                    continue
+                if entryDict.get("type") == "chunk" and entryDict.get("statusStr") == "done":
+                    translatedBodyDict.update(entryDict.get("translatedBodyDict") or {})
+                    completedChunkCountInt += 1
+        if completedChunkCountInt:
+            logger.info(
+                f"Resuming job {self.jobIdStr}: {completedChunkCountInt} chunks, "
+                f"{len(translatedBodyDict)} bodies already translated"
+            )
+        return translatedBodyDict
+
+    def open(self) -> None:
+        self.checkpointFolderPathObj.mkdir(parents=True, exist_ok=True)
+        if self.journalPathObj.is_file() and not self.isJournalCurrent():
+            self.journalPathObj.unlink()
+        newJournalBool = not self.journalPathObj.is_file()
+        self.journalFileObj = self.journalPathObj.open("a", encoding="utf-8")
+        if newJournalBool:
+            self._appendEntry(self.buildJobHeaderDict())
+        elif not self.journalPathObj.read_bytes().endswith(b"\n"):
+            self.journalFileObj.write("\n")
+
+    def _appendEntry(self, entryDict: Dict) -> None:
+        self.journalFileObj.write(json.dumps(entryDict, ensure_ascii=False) + "\n")
+        self.journalFileObj.flush()
+        os.fsync(self.journalFileObj.fileno())
+
+    def recordChunk(self, chunkIndexInt: int, translatedBodyDict: Optional[Dict[str, str]]) -> None:
+        if self.journalFileObj is None:
+            self.open()
+        self._appendEntry(
+            {
+                "type": "chunk",
+                "chunkIndexInt": chunkIndexInt,
+                "statusStr": "done" if translatedBodyDict else "failed",
+                "translatedBodyDict": translatedBodyDict or {},
+                "completedFloat": time.time(),
+            }
+        )
+
+    def close(self) -> None:
+        if self.journalFileObj is not None:
+            self.journalFileObj.close()
+            self.journalFileObj = None
+
+    def complete(self) -> None:
+        self.close()
+        if self.journalPathObj.is_file():
+            self.journalPathObj.unlink()
@@ -0,0 +1,151 @@
+from typing import Dict, Iterable, Optional
+from pathlib import Path
+import threading
+import hashlib
+import sqlite3
+import time
+
+from core.constant import (
+    TRANSLATION_MEMORY_DATABASE_PATH_STR,
+    TRANSLATION_MEMORY_MAX_ENTRY_COUNT_INT,
+    TRANSLATION_MEMORY_QUERY_BATCH_SIZE_INT,
+)
+from core import logger
+
+
+class TranslationMemoryService:
+    """SQLite backed per-frame translation memory keyed by normalized source text and language pair."""
+
+    def __init__(
+        self,
+        sourceLanguageStr: str,
+        targetLanguageStr: str,
+        databasePathStr: str = TRANSLATION_MEMORY_DATABASE_PATH_STR,
+        maxEntryCountInt: int = TRANSLATION_MEMORY_MAX_ENTRY_COUNT_INT,
+    ):
+        self.sourceLanguageStr = sourceLanguageStr
+        self.targetLanguageStr = targetLanguageStr
+        self.maxEntryCountInt = max(1, int(maxEntryCountInt))
+        self.databasePathObj = Path(databasePathStr)
+        self.databasePathObj.parent.mkdir(parents=True, exist_ok=True)
+        self.lockObj = threading.Lock()
+        self.entryCountInt = 0
+        self.connectionObj = sqlite3.connect(str(self.databasePathObj), check_same_thread=False)
+        self._initializeSchema()
+
+    def _initializeSchema(self) -> None:
+        with self.lockObj:
+            self.connectionObj.execute("PRAGMA journal_mode=WAL")
+            self.connectionObj.execute("PRAGMA synchronous=NORMAL")
+            self.connectionObj.execute(
+                "CREATE TABLE IF NOT EXISTS translation_memory ("
+                "keyStr TEXT PRIMARY KEY,"
+                "sourceLanguageStr TEXT NOT NULL,"
+                "targetLanguageStr TEXT NOT NULL,"
+                "sourceTextStr TEXT NOT NULL,"
+                "translatedTextStr TEXT NOT NULL,"
+                "lastAccessedFloat REAL NOT NULL,"
+                "hitCountInt INTEGER NOT NULL DEFAULT 0)"
+            )
+            self.connectionObj.execute(
+                "CREATE INDEX IF NOT EXISTS translation_memory_last_accessed_index "
+                "ON translation_memory (lastAccessedFloat)"
+            )
+            self.connectionObj.commit()
+            self.entryCountInt = self.connectionObj.execute("SELECT COUNT(*) FROM translation_memory").fetchone()[0]
+
+    def normalizeSourceTextStr(self, sourceTextStr: str) -> str:
+        lineList = [" ".join(lineStr.split()) for lineStr in (sourceTextStr or "").splitlines()]
+        return "\n".join(lineStr for lineStr in lineList if lineStr)
+
+    def buildKeyStr(self, sourceTextStr: str) -> str:
+        keySourceStr = "\x00".join(
+            [self.sourceLanguageStr, self.targetLanguageStr, self.normalizeSourceTextStr(sourceTextStr)]
+        )
+        return hashlib.sha256(keySourceStr.encode("utf-8")).hexdigest()
+
+    def getTranslatedTextDict(self, sourceTextIterable: Iterable[str]) -> Dict[str, str]:
+        """Return {sourceTextStr: translatedTextStr} for every source text found in memory."""
+        keyToSourceTextListDict: Dict[str, list] = {}
+        for sourceTextStr in sourceTextIterable:
+            if not self.normalizeSourceTextStr(sourceTextStr):
+                continue
+            keyToSourceTextListDict.setdefault(self.buildKeyStr(sourceTextStr), []).append(sourceTextStr)
+
+        translatedTextDict: Dict[str, str] = {}
+        keyList = list(keyToSourceTextListDict)
+        batchSizeInt = TRANSLATION_MEMORY_QUERY_BATCH_SIZE_INT
+        with self.lockObj:
+            for batchStartInt in range(0, len(keyList), batchSizeInt):
+                batchKeyList = keyList[batchStartInt : batchStartInt + batchSizeInt]
+                placeholderStr = ",".join("?" * len(batchKeyList))
+                rowList = self.connectionObj.execute(
+                    f"SELECT keyStr, translatedTextStr FROM translation_memory WHERE keyStr IN ({placeholderStr})",
+                    batchKeyList,
+                ).fetchall()
+                for keyStr, translatedTextStr in rowList:
+                    for sourceTextStr in keyToSourceTextListDict[keyStr]:
+                        translatedTextDict[sourceTextStr] = translatedTextStr
+                if rowList:
+                    self.connectionObj.executemany(
+                        "UPDATE translation_memory SET lastAccessedFloat = ?, hitCountInt = hitCountInt + 1 WHERE keyStr = ?",
+                        [(time.time(), keyStr) for keyStr, _ in rowList],
+                    )
+            self.connectionObj.commit()
+        return translatedTextDict
+
+    def getTranslatedTextStr(self, sourceTextStr: str) -> Optional[str]:
+        return self.getTranslatedTextDict([sourceTextStr]).get(sourceTextStr)
+
+    def putTranslatedTextDict(self, translatedTextDict: Dict[str, str]) -> int:
+        """Store {sourceTextStr: translatedTextStr} pairs and evict rows past the cap in the same commit."""
+        nowFloat = time.time()
+        rowList = [
+            (
+                self.buildKeyStr(sourceTextStr),
+                self.sourceLanguageStr,
+                self.targetLanguageStr,
+                self.normalizeSourceTextStr(sourceTextStr),
+                translatedTextStr,
+                nowFloat,
+            )
+            for sourceTextStr, translatedTextStr in translatedTextDict.items()
+            if self.normalizeSourceTextStr(sourceTextStr) and translatedTextStr is not None
+        ]
+        if not rowList:
+            return 0
+        with self.lockObj:
+            insertedCountInt = self.connectionObj.executemany(
+                "INSERT INTO translation_memory "
+                "(keyStr, sourceLanguageStr, targetLanguageStr, sourceTextStr, translatedTextStr, lastAccessedFloat) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(keyStr) DO NOTHING",
+                rowList,
+            ).rowcount
+            if insertedCountInt < len(rowList):
+                self.connectionObj.executemany(
+                    "UPDATE translation_memory SET translatedTextStr = ?, lastAccessedFloat = ? WHERE keyStr = ?",
+                    [(rowTuple[4], rowTuple[5], rowTuple[0]) for rowTuple in rowList],
+                )
+            self.entryCountInt += insertedCountInt
+            evictedCountInt = self._evictOverflowEntries()
+            self.connectionObj.commit()
+        if evictedCountInt:
+            logger.info(f"Translation memory evicted {evictedCountInt} least recently used entries")
+        return len(rowList)
+
+    def _evictOverflowEntries(self) -> int:
+        overflowCountInt = self.entryCountInt - self.maxEntryCountInt
+        if overflowCountInt <= 0:
+            return 0
+        evictedCountInt = self.connectionObj.execute(
+            "DELETE FROM translation_memory WHERE keyStr IN ("
+            "SELECT keyStr FROM translation_memory ORDER BY lastAccessedFloat ASC LIMIT ?)",
+            (overflowCountInt,),
+        ).rowcount
+        self.entryCountInt -= evictedCountInt
+        return evictedCountInt
+
+    def close(self) -> None:
+        with self.lockObj:
+            self.connectionObj.close()
@@ -1,18 +1,24 @@
 
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 from pathlib import Path
+import threading
 import random
 import json
+import time
 
 from core.proxy.basic_remote_proxy import BasicRemoteProxy
 from core.constant import (
+	CHROME_FOR_TESTING_HTTP_CACHE_PATH_STR,
+	CHROME_USER_AGENT_GENERATE_TTL_SECONDS_INT,
 	CHROME_BUILD_SAMPLE_COUNT_INT,
 	CHROME_BUILD_SAMPLE_MAX_RANGE_INT,
 	CHROME_LAST_KNOWN_GOOD_VERSIONS_URL_STR,
 	CHROME_LATEST_PATCH_VERSIONS_URL_STR,
 	USER_AGENT_MACHINE_LIST,
 	USER_AGENT_RANDOM_OUTPUT_PATH_STR,
+	USER_AGENT_SCORE_EXPIRY_SECONDS_INT,
+	USER_AGENT_SCORE_PATH_STR,
 )
 from core import logger
 
@@ -29,6 +35,10 @@ class ChromeForTestingResult:
 
 
 class ChromeForTestingUserAgentWrapper(BasicRemoteProxy):
+	userAgentPoolList: List[str] = []
+	userAgentPoolMtimeNsInt: Optional[int] = None
+	userAgentPoolLockObj = threading.Lock()
+
 	def __init__(
 		self,
 		remoteProxyObj: Optional[BasicRemoteProxy] = None,
@@ -46,17 +56,54 @@ class ChromeForTestingUserAgentWrapper(BasicRemoteProxy):
 		self.sampleRangeMaxInt = max(1, int(sampleRangeMaxInt))
 		self.outputFilePathStr = outputFilePathStr
 
+	def _loadHttpCacheDict(self) -> Dict[str, Dict[str, Any]]:
+		httpCachePathObj = Path(CHROME_FOR_TESTING_HTTP_CACHE_PATH_STR)
+		if not httpCachePathObj.is_file():
+			return {}
+		try:
+			return json.loads(httpCachePathObj.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return {}
+
+	def _writeHttpCacheDict(self, httpCacheDict: Dict[str, Dict[str, Any]]) -> None:
+		httpCachePathObj = Path(CHROME_FOR_TESTING_HTTP_CACHE_PATH_STR)
+		httpCachePathObj.parent.mkdir(parents=True, exist_ok=True)
+		httpCachePathObj.write_text(json.dumps(httpCacheDict, ensure_ascii=False), encoding="utf-8")
+
 	def _fetchJson(self, urlStr: str) -> Dict:
-		responseObj = self.remoteProxyObj.get(urlStr)
+		"""Fetches JSON with If-None-Match / If-Modified-Since and reuses the cached body on 304."""
+		httpCacheDict = self._loadHttpCacheDict()
+		cachedEntryDict = httpCacheDict.get(urlStr) or {}
+		conditionalHeadersDict: Dict[str, str] = {}
+		if cachedEntryDict.get("etagStr"):
+			conditionalHeadersDict["If-None-Match"] = cachedEntryDict["etagStr"]
+		if cachedEntryDict.get("lastModifiedStr"):
+			conditionalHeadersDict["If-Modified-Since"] = cachedEntryDict["lastModifiedStr"]
+
+		responseObj = self.remoteProxyObj.get(urlStr, headersDict=conditionalHeadersDict or None)
 		if responseObj is None:
 			raise ConnectionError(f"Request failed: {urlStr}")
-		if not responseObj.ok:
+		if responseObj.status_code == 304 and "bodyStr" in cachedEntryDict:
+			logger.debug(f"Not modified, reusing cached response: {urlStr}")
+			responseTextStr = cachedEntryDict["bodyStr"]
+		elif not responseObj.ok:
 			raise ConnectionError(f"Request failed ({responseObj.status_code}): {urlStr}")
+		else:
+			responseTextStr = responseObj.text
 		try:
-			return json.loads(responseObj.text)
+			responseDict = json.loads(responseTextStr)
 		except json.JSONDecodeError as jsonErrorObj:
 			raise ValueError(f"Invalid JSON response: {urlStr}") from jsonErrorObj
 
+		if responseObj.status_code != 304:
+			httpCacheDict[urlStr] = {
+				"etagStr": responseObj.headers.get("ETag"),
+				"lastModifiedStr": responseObj.headers.get("Last-Modified"),
+				"bodyStr": responseTextStr,
+			}
+			self._writeHttpCacheDict(httpCacheDict)
+		return responseDict
+
 	def _parseVersionTuple(self, versionStr: str) -> Tuple[int, int, int]:
 		partsList = [int(part) for part in versionStr.split(".") if part.isdigit()]
 		while len(partsList) < 3:
@@ -105,18 +152,119 @@ class ChromeForTestingUserAgentWrapper(BasicRemoteProxy):
         urlStr: str,
         **kwargsDict: Any,
     ):
-		return super().request(methodStr, urlStr, headersDict={"User-Agent": self.getRandomUserAgent()}, **kwargsDict)
+		headersDict = {"User-Agent": self.getRandomUserAgent()}
+		headersDict.update(kwargsDict.pop("headersDict", None) or {})
+		return super().request(methodStr, urlStr, headersDict=headersDict, **kwargsDict)
+
+	def loadUserAgentPoolList(self) -> List[str]:
+		"""Returns the in-memory user agent pool, re-reading the JSON file only when its mtime changes."""
+		cls = ChromeForTestingUserAgentWrapper
+		mtimeNsInt = Path(USER_AGENT_RANDOM_OUTPUT_PATH_STR).stat().st_mtime_ns
+		if cls.userAgentPoolList and cls.userAgentPoolMtimeNsInt == mtimeNsInt:
+			return cls.userAgentPoolList
+		with cls.userAgentPoolLockObj:
+			if not cls.userAgentPoolList or cls.userAgentPoolMtimeNsInt != mtimeNsInt:
+				with open(USER_AGENT_RANDOM_OUTPUT_PATH_STR, "r", encoding="utf-8") as file:
+					userAgentData = json.load(file)
+				cls.userAgentPoolList = list(userAgentData['userAgents'])
+				cls.userAgentPoolMtimeNsInt = mtimeNsInt
+				logger.debug(f"Loaded {len(cls.userAgentPoolList)} user agents")
+		return cls.userAgentPoolList
 
 	def getRandomUserAgent(self) -> str:
 		"""Returns a random user agent from the list."""
-		randomUserAgentListPath = USER_AGENT_RANDOM_OUTPUT_PATH_STR
-		with open(randomUserAgentListPath, "r", encoding="utf-8") as file:
-			userAgentData = json.load(file)
-		randomUserAgent = random.choice(userAgentData['userAgents'])
-		logger.info(f"Random User Agent: {randomUserAgent}")
+		randomUserAgent = random.choice(self.loadUserAgentPoolList())
+		logger.debug(f"Random User Agent: {randomUserAgent}")
 		return randomUserAgent
 
-	def generate(self) -> ChromeForTestingResult:
+	def loadUserAgentScoreDict(self) -> Dict[str, Dict[str, Any]]:
+		"""Returns {userAgentStr: outcome counters}, dropping entries older than the expiry."""
+		scorePathObj = Path(USER_AGENT_SCORE_PATH_STR)
+		if not scorePathObj.is_file():
+			return {}
+		try:
+			userAgentScoreDict = json.loads(scorePathObj.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return {}
+		expiryFloat = time.time() - USER_AGENT_SCORE_EXPIRY_SECONDS_INT
+		return {
+			userAgentStr: scoreDict
+			for userAgentStr, scoreDict in userAgentScoreDict.items()
+			if isinstance(scoreDict, dict) and scoreDict.get("lastOutcomeFloat", 0) >= expiryFloat
+		}
+
+	def recordUserAgentOutcome(self, userAgentStr: str, successBool: bool) -> None:
+		userAgentScoreDict = self.loadUserAgentScoreDict()
+		scoreDict = userAgentScoreDict.setdefault(
+			userAgentStr,
+			{"successCountInt": 0, "failureCountInt": 0, "lastOutcomeFloat": 0.0},
+		)
+		if successBool:
+			scoreDict["successCountInt"] += 1
+		else:
+			scoreDict["failureCountInt"] += 1
+		scoreDict["lastOutcomeFloat"] = time.time()
+		scorePathObj = Path(USER_AGENT_SCORE_PATH_STR)
+		scorePathObj.parent.mkdir(parents=True, exist_ok=True)
+		scorePathObj.write_text(json.dumps(userAgentScoreDict, indent=2, ensure_ascii=False), encoding="utf-8")
+
+	def getUserAgentSuccessRateFloat(self, scoreDict: Optional[Dict[str, Any]]) -> float:
+		scoreDict = scoreDict or {}
+		successCountInt = scoreDict.get("successCountInt", 0)
+		failureCountInt = scoreDict.get("failureCountInt", 0)
+		return (successCountInt + 1) / (successCountInt + failureCountInt + 2)
+
+	def getScoredUserAgent(self, excludedUserAgentSet: Optional[Set[str]] = None) -> str:
+		"""Returns the user agent with the best smoothed validation success rate, ties broken randomly."""
+		userAgentList = self.loadUserAgentPoolList()
+		candidateUserAgentList = [
+			userAgentStr for userAgentStr in userAgentList
+			if userAgentStr not in (excludedUserAgentSet or set())
+		] or userAgentList
+		userAgentScoreDict = self.loadUserAgentScoreDict()
+		successRateDict = {
+			userAgentStr: self.getUserAgentSuccessRateFloat(userAgentScoreDict.get(userAgentStr))
+			for userAgentStr in candidateUserAgentList
+		}
+		bestSuccessRateFloat = max(successRateDict.values())
+		bestUserAgentList = [
+			userAgentStr for userAgentStr, successRateFloat in successRateDict.items()
+			if successRateFloat == bestSuccessRateFloat
+		]
+		scoredUserAgent = random.choice(bestUserAgentList)
+		logger.info(f"Scored User Agent ({bestSuccessRateFloat:.2f}): {scoredUserAgent}")
+		return scoredUserAgent
+
+	def _loadCachedResult(self) -> Optional[ChromeForTestingResult]:
+		outputPathObj = Path(self.outputFilePathStr)
+		if not outputPathObj.is_file():
+			return None
+		try:
+			payloadDict = json.loads(outputPathObj.read_text(encoding="utf-8"))
+		except (OSError, ValueError):
+			return None
+		generatedFloat = payloadDict.get("generatedFloat") or 0
+		if time.time() - generatedFloat > CHROME_USER_AGENT_GENERATE_TTL_SECONDS_INT:
+			return None
+		stableDict = payloadDict.get("stable") or {}
+		sampleDict = payloadDict.get("sample") or {}
+		return ChromeForTestingResult(
+			stableVersionStr=stableDict.get("version") or "",
+			stableBuildKeyStr=stableDict.get("build") or "",
+			stablePatchVersionStr=stableDict.get("patchVersion") or "",
+			sampledBuildKeysList=sampleDict.get("buildKeys") or [],
+			sampledPatchVersionsList=sampleDict.get("patchVersions") or [],
+			userAgentList=payloadDict.get("userAgents") or [],
+			outputFilePathStr=str(outputPathObj),
+		)
+
+	def generate(self, forceBool: bool = False) -> ChromeForTestingResult:
+		if not forceBool:
+			cachedResultObj = self._loadCachedResult()
+			if cachedResultObj is not None:
+				logger.debug(f"Reusing user agents generated within the last {CHROME_USER_AGENT_GENERATE_TTL_SECONDS_INT}s")
+				return cachedResultObj
+
 		versionsDict = self._fetchJson(CHROME_LAST_KNOWN_GOOD_VERSIONS_URL_STR)
 		stableChannelDict = (versionsDict.get("channels") or {}).get("Stable") or {}
 		stableVersionStr = stableChannelDict.get("version") or ""
@@ -152,6 +300,7 @@ class ChromeForTestingUserAgentWrapper(BasicRemoteProxy):
 				"patchVersions": sampledPatchVersionsList,
 			},
 			"userAgents": userAgentList,
+			"generatedFloat": time.time(),
 		}
 
 		outputFilePathStr = self._writeOutput(payloadDict)
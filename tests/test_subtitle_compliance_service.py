@@ -0,0 +1,55 @@
+from core.service.subtitle_compliance_service import SubtitleComplianceService
+from core.model.subtitle_frame_model import SubtitleFrameList
+
+
+def formatTimecodeStr(millisecondInt):
+    hourInt, remainderInt = divmod(millisecondInt, 3600000)
+    minuteInt, remainderInt = divmod(remainderInt, 60000)
+    secondInt, millisecondInt = divmod(remainderInt, 1000)
+    return f"{hourInt:02d}:{minuteInt:02d}:{secondInt:02d},{millisecondInt:03d}"
+
+
+def buildSrtTextStr():
+    bodyStrList = [
+        "What?",
+        "- Come on.\n- No, you come on.",
+        "I told you there were 3 of them and they were all waiting outside the door for us.",
+        "<i>If I</i>\n<i>was, you'd be naked.</i>",
+        "Okay.",
+        "This line is long enough to need wrapping but it should still fit into two lines.",
+        "A very long speech that keeps going well past what two subtitle lines can hold, so the engine has to split it into several timed segments.",
+    ]
+    frameStrList = []
+    startMsInt = 1000
+    for frameIndexInt in range(60):
+        bodyStr = bodyStrList[frameIndexInt % len(bodyStrList)]
+        endMsInt = startMsInt + 400 + (frameIndexInt * 337) % 4000
+        frameStrList.append(
+            f"{frameIndexInt + 1}\n{formatTimecodeStr(startMsInt)} --> {formatTimecodeStr(endMsInt)}\n{bodyStr}"
+        )
+        startMsInt = endMsInt + (frameIndexInt * 131) % 700 - 200
+    return "\n\n".join(frameStrList) + "\n"
+
+
+def testColumnarEngineMatchesSequentialEngine():
+    subtitleContentStr = buildSrtTextStr()
+    sequentialStr = SubtitleComplianceService(useColumnarEngineObj=False).applyComplianceToSrtText(subtitleContentStr)
+    columnarStr = SubtitleComplianceService(useColumnarEngineObj=True).applyComplianceToSrtText(subtitleContentStr)
+    assert sequentialStr
+    assert columnarStr == sequentialStr
+
+
+def testComplianceStreamMatchesSequentialEngine():
+    subtitleContentStr = buildSrtTextStr()
+    subtitleComplianceObj = SubtitleComplianceService(useColumnarEngineObj=False)
+    sequentialStr = subtitleComplianceObj.applyComplianceToSrtText(subtitleContentStr)
+
+    frameListObj = SubtitleFrameList.fromFramePartTupleIterable(
+        tuple(frameStr.split("\n", 2)) for frameStr in subtitleContentStr.strip().split("\n\n")
+    )
+    subtitleComplianceStreamObj = subtitleComplianceObj.openComplianceStream()
+    streamedStr = "".join(
+        subtitleComplianceStreamObj.pushFrame(frameObj.indexInt, frameObj.startMsInt, frameObj.endMsInt, frameObj.bodyStr)
+        for frameObj in frameListObj
+    )
+    assert streamedStr == sequentialStr
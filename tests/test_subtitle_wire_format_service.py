@@ -0,0 +1,28 @@
+from core.service.subtitle_wire_format_service import SubtitleWireFormatService
+
+
+def testWireChunkRoundTripKeepsFrameBodies():
+    subtitleWireFormatObj = SubtitleWireFormatService()
+    frameBodyDict = {1: "What?", 2: "- Come on.\n- No.", 3: "<i>Again</i>"}
+    wireChunkStr = subtitleWireFormatObj.buildWireChunkStr(frameBodyDict)
+    assert subtitleWireFormatObj.parseWireChunkDict(wireChunkStr) == frameBodyDict
+
+
+def testWireChunkRoundTripKeepsMarkerShapedBodyLine():
+    subtitleWireFormatObj = SubtitleWireFormatService()
+    frameBodyDict = {
+        1: "Trending now:\n#12",
+        2: "#3",
+        3: "\\#7\nbackslash kept",
+        4: "# 5 and more",
+        5: "Last frame",
+    }
+    wireChunkStr = subtitleWireFormatObj.buildWireChunkStr(frameBodyDict)
+    assert [matchObj.group(1) for matchObj in subtitleWireFormatObj.framePatternObj.finditer(wireChunkStr)] == ["1", "2", "3", "4", "5"]
+    assert subtitleWireFormatObj.parseWireChunkDict(wireChunkStr) == frameBodyDict
+
+
+def testParseWireChunkKeepsFirstBodyForDuplicateKey():
+    subtitleWireFormatObj = SubtitleWireFormatService()
+    wireChunkStr = "#1\nfirst\n\n#1\nsecond\n\n#2\nother\n\n"
+    assert subtitleWireFormatObj.parseWireChunkDict(wireChunkStr) == {1: "first", 2: "other"}
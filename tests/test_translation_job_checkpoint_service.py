@@ -0,0 +1,49 @@
+from core.service.translation_job_checkpoint_service import TranslationJobCheckpointService
+
+
+def buildCheckpointObj(tmp_path, sourceFilePathObj):
+    return TranslationJobCheckpointService(str(sourceFilePathObj), "en", "sq", str(tmp_path / "jobs"))
+
+
+def testCheckpointResumesCompletedChunks(tmp_path):
+    sourceFilePathObj = tmp_path / "episode.srt"
+    sourceFilePathObj.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8")
+
+    checkpointObj = buildCheckpointObj(tmp_path, sourceFilePathObj)
+    assert checkpointObj.load() == {}
+    checkpointObj.recordChunk(0, {"Hello": "Përshëndetje"})
+    checkpointObj.recordChunk(1, None)
+    checkpointObj.recordChunk(2, {"Bye": "Mirupafshim"})
+    checkpointObj.close()
+
+    resumedCheckpointObj = buildCheckpointObj(tmp_path, sourceFilePathObj)
+    assert resumedCheckpointObj.load() == {"Hello": "Përshëndetje", "Bye": "Mirupafshim"}
+    resumedCheckpointObj.recordChunk(3, {"Again": "Përsëri"})
+    resumedCheckpointObj.close()
+    assert buildCheckpointObj(tmp_path, sourceFilePathObj).load() == {
+        "Hello": "Përshëndetje",
+        "Bye": "Mirupafshim",
+        "Again": "Përsëri",
+    }
+
+
+def testCheckpointDiscardsJournalOfChangedSource(tmp_path):
+    sourceFilePathObj = tmp_path / "episode.srt"
+    sourceFilePathObj.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8")
+    checkpointObj = buildCheckpointObj(tmp_path, sourceFilePathObj)
+    checkpointObj.recordChunk(0, {"Hello": "Përshëndetje"})
+    checkpointObj.close()
+
+    sourceFilePathObj.write_text("1\n00:00:01,000 --> 00:00:02,000\nGoodbye\n", encoding="utf-8")
+    changedCheckpointObj = buildCheckpointObj(tmp_path, sourceFilePathObj)
+    assert changedCheckpointObj.load() == {}
+
+
+def testCompleteRemovesJournal(tmp_path):
+    sourceFilePathObj = tmp_path / "episode.srt"
+    sourceFilePathObj.write_text("1\n00:00:01,000 --> 00:00:02,000\nHello\n", encoding="utf-8")
+    checkpointObj = buildCheckpointObj(tmp_path, sourceFilePathObj)
+    checkpointObj.recordChunk(0, {"Hello": "Përshëndetje"})
+    checkpointObj.complete()
+    assert not checkpointObj.journalPathObj.exists()
+    assert buildCheckpointObj(tmp_path, sourceFilePathObj).load() == {}
@@ -0,0 +1,42 @@
+from core.service.translation_memory_service import TranslationMemoryService
+
+
+def buildMemoryObj(tmp_path, maxEntryCountInt=3):
+    return TranslationMemoryService("en", "sq", str(tmp_path / "memory.sqlite3"), maxEntryCountInt)
+
+
+def testTranslationMemoryEvictsLeastRecentlyUsed(tmp_path):
+    translationMemoryObj = buildMemoryObj(tmp_path)
+    translationMemoryObj.putTranslatedTextDict({"one": "një"})
+    translationMemoryObj.putTranslatedTextDict({"two": "dy"})
+    translationMemoryObj.putTranslatedTextDict({"three": "tre"})
+    assert translationMemoryObj.getTranslatedTextDict(["one"]) == {"one": "një"}
+
+    translationMemoryObj.putTranslatedTextDict({"four": "katër"})
+    assert translationMemoryObj.entryCountInt == 3
+    assert translationMemoryObj.getTranslatedTextDict(["one", "two", "three", "four"]) == {
+        "one": "një",
+        "three": "tre",
+        "four": "katër",
+    }
+    translationMemoryObj.close()
+
+
+def testTranslationMemoryUpdateKeepsEntryCount(tmp_path):
+    translationMemoryObj = buildMemoryObj(tmp_path)
+    translationMemoryObj.putTranslatedTextDict({"one": "një", "two": "dy"})
+    translationMemoryObj.putTranslatedTextDict({"one": "NJË"})
+    assert translationMemoryObj.entryCountInt == 2
+    assert translationMemoryObj.getTranslatedTextStr("one") == "NJË"
+    translationMemoryObj.close()
+
+    reopenedMemoryObj = buildMemoryObj(tmp_path)
+    assert reopenedMemoryObj.entryCountInt == 2
+    reopenedMemoryObj.putTranslatedTextDict({"three": "tre", "four": "katër"})
+    assert reopenedMemoryObj.entryCountInt == 3
+    assert reopenedMemoryObj.getTranslatedTextDict(["one", "two", "three", "four"]) == {
+        "one": "NJË",
+        "three": "tre",
+        "four": "katër",
+    }
+    reopenedMemoryObj.close()